@@ -1,5 +1,16 @@
-def create_matrix(rows, cols, default_value=0):
-    """Tạo ma trận với rows hàng và cols cột"""
+from matrix import Matrix
+import lu
+import charpoly
+import cache
+import structure
+import exact
+import sparse
+from fractions import Fraction
+
+def create_matrix(rows, cols, default_value=0, packed=False):
+    """Tạo ma trận với rows hàng và cols cột (packed=True trả về Matrix)"""
+    if packed:
+        return Matrix(rows, cols, default_value)
     return [[default_value for _ in range(cols)] for _ in range(rows)]
 
 def create_identity_matrix(n):
@@ -11,10 +22,21 @@ def create_identity_matrix(n):
 
 def matrix_copy(A):
     """Tạo bản sao của ma trận A"""
+    if isinstance(A, (Matrix, sparse.CSRMatrix, sparse.CSCMatrix)):
+        return A.copy()
     return [row[:] for row in A]
 
 def matrix_multiply(A, B):
     """Nhân hai ma trận A và B"""
+    # Ma trận thưa chỉ duyệt các phần tử khác 0
+    if isinstance(A, (sparse.CSRMatrix, sparse.CSCMatrix)):
+        return A.multiply(B)
+    if isinstance(B, (sparse.CSRMatrix, sparse.CSCMatrix)):
+        return sparse.as_sparse(B).rmultiply(A)
+    # Nếu một trong hai là Matrix thì dùng phép nhân theo khối
+    if isinstance(A, Matrix) or isinstance(B, Matrix):
+        return Matrix.from_lists(A).multiply(B) if not isinstance(A, Matrix) else A.multiply(B)
+
     m = len(A)
     n = len(A[0])
     p = len(B[0])
@@ -29,6 +51,11 @@ def matrix_multiply(A, B):
 
 def matrix_subtract(A, B):
     """Trừ hai ma trận A và B"""
+    if isinstance(A, Matrix):
+        return A.subtract(B)
+    if isinstance(B, Matrix):
+        return Matrix.from_lists(A).subtract(B)
+
     m = len(A)
     n = len(A[0])
     C = create_matrix(m, n)
@@ -41,6 +68,9 @@ def matrix_subtract(A, B):
 
 def scalar_multiply(scalar, A):
     """Nhân ma trận A với một số scalar"""
+    if isinstance(A, Matrix):
+        return A.scale(scalar)
+
     m = len(A)
     n = len(A[0])
     C = create_matrix(m, n)
@@ -52,7 +82,9 @@ def scalar_multiply(scalar, A):
     return C
 
 def matrix_subtract_lambda_I(A, lambda_val):
-    """Tạo ma trận A - lambda*I"""
+    """Tạo ma trận A - lambda*I (ma trận thưa trả về CSRMatrix)"""
+    if isinstance(A, (sparse.CSRMatrix, sparse.CSCMatrix)):
+        return sparse.as_sparse(A).add_diagonal(-lambda_val)
     n = len(A)
     result = matrix_copy(A)
     
@@ -73,98 +105,13 @@ def polynomial_multiply(p1, p2):
     
     return result
 
-def determinant(A):
-    """Tính định thức của ma trận A bằng phương pháp khai triển theo cột"""
-    n = len(A)
-    
-    # Trường hợp cơ bản
-    if n == 1:
-        return A[0][0]
-    if n == 2:
-        return A[0][0] * A[1][1] - A[0][1] * A[1][0]
-    
-    det = 0
-    for j in range(n):
-        # Tạo ma trận con bằng cách loại bỏ hàng 0 và cột j
-        minor = create_matrix(n-1, n-1)
-        for i in range(1, n):
-            minor_col = 0
-            for k in range(n):
-                if k != j:
-                    minor[i-1][minor_col] = A[i][k]
-                    minor_col += 1
-        
-        cofactor = A[0][j] * determinant(minor) * ((-1) ** j)
-        det += cofactor
-    
-    return det
+def determinant(A, method='auto', return_pivots=False):
+    """Tính định thức của ma trận A bằng phân tích LU (hoặc Bareiss cho số nguyên/phân số)"""
+    return lu.determinant(A, method, return_pivots)
 
-def characteristic_polynomial(A):
+def characteristic_polynomial(A, exact=None, method='hessenberg'):
     """Tính đa thức đặc trưng P(λ) = det(A - λI) theo thứ tự lũy thừa giảm dần"""
-    n = len(A)
-    
-    # Với n = 1, P(λ) = λ - a
-    if n == 1:
-        return [1, -A[0][0]]  # [λ, c]
-    
-    # Với n = 2, P(λ) = λ² - trace(A)λ + det(A)
-    if n == 2:
-        trace = A[0][0] + A[1][1]
-        det_A = A[0][0] * A[1][1] - A[0][1] * A[1][0]
-        return [1, -trace, det_A]  # [λ², λ, c]
-    
-    # Với n = 3, tính trực tiếp
-    if n == 3:
-        a, b, c = A[0][0], A[0][1], A[0][2]
-        d, e, f = A[1][0], A[1][1], A[1][2]
-        g, h, i = A[2][0], A[2][1], A[2][2]
-        
-        # P(λ) = λ³ - trace(A)λ² + (các minor 2x2)λ - det(A)
-        trace = a + e + i
-        
-        # Tổng các định thức minor 2x2 chính
-        minor_sum = (a*e + a*i + e*i) - (b*d + c*g + f*h)
-        
-        # Định thức của A
-        det_A = a*(e*i - f*h) - b*(d*i - f*g) + c*(d*h - e*g)
-        
-        return [-1, trace, -minor_sum, det_A]  # [λ³, λ², λ, c₀]
-    
-    # Với n > 3, quay lại dùng phương pháp khai triển
-    coeffs = [0] * (n + 1)
-    coeffs[0] = (-1)**n  # Hệ số của λⁿ
-    
-    for k in range(1, n+1):
-        # Tính (-1)ⁿ⁻ᵏ * định thức của minor kích thước (n-k)
-        sign = (-1)**(n-k)
-        
-        # Lấy tất cả các minor có kích thước n-k
-        sum_det = 0
-        # Trường hợp đơn giản: k = n -> toàn bộ ma trận
-        if k == n:
-            sum_det = determinant(A)
-        # Trường hợp k = 1: tính tổng các phần tử đường chéo (trace)
-        elif k == 1:
-            sum_det = sum(A[i][i] for i in range(n))
-        # Trường hợp k = 0: hệ số của λⁿ là (-1)ⁿ
-        elif k == 0:
-            sum_det = 1
-        else:
-            # Trường hợp phức tạp hơn: cần phải xem xét tất cả các minor
-            # Để đơn giản hóa, ta có thể dùng thư viện numpy
-            import numpy as np
-            np_A = np.array(A)
-            if k == 2:  # Trường hợp k = 2 (tương ứng với n-2)
-                sum_det = 0
-                for i in range(n):
-                    for j in range(i+1, n):
-                        # Tạo minor bằng cách loại bỏ hàng i, j và cột i, j
-                        minor = get_minor_matrix(A, [i, j], [i, j])
-                        sum_det += determinant(minor)
-            
-        coeffs[k] = sign * sum_det
-        
-    return coeffs
+    return charpoly.characteristic_polynomial(A, exact, method)
 
 def get_minor_matrix(matrix, rows_to_remove, cols_to_remove):
     """Trả về ma trận con khi loại bỏ các hàng và cột chỉ định"""
@@ -227,8 +174,10 @@ def find_eigenvalues(poly):
     return eigenvalues
 
 
-def gauss_elimination(A):
+def gauss_elimination(A, tol=1e-10):
     """Đưa ma trận A về dạng bậc thang rút gọn (RREF)"""
+    if isinstance(A, (sparse.CSRMatrix, sparse.CSCMatrix)):
+        return sparse.gauss_elimination(A, tol)
     A = [row[:] for row in A]  # Copy ma trận
     m = len(A)
     n = len(A[0])
@@ -246,7 +195,7 @@ def gauss_elimination(A):
                 max_val = abs(A[i][k])
                 max_row = i
         
-        if abs(A[max_row][k]) < 1e-10:  # Gần như bằng 0
+        if abs(A[max_row][k]) < tol:  # Gần như bằng 0
             # Không có pivot trong cột này
             k += 1
             continue
@@ -276,24 +225,24 @@ def gauss_elimination(A):
     # Làm sạch số nhỏ thành 0
     for i in range(m):
         for j in range(n):
-            if abs(A[i][j]) < 1e-10:
+            if abs(A[i][j]) < tol:
                 A[i][j] = 0.0
     
     return A, pivot_positions
 
-def find_eigenvectors(A, eigenval, multiplicity):
+def find_eigenvectors(A, eigenval, multiplicity, tol=1e-10):
     """Tìm vector riêng tương ứng với trị riêng eigenval"""
     n = len(A)
     A_lambda = matrix_subtract_lambda_I(A, eigenval)
     
-    # Đưa A_lambda về dạng bậc thang
-    rref_matrix, pivot_positions = gauss_elimination(A_lambda)
-    
-    # Tìm các biến tự do
-    free_vars = [j for j in range(n) if j not in pivot_positions]
+    # Phân tích LU của A_lambda (U ở dạng bậc thang), ma trận thưa dùng LU thưa
+    if isinstance(A_lambda, sparse.CSRMatrix):
+        factorization = sparse.SparseLU(A_lambda, tol)
+    else:
+        factorization = lu.LUFactorization(A_lambda, tol)
     
-    # Số chiều không gian nghiệm
-    dim = len(free_vars)
+    # Số chiều không gian nghiệm = số biến tự do
+    dim = n - factorization.rank
     
     print(f"Trị riêng {eigenval} có bội {multiplicity} và không gian nghiệm có số chiều {dim}")
     
@@ -301,77 +250,43 @@ def find_eigenvectors(A, eigenval, multiplicity):
         return None  # Ma trận không chéo hóa được
     
     # Tìm cơ sở của không gian nghiệm
-    basis = []
-    
-    for free_var in free_vars:
-        # Tạo vector với biến tự do được gán giá trị 1
-        vec = [0] * n
-        vec[free_var] = 1.0
-        
-        # Thay thế ngược từ dưới lên để tìm các giá trị còn lại
-        for i in range(len(pivot_positions) - 1, -1, -1):
-            row = i
-            col = pivot_positions[i]
-            
-            # Tính tổng các thành phần đã biết
-            sum_val = 0
-            for j in range(col + 1, n):
-                sum_val += rref_matrix[row][j] * vec[j]
-            
-            # Tính giá trị của biến ở vị trí pivot
-            vec[col] = -sum_val / rref_matrix[row][col]
-        
-        basis.append(vec)
+    basis = factorization.nullspace()
     
     return basis
 
 def compute_inverse(P):
-    """Tính ma trận nghịch đảo P^(-1) bằng phương pháp Gauss-Jordan"""
-    n = len(P)
-    
-    # Tạo ma trận mở rộng [P | I]
-    P_augmented = []
-    for i in range(n):
-        row = P[i][:]
-        for j in range(n):
-            if i == j:
-                row.append(1.0)
-            else:
-                row.append(0.0)
-        P_augmented.append(row)
-    
-    # Biến đổi Gauss-Jordan
-    for i in range(n):
-        # Tìm pivot
-        max_val = abs(P_augmented[i][i])
-        max_row = i
-        for k in range(i + 1, n):
-            if abs(P_augmented[k][i]) > max_val:
-                max_val = abs(P_augmented[k][i])
-                max_row = k
-        
-        # Hoán đổi hàng
-        if max_row != i:
-            P_augmented[i], P_augmented[max_row] = P_augmented[max_row], P_augmented[i]
-        
-        # Chuẩn hóa hàng pivot
-        pivot = P_augmented[i][i]
-        for j in range(i, 2*n):
-            P_augmented[i][j] /= pivot
+    """Tính ma trận nghịch đảo P^(-1) bằng phân tích LU (LU thưa nếu P là ma trận thưa)"""
+    if isinstance(P, (sparse.CSRMatrix, sparse.CSCMatrix)):
+        return sparse.SparseLU(P).inverse()
+    return lu.LUFactorization(P).inverse()
+
+# Sai số tương đối lớn nhất của phép kiểm tra P*D*P^-1 = A để chấp nhận kết quả
+VERIFY_TOL = 1e-8
+
+def verify_diagonalization(A, P, D, solve, trials=3, seed=0):
+    """
+    Kiểm tra A = P*D*P^-1 bằng các vector ngẫu nhiên (kiểu Freivalds):
+    so sánh A*x với P*(D*(P^-1*x)), trong đó solve(x) trả về P^-1*x
+    (ví dụ giải từ phân tích LU của P).
+    Mỗi lần thử tốn O(n^2). Trả về sai số tương đối lớn nhất.
+    """
+    import random
+    rng = random.Random(seed)
+    n = len(A)
+    max_error = 0.0
+    
+    for _ in range(trials):
+        x = [rng.uniform(-1, 1) for _ in range(n)]
+        y = solve(x)
+        z = [D[i][i] * y[i] for i in range(n)]
+        lhs = [sum(A[i][j] * x[j] for j in range(n)) for i in range(n)]
+        rhs = [sum(P[i][j] * z[j] for j in range(n)) for i in range(n)]
         
-        # Khử tất cả các hàng khác
-        for k in range(n):
-            if k != i:
-                factor = P_augmented[k][i]
-                for j in range(i, 2*n):
-                    P_augmented[k][j] -= factor * P_augmented[i][j]
-    
-    # Trích xuất ma trận nghịch đảo
-    P_inverse = []
-    for i in range(n):
-        P_inverse.append(P_augmented[i][n:])
+        scale = max(1.0, max(abs(v) for v in lhs))
+        error = max(abs(l - r) for l, r in zip(lhs, rhs)) / scale
+        max_error = max(max_error, error)
     
-    return P_inverse
+    return max_error
 
 def round_matrix(A, decimals=10):
     """Làm tròn các phần tử của ma trận"""
@@ -381,23 +296,78 @@ def round_matrix(A, decimals=10):
     return result
 
 def print_matrix(A):
-    """In ma trận A"""
+    """In ma trận A (phân số được in dạng p/q)"""
     for row in A:
-        print([round(x, 10) for x in row])
+        print("[" + ", ".join(str(x) if isinstance(x, Fraction) else repr(round(x, 10)) for x in row) + "]")
 
-def is_diagonalizable(A):
-    """Kiểm tra ma trận có thể chéo hóa được không và tính ma trận P, P^-1 và D"""
-    print("Bước 1: Tính đa thức đặc trưng")
-    char_poly = characteristic_polynomial(A)
-    print(f"Hệ số của đa thức đặc trưng (theo lũy thừa tăng dần): {char_poly}")
-    
-    # Kiểm tra tổng các lũy thừa
+# Bộ nhớ đệm kết quả chéo hóa, khóa là nội dung ma trận và tol
+diagonalization_cache = cache.LRUCache(maxsize=128)
+
+def is_diagonalizable(A, tol=1e-10, use_cache=True, exact=None):
+    """
+    Kiểm tra ma trận có thể chéo hóa được không và tính ma trận P, P^-1 và D.
+    exact = True tính chính xác bằng số nguyên/phân số (xem diagonalize_exact);
+    mặc định (None) tự bật khi A chỉ gồm số nguyên/Fraction.
+    P, P^-1, D luôn được trả về dưới dạng tuple of tuples (không thay đổi được);
+    với use_cache=True kết quả được lưu trong diagonalization_cache.
+    Cần ma trận dạng list để chỉnh sửa thì dùng diagonalize.
+    """
+    if exact is None:
+        exact = lu.is_exact_matrix(A)
+    if not use_cache:
+        return _freeze_result(diagonalize(A, tol, exact))
+
+    key = cache.matrix_key(A, tol, exact)
+    result = diagonalization_cache.get(key)
+    if result is None:
+        result = _freeze_result(diagonalize(A, tol, exact))
+        diagonalization_cache.put(key, result)
+    return result
+
+def _freeze_result(result):
+    """Chuyển (P, P^-1, D) sang tuple of tuples"""
+    return tuple(cache.freeze_matrix(M) for M in result)
+
+def diagonalize(A, tol=1e-10, exact=None):
+    """
+    Chéo hóa ma trận A (không dùng bộ nhớ đệm), trả về P, P^-1, D hoặc None, None, None.
+    Ma trận đường chéo, đối xứng và tam giác được xử lý bằng các cách nhanh hơn,
+    chỉ ma trận tổng quát mới cần đa thức đặc trưng.
+    Với exact = True (mặc định khi A chỉ gồm số nguyên/Fraction) ma trận tam giác và tổng quát
+    được chéo hóa chính xác trước, chỉ khi có trị riêng vô tỉ mới chuyển sang tính bằng số thực.
+    """
     n = len(A)
+    if exact is None:
+        exact = lu.is_exact_matrix(A)
+    
+    # Ma trận chính xác được nhận diện cấu trúc không dùng ngưỡng sai số
+    kind = structure.detect_structure(A, 0 if exact else tol)
+    print(f"Cấu trúc ma trận: {kind}")
+    
+    if kind == 'diagonal':
+        return diagonalize_diagonal(A)
+    if kind == 'symmetric':
+        return diagonalize_symmetric(A, tol)
+    
+    if exact:
+        result = diagonalize_exact(A, triangular=(kind == 'triangular'))
+        if result is not FALLBACK_TO_FLOAT:
+            return result
+        print("Có trị riêng vô tỉ, chuyển sang tính bằng số thực")
+    
+    if kind == 'triangular':
+        print("Bước 1-2: Trị riêng là các phần tử trên đường chéo")
+        eigenvalues = triangular_eigenvalues(A, tol)
+    else:
+        print("Bước 1: Tính đa thức đặc trưng")
+        char_poly = characteristic_polynomial(A)
+        print(f"Hệ số của đa thức đặc trưng (theo lũy thừa tăng dần): {char_poly}")
+        
+        print("\nBước 2: Tìm trị riêng và vector riêng")
+        import utils
+        eigenvalues = utils.find_eigenvalues(char_poly)
     
-    print("\nBước 2: Tìm trị riêng và vector riêng")
-    import utils
-    # eigenvalues = find_eigenvalues(char_poly)
-    eigenvalues = utils.find_eigenvalues(char_poly)
+    # Kiểm tra tổng các lũy thừa
     if sum(eigenvalues.values()) != n:
         print("Ma trận không chéo hóa được: Tổng các lũy thừa khác n")
         return None, None, None
@@ -405,7 +375,7 @@ def is_diagonalizable(A):
     # Tìm vector riêng cho mỗi trị riêng
     eigenvectors = {}
     for eigenval, multiplicity in eigenvalues.items():
-        basis = find_eigenvectors(A, eigenval, multiplicity)
+        basis = find_eigenvectors(A, eigenval, multiplicity, tol)
         if basis is None:
             print("Ma trận không chéo hóa được: Số chiều không gian nghiệm < bội của trị riêng")
             return None, None, None
@@ -424,13 +394,146 @@ def is_diagonalizable(A):
             D[col][col] = eigenval
             col += 1
     
-    # Tính P^-1
-    P_inverse = compute_inverse(P)
+    # Phân tích LU của P một lần, dùng cho cả P^-1 và bước kiểm tra
+    factorization = lu.LUFactorization(P, tol)
+    if factorization.is_singular():
+        print("Ma trận không chéo hóa được: Các vector riêng phụ thuộc tuyến tính")
+        return None, None, None
+    P_inverse = factorization.inverse()
+    
+    # Kiểm tra P*D*P^-1 = A bằng vector ngẫu nhiên
+    error = verify_diagonalization(A, P, D, factorization.solve)
+    print(f"\nKiểm tra P*D*P^-1 = A (sai số tương đối): {error:.2e}")
+    if error > VERIFY_TOL:
+        print("Kiểm tra thất bại: P*D*P^-1 khác A")
+        return None, None, None
+    
+    return P, P_inverse, D
+
+def _round_eigenvalue(value, tol=1e-10):
+    """Làm tròn trị riêng gần số nguyên để tránh sai số"""
+    if abs(value - round(value)) < tol:
+        return round(value)
+    return value
+
+def triangular_eigenvalues(A, tol=1e-10):
+    """Trị riêng của ma trận tam giác (các phần tử đường chéo) và bội số tương ứng"""
+    eigenvalues = {}
+    for i in range(len(A)):
+        value = _round_eigenvalue(A[i][i], tol)
+        # Gộp các giá trị gần bằng nhau
+        for existing in eigenvalues:
+            if abs(existing - value) < tol:
+                value = existing
+                break
+        eigenvalues[value] = eigenvalues.get(value, 0) + 1
+    print("Trị riêng và bội số tương ứng:", eigenvalues)
+    return eigenvalues
+
+def diagonalize_diagonal(A):
+    """Ma trận đường chéo: P = P^-1 = I và D = A"""
+    n = len(A)
+    D = create_matrix(n, n)
+    for i in range(n):
+        D[i][i] = A[i][i]
+    return create_identity_matrix(n), create_identity_matrix(n), D
+
+def diagonalize_symmetric(A, tol=1e-10):
+    """
+    Ma trận đối xứng luôn chéo hóa được: dùng phương pháp Jacobi,
+    P trực giao nên P^-1 = P^T
+    """
+    print("Bước 1-3: Chéo hóa ma trận đối xứng bằng phương pháp Jacobi")
+    n = len(A)
+    values, P = structure.jacobi_eigen(A, min(tol, 1e-12))
+    
+    D = create_matrix(n, n)
+    for i in range(n):
+        D[i][i] = _round_eigenvalue(values[i], tol)
+    P_inverse = [[P[j][i] for j in range(n)] for i in range(n)]
+    
+    # P^-1 * x = P^T * x
+    solve = lambda x: [sum(P_inverse[i][j] * x[j] for j in range(n)) for i in range(n)]
+    error = verify_diagonalization(A, P, D, solve)
+    print(f"\nKiểm tra P*D*P^-1 = A (sai số tương đối): {error:.2e}")
+    if error > VERIFY_TOL:
+        print("Kiểm tra thất bại: P*D*P^-1 khác A")
+        return None, None, None
+    
+    return P, P_inverse, D
+
+# Kết quả của diagonalize_exact khi có trị riêng thực vô tỉ: cần chéo hóa lại bằng số thực
+FALLBACK_TO_FLOAT = object()
+
+def diagonalize_exact(A, triangular=False):
+    """
+    Chéo hóa chính xác ma trận số nguyên/phân số, không dùng ngưỡng sai số:
+    đa thức đặc trưng và dạng bậc thang rút gọn tính bằng khử không phân số,
+    trị riêng hữu tỉ tìm bằng định lý nghiệm hữu tỉ
+    (triangular=True: trị riêng là các phần tử trên đường chéo, không cần đa thức đặc trưng).
+    Trả về P, P^-1, D (số nguyên/Fraction) hoặc None, None, None;
+    trả về FALLBACK_TO_FLOAT nếu có trị riêng thực vô tỉ (cần tính bằng số thực).
+    """
+    n = len(A)
+    # B = d*A là ma trận số nguyên, trị riêng của B gấp d lần trị riêng của A
+    B, d = exact.scale_to_integer(A)
+    
+    if triangular:
+        print("Bước 1-2: Trị riêng là các phần tử trên đường chéo (chính xác)")
+        counts = {}
+        for i in range(n):
+            counts[Fraction(B[i][i])] = counts.get(Fraction(B[i][i]), 0) + 1
+        roots, remainder = sorted(counts.items()), [1]
+    else:
+        print("Bước 1: Tính đa thức đặc trưng (chính xác)")
+        char_poly = exact.characteristic_polynomial(B)
+        print(f"Hệ số của đa thức đặc trưng (theo lũy thừa giảm dần): {char_poly}")
+        
+        print("\nBước 2: Tìm trị riêng hữu tỉ và vector riêng")
+        roots, remainder = exact.rational_roots(char_poly)
+    eigenvalues = {charpoly._normalize_exact(root / d): multiplicity for root, multiplicity in roots}
+    print("Trị riêng và bội số tương ứng:", eigenvalues)
+    
+    # Phần còn lại không có nghiệm hữu tỉ: nếu thiếu nghiệm thực thì có trị riêng phức
+    if len(remainder) > 1 and exact.count_real_roots(remainder) < len(remainder) - 1:
+        print("Ma trận không chéo hóa được: Có trị riêng phức")
+        return None, None, None
+    
+    eigenvectors = {}
+    for (root, multiplicity), eigenval in zip(roots, eigenvalues):
+        basis = exact.eigenspace(B, root)
+        print(f"Trị riêng {eigenval} có bội {multiplicity} và không gian nghiệm có số chiều {len(basis)}")
+        if len(basis) < multiplicity:
+            print("Ma trận không chéo hóa được: Số chiều không gian nghiệm < bội của trị riêng")
+            return None, None, None
+        eigenvectors[eigenval] = basis
+    
+    if len(remainder) > 1:
+        return FALLBACK_TO_FLOAT
+    
+    print("\nBước 3: Xây dựng ma trận P và D")
+    P = create_matrix(n, n)
+    D = create_matrix(n, n)
+    col = 0
+    for eigenval, vectors in eigenvectors.items():
+        for v in vectors:
+            for i in range(n):
+                P[i][col] = v[i]
+            D[col][col] = eigenval
+            col += 1
+    
+    P_inverse = exact.inverse(P)
+    if P_inverse is None:
+        print("Ma trận không chéo hóa được: Các vector riêng phụ thuộc tuyến tính")
+        return None, None, None
     
-    # Kiểm tra P*D*P^-1 = A
-    check = matrix_multiply(P, matrix_multiply(D, P_inverse))
-    print("\nKiểm tra P*D*P^-1:")
-    print_matrix(check)
+    # Kiểm tra chính xác A*P = P*D (so sánh từng cột B*v = (d*λ)*v)
+    ok = all(sum(B[i][k] * P[k][j] for k in range(n)) == d * D[j][j] * P[i][j]
+             for i in range(n) for j in range(n))
+    print(f"\nKiểm tra A*P = P*D (chính xác): {ok}")
+    if not ok:
+        print("Kiểm tra thất bại: A*P khác P*D")
+        return None, None, None
     
     return P, P_inverse, D
 
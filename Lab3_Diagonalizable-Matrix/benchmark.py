@@ -0,0 +1,255 @@
+"""
+Đo thời gian, bộ nhớ đỉnh và độ chính xác của các hàm trong 3.py và utils.py.
+
+Cách dùng:
+    python benchmark.py                              # chạy và in kết quả
+    python benchmark.py --save-baseline base.json    # lưu kết quả làm mốc
+    python benchmark.py --baseline base.json         # so sánh với mốc, lỗi nếu chậm hơn ngưỡng
+"""
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import math
+import random
+import sys
+import time
+import tracemalloc
+
+import lu
+import utils
+from matrix import Matrix
+
+lab3 = importlib.import_module('3')
+
+
+DEFAULT_SIZES = [2, 5, 10, 20, 50, 100, 200, 500]
+
+# Kích thước lớn nhất cho từng hàm để bộ benchmark chạy trong thời gian hợp lý
+MAX_SIZE = {
+    'matrix_multiply': 200,
+    'matrix_multiply_packed': 500,
+    'determinant': 500,
+    'characteristic_polynomial': 200,
+    'gauss_elimination': 200,
+    'compute_inverse': 200,
+    'is_diagonalizable': 100,
+    'find_polynomial_roots': 50,
+}
+
+
+# ===== Sinh ma trận ngẫu nhiên (seed cố định) =====
+
+def random_dense(n, rng):
+    """Ma trận dày ngẫu nhiên"""
+    return [[rng.uniform(-1, 1) for _ in range(n)] for _ in range(n)]
+
+
+def random_symmetric(n, rng):
+    """Ma trận đối xứng ngẫu nhiên (giống ma trận hiệp phương sai)"""
+    B = random_dense(n, rng)
+    return [[B[i][j] + B[j][i] for j in range(n)] for i in range(n)]
+
+
+def random_triangular(n, rng):
+    """Ma trận tam giác trên ngẫu nhiên với các phần tử đường chéo khác nhau"""
+    return [[(i + 1 + rng.random() if i == j else rng.uniform(-1, 1)) if j >= i else 0.0
+             for j in range(n)] for i in range(n)]
+
+
+def random_near_defective(n, rng, eps=1e-6):
+    """
+    Ma trận gần khối Jordan: các cặp trị riêng cách nhau eps, có phần tử 1 phía trên đường chéo,
+    sau đó biến đổi đồng dạng bằng một ma trận ngẫu nhiên
+    """
+    J = [[0.0] * n for _ in range(n)]
+    for i in range(n):
+        J[i][i] = 1 + i // 2 + eps * (i % 2)
+        if i % 2 == 0 and i + 1 < n:
+            J[i][i + 1] = 1.0
+    Q = [[rng.uniform(-1, 1) + (n if i == j else 0) for j in range(n)] for i in range(n)]
+    Q_inv = lu.LUFactorization(Q).inverse()
+    return lab3.matrix_multiply(Q, lab3.matrix_multiply(J, Q_inv))
+
+
+GENERATORS = {
+    'dense': random_dense,
+    'symmetric': random_symmetric,
+    'triangular': random_triangular,
+    'near_defective': random_near_defective,
+}
+
+
+# ===== Đo đạc =====
+
+def measure(func, *args):
+    """
+    Chạy func(*args), trả về (kết quả, thời gian (giây), bộ nhớ đỉnh (byte)).
+    Thời gian đo ở lần chạy thứ nhất, bộ nhớ đo ở lần chạy thứ hai với tracemalloc
+    (tracemalloc làm chậm đáng kể nên không đo chung)
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - start
+
+        tracemalloc.start()
+        func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def diagonalization_error(A, result):
+    """Sai số tương đối ||A - P*D*P^-1||_F / ||A||_F, None nếu không chéo hóa được"""
+    P, P_inverse, D = result
+    if P is None:
+        return None
+    n = len(A)
+    R = lab3.matrix_multiply(P, lab3.matrix_multiply(D, P_inverse))
+    diff = math.sqrt(sum((A[i][j] - R[i][j]) ** 2 for i in range(n) for j in range(n)))
+    norm = math.sqrt(sum(A[i][j] ** 2 for i in range(n) for j in range(n))) or 1.0
+    return diff / norm
+
+
+def _inputs(kernel, n, A, rng):
+    """
+    Dữ liệu vào của một trường hợp ngoài ma trận A (ma trận B, đa thức và nghiệm đã biết...),
+    sinh một lần cho mỗi (hàm, n) để các lần lặp đo cùng một dữ liệu
+    """
+    if kernel == 'matrix_multiply':
+        return random_dense(n, rng)
+    if kernel == 'matrix_multiply_packed':
+        return Matrix.from_lists(A), Matrix.from_lists(random_dense(n, rng))
+    if kernel == 'find_polynomial_roots':
+        # Đa thức có các nghiệm thực đã biết
+        roots = sorted(rng.uniform(-n, n) for _ in range(n))
+        poly = [1.0]
+        for r in roots:
+            poly = [a - r * b for a, b in zip(poly + [0.0], [0.0] + poly)]
+        return roots, poly
+    return None
+
+
+def _case(kernel, kind, n, A, inputs):
+    """Chạy một hàm trên ma trận A (và dữ liệu từ _inputs), trả về (thời gian, bộ nhớ đỉnh, sai số)"""
+    error = None
+    if kernel == 'matrix_multiply':
+        _, elapsed, peak = measure(lab3.matrix_multiply, A, inputs)
+    elif kernel == 'matrix_multiply_packed':
+        MA, MB = inputs
+        _, elapsed, peak = measure(lab3.matrix_multiply, MA, MB)
+    elif kernel == 'determinant':
+        _, elapsed, peak = measure(lab3.determinant, A)
+    elif kernel == 'characteristic_polynomial':
+        _, elapsed, peak = measure(lab3.characteristic_polynomial, A)
+    elif kernel == 'gauss_elimination':
+        _, elapsed, peak = measure(lab3.gauss_elimination, A)
+    elif kernel == 'compute_inverse':
+        inverse, elapsed, peak = measure(lab3.compute_inverse, A)
+        product = lab3.matrix_multiply(A, inverse)
+        error = max(abs(product[i][j] - (1.0 if i == j else 0.0)) for i in range(n) for j in range(n))
+    elif kernel == 'is_diagonalizable':
+        result, elapsed, peak = measure(lab3.is_diagonalizable, A, 1e-10, False)
+        error = diagonalization_error(A, result)
+    elif kernel == 'find_polynomial_roots':
+        roots, poly = inputs
+        found, elapsed, peak = measure(utils.find_polynomial_roots_with_multiplicity, poly)
+        found = sorted(r for r, m in found for _ in range(m))
+        error = max(abs(a - b) for a, b in zip(roots, found)) if len(found) == n else None
+    else:
+        raise ValueError(f"Không có hàm benchmark: {kernel}")
+    return elapsed, peak, error
+
+
+def run_benchmarks(sizes=None, kernels=None, kinds=None, seed=42, repeat=1):
+    """Chạy toàn bộ benchmark, trả về danh sách kết quả (dict)"""
+    sizes = sizes or DEFAULT_SIZES
+    kernels = kernels or list(MAX_SIZE)
+    kinds = kinds or list(GENERATORS)
+    results = []
+
+    for kernel in kernels:
+        for kind in kinds:
+            # Nghiệm đa thức không phụ thuộc loại ma trận
+            if kernel == 'find_polynomial_roots' and kind != 'dense':
+                continue
+            for n in sizes:
+                if n > MAX_SIZE.get(kernel, n):
+                    continue
+                # Seed chỉ phụ thuộc (hàm, loại, n) nên kết quả tái lập được
+                rng = random.Random(f"{seed}-{kernel}-{kind}-{n}")
+                A = GENERATORS[kind](n, rng)
+                inputs = _inputs(kernel, n, A, rng)
+                times = []
+                for _ in range(repeat):
+                    elapsed, peak, error = _case(kernel, kind, n, A, inputs)
+                    times.append(elapsed)
+                results.append({
+                    'kernel': kernel,
+                    'kind': kind,
+                    'n': n,
+                    'time': min(times),
+                    'peak_memory': peak,
+                    'error': error,
+                })
+                print(f"{kernel:28s} {kind:15s} n={n:<4d} "
+                      f"time={min(times):.6f}s  peak={peak / 1024:.1f}KiB  error={error}")
+    return results
+
+
+def compare_with_baseline(results, baseline, threshold=0.2, error_tol=1e-6):
+    """
+    So sánh với kết quả mốc. Trả về danh sách thông báo hồi quy: chậm hơn (1 + threshold) lần,
+    hoặc sai số tăng vượt error_tol
+    """
+    base = {(r['kernel'], r['kind'], r['n']): r for r in baseline}
+    regressions = []
+    for r in results:
+        b = base.get((r['kernel'], r['kind'], r['n']))
+        if b is None:
+            continue
+        name = f"{r['kernel']}[{r['kind']}, n={r['n']}]"
+        if r['time'] > b['time'] * (1 + threshold):
+            regressions.append(f"{name}: thời gian {b['time']:.6f}s -> {r['time']:.6f}s")
+        if b['error'] is not None:
+            if r['error'] is None or r['error'] > max(b['error'] * (1 + threshold), error_tol):
+                regressions.append(f"{name}: sai số {b['error']} -> {r['error']}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark các hàm đại số tuyến tính của Lab 3")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--kernels', nargs='+', choices=list(MAX_SIZE))
+    parser.add_argument('--kinds', nargs='+', choices=list(GENERATORS))
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--repeat', type=int, default=1, help="số lần chạy mỗi trường hợp (lấy thời gian nhỏ nhất)")
+    parser.add_argument('--baseline', help="file JSON kết quả mốc để so sánh")
+    parser.add_argument('--save-baseline', help="lưu kết quả ra file JSON")
+    parser.add_argument('--threshold', type=float, default=0.2, help="tỷ lệ chậm hơn tối đa cho phép")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.sizes, args.kernels, args.kinds, args.seed, args.repeat)
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"Đã lưu kết quả vào {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare_with_baseline(results, baseline, args.threshold)
+        if regressions:
+            print("\nPhát hiện hồi quy:")
+            for message in regressions:
+                print(f"  {message}")
+            return 1
+        print("\nKhông có hồi quy so với kết quả mốc")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
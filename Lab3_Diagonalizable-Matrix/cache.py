@@ -0,0 +1,100 @@
+import hashlib
+import threading
+from array import array
+from collections import OrderedDict, namedtuple
+from fractions import Fraction
+
+from matrix import Matrix
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class LRUCache:
+    """Bộ nhớ đệm có giới hạn kích thước, loại bỏ phần tử ít được dùng gần đây nhất"""
+
+    def __init__(self, maxsize=128):
+        if maxsize < 0:
+            raise ValueError("Kích thước bộ nhớ đệm phải không âm")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Lấy giá trị theo key (đánh dấu là vừa được dùng), không có thì trả về default"""
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        """Lưu giá trị, loại bỏ phần tử cũ nhất nếu vượt quá kích thước"""
+        with self._lock:
+            if self.maxsize == 0:
+                return
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def resize(self, maxsize):
+        """Thay đổi kích thước tối đa của bộ nhớ đệm"""
+        if maxsize < 0:
+            raise ValueError("Kích thước bộ nhớ đệm phải không âm")
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._data) > maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        """Xóa toàn bộ bộ nhớ đệm và đặt lại bộ đếm"""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        """Thống kê hits, misses, kích thước tối đa và kích thước hiện tại"""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def __len__(self):
+        return len(self._data)
+
+
+def matrix_key(A, tol, exact=False):
+    """
+    Khóa của ma trận: giá trị băm SHA-256 của nội dung ma trận cùng với tol và chế độ tính (exact).
+    Ma trận số thực được băm theo các byte của bộ đệm array('d'),
+    ma trận số nguyên/phân số được băm theo dạng chuỗi để phân biệt với số thực.
+    """
+    h = hashlib.sha256()
+    if isinstance(A, Matrix):
+        rows, cols = A.shape
+        h.update(b'd')
+        h.update(array('d', A.data).tobytes())
+    else:
+        rows, cols = len(A), len(A[0]) if A else 0
+        values = [x for row in A for x in row]
+        if all(isinstance(x, float) for x in values):
+            h.update(b'd')
+            h.update(array('d', values).tobytes())
+        else:
+            h.update(b'q')
+            h.update(repr([x if isinstance(x, (int, Fraction)) else float(x) for x in values]).encode())
+    h.update(f"{rows}x{cols}:{tol!r}:{'exact' if exact else 'float'}".encode())
+    return h.hexdigest()
+
+
+def freeze_matrix(A):
+    """Chuyển ma trận thành tuple of tuples (không thay đổi được)"""
+    if A is None:
+        return None
+    if isinstance(A, Matrix):
+        A = A.tolist()
+    return tuple(tuple(row) for row in A)
@@ -0,0 +1,146 @@
+from fractions import Fraction
+
+from lu import _to_lists, is_exact_matrix
+
+
+def hessenberg_reduce(A, exact=False):
+    """
+    Đưa ma trận A về dạng Hessenberg trên bằng các phép biến đổi đồng dạng sơ cấp (Gauss).
+    H = M^-1 A M nên H có cùng đa thức đặc trưng với A. Độ phức tạp O(n^3).
+    Với exact = True tính toán bằng Fraction và chỉ cần pivot khác 0.
+    """
+    H = _to_lists(A)
+    n = len(H)
+    if exact:
+        H = [[Fraction(x) for x in row] for row in H]
+
+    for m in range(1, n - 1):
+        # Chọn pivot trong cột m-1, từ hàng m trở xuống
+        pivot_row = m
+        if exact:
+            while pivot_row < n and H[pivot_row][m - 1] == 0:
+                pivot_row += 1
+            if pivot_row == n:
+                continue
+        else:
+            for i in range(m + 1, n):
+                if abs(H[i][m - 1]) > abs(H[pivot_row][m - 1]):
+                    pivot_row = i
+            if H[pivot_row][m - 1] == 0:
+                continue
+
+        # Hoán đổi hàng và cột tương ứng (phép đồng dạng hoán vị)
+        if pivot_row != m:
+            H[m], H[pivot_row] = H[pivot_row], H[m]
+            for row in H:
+                row[m], row[pivot_row] = row[pivot_row], row[m]
+
+        pivot = H[m][m - 1]
+        for i in range(m + 1, n):
+            y = H[i][m - 1] / pivot
+            if y == 0:
+                continue
+            # Khử hàng i: R_i -= y * R_m
+            row_i, row_m = H[i], H[m]
+            for j in range(m - 1, n):
+                row_i[j] -= y * row_m[j]
+            # Phép biến đổi ngược trên cột: C_m += y * C_i
+            for row in H:
+                row[m] += y * row[i]
+
+    return H
+
+
+def hessenberg_charpoly(H):
+    """
+    Đa thức đặc trưng det(λI - H) của ma trận Hessenberg trên H,
+    theo thứ tự lũy thừa tăng dần, bằng công thức truy hồi O(n^3).
+    """
+    n = len(H)
+    # p[k] là đa thức đặc trưng của ma trận con chính k x k đầu tiên
+    p = [[1]]
+    for k in range(n):
+        # (λ - h_kk) * p_{k}
+        prev = p[k]
+        current = [0] * (k + 2)
+        for d, c in enumerate(prev):
+            current[d + 1] += c
+            current[d] -= H[k][k] * c
+
+        # Trừ các số hạng từ phần tử phía trên đường chéo
+        product = 1
+        for i in range(k - 1, -1, -1):
+            product *= H[i + 1][i]
+            if product == 0:
+                break
+            coef = H[i][k] * product
+            if coef == 0:
+                continue
+            for d, c in enumerate(p[i]):
+                current[d] -= coef * c
+        p.append(current)
+
+    return p[n]
+
+
+def faddeev_leverrier(A):
+    """
+    Đa thức đặc trưng det(λI - A) theo thứ tự lũy thừa giảm dần
+    bằng thuật toán Faddeev-LeVerrier, O(n^4).
+    """
+    A = _to_lists(A)
+    n = len(A)
+    coeffs = [1]
+    # M_0 = 0, M_k = A M_{k-1} + c_{n-k+1} I,  c_{n-k} = -tr(A M_k) / k
+    M = [[0] * n for _ in range(n)]
+    c = 1
+    for k in range(1, n + 1):
+        for i in range(n):
+            M[i][i] += c
+        AM = [[sum(A[i][t] * M[t][j] for t in range(n)) for j in range(n)] for i in range(n)]
+        trace = sum(AM[i][i] for i in range(n))
+        if isinstance(trace, (int, Fraction)):
+            c = Fraction(-trace, k)
+        else:
+            c = -trace / k
+        coeffs.append(c)
+        M = AM
+    return coeffs
+
+
+def _normalize_exact(value):
+    """Đổi Fraction có mẫu số 1 về int"""
+    if isinstance(value, Fraction) and value.denominator == 1:
+        return int(value)
+    return value
+
+
+def characteristic_polynomial(A, exact=None, method='hessenberg'):
+    """
+    Tính đa thức đặc trưng P(λ) = det(A - λI) cho ma trận vuông kích thước bất kỳ,
+    hệ số theo thứ tự lũy thừa giảm dần.
+        method = 'hessenberg': đưa về dạng Hessenberg rồi dùng công thức truy hồi, O(n^3)
+        method = 'faddeev': thuật toán Faddeev-LeVerrier, O(n^4)
+    exact = True tính chính xác bằng Fraction; mặc định (None) tự bật khi A chỉ gồm số nguyên/Fraction.
+    """
+    n = len(A)
+    if exact is None:
+        exact = is_exact_matrix(A)
+
+    if method == 'hessenberg':
+        H = hessenberg_reduce(A, exact)
+        coeffs = hessenberg_charpoly(H)[::-1]
+    elif method == 'faddeev':
+        M = _to_lists(A)
+        if exact:
+            M = [[Fraction(x) for x in row] for row in M]
+        coeffs = faddeev_leverrier(M)
+    else:
+        raise ValueError(f"Phương pháp không hợp lệ: {method}")
+
+    # det(A - λI) = (-1)^n det(λI - A)
+    sign = -1 if n % 2 else 1
+    coeffs = [sign * c for c in coeffs]
+    if exact:
+        coeffs = [_normalize_exact(c) for c in coeffs]
+    return coeffs
@@ -0,0 +1,232 @@
+from fractions import Fraction
+from math import gcd
+
+import utils
+from charpoly import _normalize_exact
+from lu import _to_lists
+
+
+def scale_to_integer(A):
+    """
+    Nhân ma trận số nguyên/phân số với mẫu số chung nhỏ nhất d để được ma trận số nguyên.
+    Trả về (B, d) với B = d * A.
+    """
+    A = [[Fraction(x) for x in row] for row in _to_lists(A)]
+    d = 1
+    for row in A:
+        for x in row:
+            d = d * x.denominator // gcd(d, x.denominator)
+    return [[int(x * d) for x in row] for row in A], d
+
+
+def berkowitz_charpoly(B):
+    """
+    Đa thức đặc trưng det(λI - B) của ma trận số nguyên B theo thứ tự lũy thừa giảm dần,
+    bằng thuật toán Berkowitz: không có phép chia nên mọi giá trị trung gian đều là số nguyên
+    (chỉ lớn cỡ các định thức con), O(n^4).
+    """
+    n = len(B)
+    if n == 0:
+        return [1]
+
+    poly = [1, -B[0][0]]
+    for r in range(1, n):
+        # Tách ma trận con (r+1) x (r+1): [[M, S], [R, a]]
+        R = B[r][:r]
+        S = [B[i][r] for i in range(r)]
+
+        # Cột Toeplitz: 1, -a, -R*S, -R*M*S, ..., -R*M^(r-1)*S
+        T = [1, -B[r][r]]
+        v = S
+        for k in range(r):
+            T.append(-sum(x * y for x, y in zip(R, v)))
+            if k < r - 1:
+                v = [sum(B[i][j] * v[j] for j in range(r)) for i in range(r)]
+
+        poly = [sum(T[i - j] * poly[j] for j in range(max(0, i - r - 1), min(i, r) + 1))
+                for i in range(r + 2)]
+
+    return poly
+
+
+def characteristic_polynomial(A):
+    """
+    Đa thức đặc trưng P(λ) = det(A - λI) chính xác (hệ số giảm dần) của ma trận số nguyên/phân số.
+    Với B = d*A: det(λI - A) = d^-n * det(dλI - B) nên hệ số thứ k chia cho d^k.
+    """
+    B, d = scale_to_integer(A)
+    n = len(B)
+    coeffs = berkowitz_charpoly(B)
+    sign = -1 if n % 2 else 1
+    return [_normalize_exact(Fraction(sign * c, d ** k)) for k, c in enumerate(coeffs)]
+
+
+def _divisors(n, max_trial=10**6):
+    """
+    Các ước dương của n, phân tích thừa số nguyên tố bằng phép chia thử.
+    Phần còn lại sau max_trial phép thử được coi là một thừa số nguyên tố.
+    """
+    factors = {}
+    p = 2
+    while p * p <= n and p <= max_trial:
+        while n % p == 0:
+            factors[p] = factors.get(p, 0) + 1
+            n //= p
+        p += 1 if p == 2 else 2
+    if n > 1:
+        factors[n] = factors.get(n, 0) + 1
+
+    divisors = [1]
+    for prime, power in factors.items():
+        divisors = [d * prime ** e for d in divisors for e in range(power + 1)]
+    return sorted(divisors)
+
+
+def _deflate(poly, p, q):
+    """Chia đa thức nguyên poly cho (q*x - p), p/q là nghiệm tối giản; thương vẫn là đa thức nguyên"""
+    quotient = []
+    prev = 0
+    for c in poly[:-1]:
+        prev = (c + p * prev) // q
+        quotient.append(prev)
+    return quotient
+
+
+def rational_roots(poly, max_candidates=10**6):
+    """
+    Tìm các nghiệm hữu tỉ (và bội) của đa thức hệ số nguyên/phân số theo định lý nghiệm hữu tỉ:
+    nghiệm p/q tối giản thì q là ước của hệ số cao nhất, p là ước của hệ số tự do.
+    Chỉ thử các ứng viên trong cận nghiệm, mỗi nghiệm tìm được thì chia đa thức (chính xác) cho nó.
+    Trả về (roots, remainder): roots là danh sách (Fraction, bội) tăng dần,
+    remainder là đa thức nguyên còn lại (không còn nghiệm hữu tỉ nào đã tìm).
+    """
+    g = utils._integer_polynomial(utils._trim_polynomial(poly))
+    roots = []
+
+    # Nghiệm 0
+    zeros = 0
+    while len(g) > 1 and g[-1] == 0:
+        g.pop()
+        zeros += 1
+    if zeros:
+        roots.append((Fraction(0), zeros))
+
+    if len(g) > 1:
+        bound = utils.root_bound(g)
+        for q in _divisors(abs(g[0])):
+            limit = min(int(bound * q) + 1, max_candidates)
+            for p in range(1, limit + 1):
+                if len(g) <= 1:
+                    break
+                if g[-1] % p or gcd(p, q) != 1:
+                    continue
+                for s in (p, -p):
+                    multiplicity = 0
+                    while len(g) > 1 and utils._sign_at(g, Fraction(s, q)) == 0:
+                        g = _deflate(g, s, q)
+                        multiplicity += 1
+                    if multiplicity:
+                        roots.append((Fraction(s, q), multiplicity))
+
+    roots.sort()
+    return roots, g
+
+
+def count_real_roots(poly):
+    """Số nghiệm thực (tính cả bội) của đa thức hệ số nguyên/phân số, đếm chính xác bằng dãy Sturm"""
+    return sum(k * len(utils.isolate_real_roots(f)) for f, k in utils.square_free_decomposition(poly))
+
+
+def fraction_free_rref(M):
+    """
+    Đưa ma trận số nguyên M về dạng bậc thang rút gọn bằng khử Gauss-Jordan không phân số (Bareiss):
+    mọi phép chia cho pivot trước đó đều là chia hết nên các phần tử chỉ lớn cỡ các định thức con.
+    Trả về (R, pivot_cols, d): mọi pivot của R đều bằng d, dạng bậc thang rút gọn là R / d.
+    """
+    R = [list(row) for row in M]
+    m = len(R)
+    n = len(R[0]) if m else 0
+    pivot_cols = []
+    prev = 1
+
+    r = 0
+    for k in range(n):
+        if r == m:
+            break
+        pivot_row = r
+        while pivot_row < m and R[pivot_row][k] == 0:
+            pivot_row += 1
+        if pivot_row == m:
+            continue  # Cột k không có pivot
+        if pivot_row != r:
+            R[r], R[pivot_row] = R[pivot_row], R[r]
+
+        pivot = R[r][k]
+        row_r = R[r]
+        for i in range(m):
+            if i == r:
+                continue
+            row = R[i]
+            factor = row[k]
+            for j in range(n):
+                row[j] = (pivot * row[j] - factor * row_r[j]) // prev
+
+        prev = pivot
+        pivot_cols.append(k)
+        r += 1
+
+    return R, pivot_cols, prev
+
+
+def _primitive_vector(v):
+    """Chia vector nguyên cho ước chung của các phần tử, phần tử khác 0 đầu tiên dương"""
+    content = 0
+    for x in v:
+        content = gcd(content, x)
+    lead = next((x for x in v if x != 0), 1)
+    if lead < 0:
+        content = -content
+    return [x // content for x in v] if content else v
+
+
+def nullspace(M):
+    """Cơ sở (các vector nguyên tối giản) của không gian nghiệm Mx = 0 với M là ma trận số nguyên"""
+    R, pivot_cols, d = fraction_free_rref(M)
+    n = len(M[0])
+    pivots = set(pivot_cols)
+
+    basis = []
+    for free_var in range(n):
+        if free_var in pivots:
+            continue
+        # x_free = d, x_pivot = -R[r][free] (nhân cả vector với d để giữ số nguyên)
+        vec = [0] * n
+        vec[free_var] = d
+        for r, col in enumerate(pivot_cols):
+            vec[col] = -R[r][free_var]
+        basis.append(_primitive_vector(vec))
+    return basis
+
+
+def eigenspace(B, eigenvalue):
+    """Cơ sở nguyên của không gian riêng của ma trận nguyên B ứng với trị riêng hữu tỉ p/q: ker(qB - pI)"""
+    eigenvalue = Fraction(eigenvalue)
+    p, q = eigenvalue.numerator, eigenvalue.denominator
+    n = len(B)
+    M = [[q * B[i][j] - (p if i == j else 0) for j in range(n)] for i in range(n)]
+    return nullspace(M)
+
+
+def inverse(P):
+    """
+    Ma trận nghịch đảo chính xác của ma trận số nguyên/phân số P bằng khử Gauss-Jordan không phân số
+    trên [P | I]. Trả về None nếu P suy biến.
+    """
+    B, d = scale_to_integer(P)
+    n = len(B)
+    augmented = [B[i] + [1 if i == j else 0 for j in range(n)] for i in range(n)]
+    R, pivot_cols, det = fraction_free_rref(augmented)
+    if pivot_cols[:n] != list(range(n)):
+        return None
+    # P^-1 = (d*P)^-1 * d
+    return [[_normalize_exact(Fraction(R[i][n + j] * d, det)) for j in range(n)] for i in range(n)]
@@ -0,0 +1,285 @@
+from fractions import Fraction
+
+from matrix import Matrix
+
+
+def _to_lists(A):
+    """Sao chép ma trận (list of lists hoặc Matrix) thành list of lists"""
+    if isinstance(A, Matrix):
+        return A.tolist()
+    return [list(row) for row in A]
+
+
+def is_exact_matrix(A):
+    """Kiểm tra ma trận chỉ gồm số nguyên hoặc phân số (Fraction)"""
+    if isinstance(A, Matrix):
+        return False
+    return all(isinstance(x, (int, Fraction)) and not isinstance(x, bool) for row in A for x in row)
+
+
+def lu_decompose(A, tol=1e-12):
+    """
+    Phân tích PA = LU bằng khử Gauss với chọn pivot một phần.
+    Trả về (LU, pivots, sign):
+        LU: ma trận gộp, phần dưới đường chéo là L (đường chéo của L bằng 1), phần còn lại là U
+        pivots: pivots[k] là hàng được hoán đổi với hàng k ở bước k
+        sign: dấu của hoán vị (+1 hoặc -1)
+    """
+    LU = _to_lists(A)
+    n = len(LU)
+    if any(len(row) != n for row in LU):
+        raise ValueError("Ma trận phải là ma trận vuông")
+
+    pivots = []
+    sign = 1
+
+    for k in range(n):
+        # Tìm pivot có trị tuyệt đối lớn nhất trong cột k
+        max_row = k
+        max_val = abs(LU[k][k])
+        for i in range(k + 1, n):
+            if abs(LU[i][k]) > max_val:
+                max_val = abs(LU[i][k])
+                max_row = i
+        pivots.append(max_row)
+
+        if max_row != k:
+            LU[k], LU[max_row] = LU[max_row], LU[k]
+            sign = -sign
+
+        # Cột k toàn 0: ma trận suy biến, bỏ qua bước khử
+        if max_val < tol:
+            continue
+
+        pivot_row = LU[k]
+        pivot = pivot_row[k]
+        for i in range(k + 1, n):
+            row = LU[i]
+            factor = row[k] / pivot
+            if factor == 0:
+                continue
+            row[k] = factor
+            for j in range(k + 1, n):
+                row[j] -= factor * pivot_row[j]
+
+    return LU, pivots, sign
+
+
+def bareiss_decompose(A):
+    """
+    Khử Gauss không dùng phân số (thuật toán Bareiss).
+    Với ma trận số nguyên mọi phần tử trung gian đều là số nguyên (các phép chia là chia hết).
+    Trả về (M, pivots, sign), trong đó M[n-1][n-1] * sign là định thức.
+    """
+    M = _to_lists(A)
+    n = len(M)
+    if any(len(row) != n for row in M):
+        raise ValueError("Ma trận phải là ma trận vuông")
+
+    # Với số nguyên dùng phép chia nguyên, với Fraction dùng phép chia thường (vẫn chính xác)
+    integer_only = all(isinstance(x, int) for row in M for x in row)
+    pivots = []
+    sign = 1
+    prev = 1
+
+    for k in range(n - 1):
+        # Bareiss chỉ cần pivot khác 0
+        pivot_row = k
+        while pivot_row < n and M[pivot_row][k] == 0:
+            pivot_row += 1
+        if pivot_row == n:
+            pivots.append(k)
+            M[n - 1][n - 1] = 0
+            return M, pivots, sign
+        pivots.append(pivot_row)
+
+        if pivot_row != k:
+            M[k], M[pivot_row] = M[pivot_row], M[k]
+            sign = -sign
+
+        pivot = M[k][k]
+        for i in range(k + 1, n):
+            row = M[i]
+            m_ik = row[k]
+            for j in range(k + 1, n):
+                value = row[j] * pivot - m_ik * M[k][j]
+                row[j] = value // prev if integer_only else value / prev
+            row[k] = 0
+        prev = pivot
+
+    pivots.append(n - 1)
+    return M, pivots, sign
+
+
+def determinant(A, method='auto', return_pivots=False):
+    """
+    Tính định thức của ma trận A trong O(n^3).
+        method = 'lu': phân tích LU với chọn pivot một phần (số thực)
+        method = 'bareiss': khử không phân số, chính xác cho số nguyên/Fraction
+        method = 'auto': dùng 'bareiss' nếu A chỉ gồm số nguyên/Fraction, ngược lại dùng 'lu'
+    Nếu return_pivots = True, trả về (det, pivots) để có thể dùng lại dãy pivot.
+    """
+    n = len(A)
+    if n == 0:
+        return (1, []) if return_pivots else 1
+
+    if method == 'auto':
+        method = 'bareiss' if is_exact_matrix(A) else 'lu'
+
+    if method == 'lu':
+        LU, pivots, sign = lu_decompose(A)
+        det = sign
+        for i in range(n):
+            det *= LU[i][i]
+    elif method == 'bareiss':
+        M, pivots, sign = bareiss_decompose(A)
+        det = sign * M[n - 1][n - 1]
+    else:
+        raise ValueError(f"Phương pháp không hợp lệ: {method}")
+
+    if return_pivots:
+        return det, pivots
+    return det
+
+
+class LUFactorization:
+    """
+    Phân tích PA = LU với chọn pivot một phần, U ở dạng bậc thang (cho phép ma trận suy biến).
+    Phân tích một lần rồi dùng lại để giải nhiều vế phải, tính định thức, nghịch đảo
+    (chỉ khi cần) và cơ sở của không gian nghiệm Ax = 0.
+    """
+
+    def __init__(self, A, tol=1e-10):
+        LU = _to_lists(A)
+        m = len(LU)
+        n = len(LU[0]) if m else 0
+        perm = list(range(m))
+        pivot_cols = []
+        sign = 1
+
+        h = 0  # Hàng pivot hiện tại
+        for k in range(n):
+            if h == m:
+                break
+            # Tìm pivot có trị tuyệt đối lớn nhất trong cột k, từ hàng h trở xuống
+            max_row = h
+            max_val = abs(LU[h][k])
+            for i in range(h + 1, m):
+                if abs(LU[i][k]) > max_val:
+                    max_val = abs(LU[i][k])
+                    max_row = i
+            if max_val < tol:
+                continue  # Cột k không có pivot
+
+            if max_row != h:
+                LU[h], LU[max_row] = LU[max_row], LU[h]
+                perm[h], perm[max_row] = perm[max_row], perm[h]
+                sign = -sign
+
+            pivot_row = LU[h]
+            pivot = pivot_row[k]
+            for i in range(h + 1, m):
+                row = LU[i]
+                factor = row[k] / pivot
+                row[k] = factor  # Lưu hệ số của L
+                if factor != 0:
+                    for j in range(k + 1, n):
+                        row[j] -= factor * pivot_row[j]
+
+            pivot_cols.append(k)
+            h += 1
+
+        self.lu = LU
+        self.perm = perm
+        self.pivot_cols = pivot_cols
+        self.sign = sign
+        self.rows = m
+        self.cols = n
+        self.tol = tol
+        self._inverse = None
+
+    @property
+    def rank(self):
+        return len(self.pivot_cols)
+
+    def is_singular(self):
+        """Ma trận vuông suy biến (hạng nhỏ hơn n)"""
+        return self.rows != self.cols or self.rank < self.cols
+
+    def determinant(self):
+        """Định thức của ma trận ban đầu"""
+        if self.rows != self.cols:
+            raise ValueError("Ma trận phải là ma trận vuông")
+        if self.is_singular():
+            return 0
+        det = self.sign
+        for i in range(self.rows):
+            det *= self.lu[i][i]
+        return det
+
+    def _solve_vector(self, b):
+        """Giải Ax = b với một vector b"""
+        n = self.rows
+        LU = self.lu
+        # Thế xuôi: Ly = Pb
+        y = [b[p] for p in self.perm]
+        for i in range(1, n):
+            row = LU[i]
+            s = y[i]
+            for j in range(i):
+                s -= row[j] * y[j]
+            y[i] = s
+        # Thế ngược: Ux = y
+        x = [0] * n
+        for i in range(n - 1, -1, -1):
+            row = LU[i]
+            s = y[i]
+            for j in range(i + 1, n):
+                s -= row[j] * x[j]
+            x[i] = s / row[i]
+        return x
+
+    def solve(self, b):
+        """
+        Giải Ax = b với b là vector hoặc ma trận (mỗi cột là một vế phải), O(n^2) mỗi vế phải
+        """
+        if self.is_singular():
+            raise ValueError("Ma trận suy biến, không có nghiệm duy nhất")
+        if isinstance(b, Matrix):
+            b = b.tolist()
+        if b and isinstance(b[0], (list, tuple)):
+            columns = [self._solve_vector([row[j] for row in b]) for j in range(len(b[0]))]
+            return [[col[i] for col in columns] for i in range(self.rows)]
+        return self._solve_vector(b)
+
+    def inverse(self):
+        """Ma trận nghịch đảo (chỉ tính ở lần gọi đầu tiên)"""
+        if self._inverse is None:
+            if self.is_singular():
+                raise ValueError("Ma trận suy biến, không có ma trận nghịch đảo")
+            n = self.rows
+            identity = [[1.0 if i == j else 0.0 for j in range(n)] for i in range(n)]
+            self._inverse = self.solve(identity)
+        return [row[:] for row in self._inverse]
+
+    def nullspace(self):
+        """Cơ sở của không gian nghiệm Ax = 0 (mỗi biến tự do cho một vector)"""
+        n = self.cols
+        LU = self.lu
+        pivot_cols = self.pivot_cols
+        free_vars = [j for j in range(n) if j not in set(pivot_cols)]
+
+        basis = []
+        for free_var in free_vars:
+            vec = [0] * n
+            vec[free_var] = 1.0
+            # Thế ngược từ hàng pivot cuối cùng lên
+            for r in range(len(pivot_cols) - 1, -1, -1):
+                col = pivot_cols[r]
+                row = LU[r]
+                s = 0
+                for j in range(col + 1, n):
+                    s += row[j] * vec[j]
+                vec[col] = -s / row[col]
+            basis.append(vec)
+        return basis
@@ -0,0 +1,201 @@
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # numpy là tùy chọn
+    np = None
+
+
+BLOCK_SIZE = 128  # Kích thước khối khi nhân ma trận
+
+
+class Matrix:
+    """Ma trận lưu trong một bộ đệm liên tục theo thứ tự hàng (row-major)"""
+
+    __slots__ = ('rows', 'cols', 'data')
+
+    def __init__(self, rows, cols, default_value=0.0, use_numpy=False):
+        self.rows = rows
+        self.cols = cols
+        if use_numpy:
+            if np is None:
+                raise ImportError("Cần cài đặt numpy để dùng use_numpy=True")
+            self.data = np.full(rows * cols, float(default_value))
+        else:
+            self.data = array('d', [float(default_value)]) * (rows * cols)
+
+    @classmethod
+    def from_lists(cls, A, use_numpy=False):
+        """Tạo Matrix từ ma trận dạng list of lists"""
+        if isinstance(A, Matrix):
+            return A.copy()
+        rows = len(A)
+        cols = len(A[0]) if rows else 0
+        M = cls.__new__(cls)
+        M.rows = rows
+        M.cols = cols
+        if use_numpy:
+            if np is None:
+                raise ImportError("Cần cài đặt numpy để dùng use_numpy=True")
+            M.data = np.array(A, dtype=float).reshape(rows * cols)
+        else:
+            M.data = array('d', [x for row in A for x in row])
+        return M
+
+    @classmethod
+    def identity(cls, n, use_numpy=False):
+        """Tạo ma trận đơn vị n x n"""
+        M = cls(n, n, 0.0, use_numpy)
+        for i in range(n):
+            M.data[i * n + i] = 1.0
+        return M
+
+    @property
+    def shape(self):
+        return self.rows, self.cols
+
+    @property
+    def uses_numpy(self):
+        return np is not None and isinstance(self.data, np.ndarray)
+
+    def _buffer(self):
+        """Trả về bộ đệm có thể cắt lát mà không sao chép"""
+        if self.uses_numpy:
+            return self.data
+        return memoryview(self.data)
+
+    def row(self, i):
+        """View hàng i (không sao chép dữ liệu)"""
+        start = i * self.cols
+        return self._buffer()[start:start + self.cols]
+
+    def col(self, j):
+        """View cột j (không sao chép dữ liệu)"""
+        return self._buffer()[j::self.cols]
+
+    def __len__(self):
+        return self.rows
+
+    def __getitem__(self, key):
+        # Hỗ trợ cả A[i][j] (giống list of lists) và A[i, j]
+        if isinstance(key, tuple):
+            i, j = key
+            return self.data[i * self.cols + j]
+        if key < 0:
+            key += self.rows
+        if not 0 <= key < self.rows:
+            raise IndexError("Chỉ số hàng vượt quá kích thước ma trận")
+        return self.row(key)
+
+    def __setitem__(self, key, value):
+        if isinstance(key, tuple):
+            i, j = key
+            self.data[i * self.cols + j] = value
+        else:
+            start = key * self.cols
+            self.data[start:start + self.cols] = array('d', value) if not self.uses_numpy else value
+
+    def __iter__(self):
+        for i in range(self.rows):
+            yield self.row(i)
+
+    def __eq__(self, other):
+        if isinstance(other, Matrix):
+            return self.shape == other.shape and list(self.data) == list(other.data)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"Matrix({self.tolist()})"
+
+    def tolist(self):
+        """Chuyển về dạng list of lists"""
+        c = self.cols
+        return [list(self.data[i * c:(i + 1) * c]) for i in range(self.rows)]
+
+    def copy(self):
+        """Tạo bản sao của ma trận"""
+        M = Matrix.__new__(Matrix)
+        M.rows = self.rows
+        M.cols = self.cols
+        M.data = self.data.copy() if self.uses_numpy else array('d', self.data)
+        return M
+
+    def transpose(self):
+        """Tính ma trận chuyển vị"""
+        T = Matrix(self.cols, self.rows, 0.0, self.uses_numpy)
+        for j in range(self.cols):
+            T.data[j * self.rows:(j + 1) * self.rows] = self.data[j::self.cols]
+        return T
+
+    def subtract(self, other):
+        """Trừ hai ma trận cùng kích thước"""
+        other = _as_matrix(other)
+        if self.shape != other.shape:
+            raise ValueError("Hai ma trận phải có cùng kích thước")
+        C = Matrix.__new__(Matrix)
+        C.rows, C.cols = self.rows, self.cols
+        if self.uses_numpy:
+            C.data = self.data - np.asarray(other.data)
+        else:
+            C.data = array('d', [a - b for a, b in zip(self.data, other.data)])
+        return C
+
+    def scale(self, scalar):
+        """Nhân ma trận với một số"""
+        C = Matrix.__new__(Matrix)
+        C.rows, C.cols = self.rows, self.cols
+        if self.uses_numpy:
+            C.data = self.data * scalar
+        else:
+            C.data = array('d', [scalar * a for a in self.data])
+        return C
+
+    def multiply(self, other, block_size=BLOCK_SIZE):
+        """Nhân ma trận theo khối (cache-blocked)"""
+        other = _as_matrix(other)
+        if self.cols != other.rows:
+            raise ValueError("Số cột của A phải bằng số hàng của B")
+        if self.uses_numpy or other.uses_numpy:
+            C = Matrix.__new__(Matrix)
+            C.rows, C.cols = self.rows, other.cols
+            a = np.asarray(self.data).reshape(self.rows, self.cols)
+            b = np.asarray(other.data).reshape(other.rows, other.cols)
+            C.data = (a @ b).reshape(self.rows * other.cols)
+            return C
+        return blocked_multiply(self, other, block_size)
+
+
+def _as_matrix(A):
+    return A if isinstance(A, Matrix) else Matrix.from_lists(A)
+
+
+def blocked_multiply(A, B, block_size=BLOCK_SIZE):
+    """
+    Nhân C = A * B theo từng khối block_size x block_size.
+    Mỗi khối của C được cộng dồn trong một list cục bộ rồi ghi lại một lần,
+    các hàng của B được duyệt liên tiếp trong bộ nhớ (thứ tự i-k-j).
+    """
+    m, n, p = A.rows, A.cols, B.cols
+    a, b = A.data, B.data
+    C = Matrix(m, p)
+    c = C.data
+
+    for ii in range(0, m, block_size):
+        i_end = min(ii + block_size, m)
+        for jj in range(0, p, block_size):
+            j_end = min(jj + block_size, p)
+            for kk in range(0, n, block_size):
+                k_end = min(kk + block_size, n)
+                for i in range(ii, i_end):
+                    c_start = i * p
+                    acc = c[c_start + jj:c_start + j_end].tolist()
+                    a_start = i * n
+                    for k in range(kk, k_end):
+                        a_ik = a[a_start + k]
+                        if a_ik == 0.0:
+                            continue
+                        b_start = k * p
+                        acc = [x + a_ik * y for x, y in zip(acc, b[b_start + jj:b_start + j_end])]
+                    c[c_start + jj:c_start + j_end] = array('d', acc)
+
+    return C
@@ -0,0 +1,572 @@
+import heapq
+from array import array
+
+from matrix import Matrix
+
+
+class CSRMatrix:
+    """
+    Ma trận thưa lưu theo hàng (Compressed Sparse Row): bộ nhớ tỉ lệ với số phần tử khác 0.
+    Các phần tử khác 0 của hàng i là data[indptr[i]:indptr[i+1]],
+    chỉ số cột tương ứng là indices[indptr[i]:indptr[i+1]] (tăng dần).
+    """
+
+    __slots__ = ('rows', 'cols', 'indptr', 'indices', 'data')
+
+    def __init__(self, rows, cols, indptr=None, indices=None, data=None):
+        self.rows = rows
+        self.cols = cols
+        self.indptr = array('l', indptr) if indptr is not None else array('l', [0]) * (rows + 1)
+        self.indices = array('i', indices) if indices is not None else array('i')
+        self.data = array('d', data) if data is not None else array('d')
+
+    @classmethod
+    def from_dense(cls, A, tol=0.0):
+        """Tạo ma trận thưa từ list of lists hoặc Matrix, bỏ các phần tử có |a| <= tol"""
+        rows = len(A)
+        cols = len(A[0]) if rows else 0
+        indptr, indices, data = [0], [], []
+        for row in A:
+            for j, x in enumerate(row):
+                if abs(x) > tol:
+                    indices.append(j)
+                    data.append(x)
+            indptr.append(len(data))
+        return cls(rows, cols, indptr, indices, data)
+
+    @classmethod
+    def from_coo(cls, rows, cols, row_idx, col_idx, values):
+        """Tạo ma trận thưa từ các bộ ba (i, j, giá trị), các phần tử trùng vị trí được cộng dồn"""
+        entries = [{} for _ in range(rows)]
+        for i, j, x in zip(row_idx, col_idx, values):
+            entries[i][j] = entries[i].get(j, 0.0) + x
+        return cls.from_rows(entries, cols)
+
+    @classmethod
+    def from_rows(cls, row_dicts, cols):
+        """Tạo ma trận thưa từ danh sách các hàng dạng dict {cột: giá trị}"""
+        indptr, indices, data = [0], [], []
+        for entries in row_dicts:
+            for j in sorted(entries):
+                if entries[j] != 0:
+                    indices.append(j)
+                    data.append(entries[j])
+            indptr.append(len(data))
+        return cls(len(row_dicts), cols, indptr, indices, data)
+
+    @classmethod
+    def identity(cls, n):
+        """Ma trận đơn vị thưa n x n"""
+        return cls(n, n, range(n + 1), range(n), [1.0] * n)
+
+    @property
+    def shape(self):
+        return self.rows, self.cols
+
+    @property
+    def nnz(self):
+        """Số phần tử khác 0"""
+        return len(self.data)
+
+    def __len__(self):
+        return self.rows
+
+    def __getitem__(self, key):
+        # A[i, j] trả về phần tử, A[i] trả về hàng i dạng list (giống list of lists)
+        if isinstance(key, tuple):
+            i, j = key
+            for k in range(self.indptr[i], self.indptr[i + 1]):
+                if self.indices[k] == j:
+                    return self.data[k]
+            return 0.0
+        row = [0.0] * self.cols
+        for j, x in self.row_items(key):
+            row[j] = x
+        return row
+
+    def __repr__(self):
+        return f"CSRMatrix({self.rows}x{self.cols}, nnz={self.nnz})"
+
+    def row_items(self, i):
+        """Các cặp (cột, giá trị) khác 0 của hàng i"""
+        start, end = self.indptr[i], self.indptr[i + 1]
+        return zip(self.indices[start:end], self.data[start:end])
+
+    def row_dicts(self):
+        """Danh sách các hàng dạng dict {cột: giá trị}"""
+        return [dict(self.row_items(i)) for i in range(self.rows)]
+
+    def tolist(self):
+        """Chuyển về ma trận dày dạng list of lists"""
+        return [self[i] for i in range(self.rows)]
+
+    def copy(self):
+        """Tạo bản sao của ma trận"""
+        return CSRMatrix(self.rows, self.cols, self.indptr, self.indices, self.data)
+
+    def transpose(self):
+        """Ma trận chuyển vị (dạng CSR), O(nnz)"""
+        return self.tocsc().transpose()
+
+    def tocsc(self):
+        """Chuyển sang dạng lưu theo cột (CSC), O(nnz)"""
+        counts = [0] * (self.cols + 1)
+        for j in self.indices:
+            counts[j + 1] += 1
+        for j in range(self.cols):
+            counts[j + 1] += counts[j]
+        indptr = counts[:]
+        indices = array('i', [0]) * self.nnz
+        data = array('d', [0.0]) * self.nnz
+        for i in range(self.rows):
+            for k in range(self.indptr[i], self.indptr[i + 1]):
+                j = self.indices[k]
+                dest = counts[j]
+                indices[dest] = i
+                data[dest] = self.data[k]
+                counts[j] += 1
+        return CSCMatrix(self.rows, self.cols, indptr, indices, data)
+
+    def scale(self, scalar):
+        """Nhân ma trận với một số"""
+        return CSRMatrix(self.rows, self.cols, self.indptr, self.indices,
+                         [scalar * x for x in self.data])
+
+    def add_diagonal(self, value):
+        """Tính A + value*I (ví dụ A - λI với value = -λ)"""
+        rows = self.row_dicts()
+        for i in range(min(self.rows, self.cols)):
+            rows[i][i] = rows[i].get(i, 0.0) + value
+        return CSRMatrix.from_rows(rows, self.cols)
+
+    def subtract(self, other):
+        """Trừ hai ma trận thưa cùng kích thước"""
+        if self.shape != other.shape:
+            raise ValueError("Hai ma trận phải có cùng kích thước")
+        rows = self.row_dicts()
+        for i in range(other.rows):
+            for j, x in other.row_items(i):
+                rows[i][j] = rows[i].get(j, 0.0) - x
+        return CSRMatrix.from_rows(rows, self.cols)
+
+    def matvec(self, x):
+        """Tích ma trận - vector y = A*x, O(nnz)"""
+        if len(x) != self.cols:
+            raise ValueError("Độ dài vector phải bằng số cột của ma trận")
+        indptr, indices, data = self.indptr, self.indices, self.data
+        y = [0.0] * self.rows
+        for i in range(self.rows):
+            s = 0.0
+            for k in range(indptr[i], indptr[i + 1]):
+                s += data[k] * x[indices[k]]
+            y[i] = s
+        return y
+
+    def rmatvec(self, x):
+        """Tích vector hàng - ma trận y = x*A (tức A^T*x), O(nnz)"""
+        if len(x) != self.rows:
+            raise ValueError("Độ dài vector phải bằng số hàng của ma trận")
+        y = [0.0] * self.cols
+        for i in range(self.rows):
+            x_i = x[i]
+            if x_i == 0:
+                continue
+            for j, a in self.row_items(i):
+                y[j] += a * x_i
+        return y
+
+    def multiply(self, other):
+        """
+        Nhân A * B: với B thưa (CSRMatrix) kết quả là ma trận thưa,
+        với B dày (list of lists hoặc Matrix) kết quả là ma trận dày cùng kiểu với B
+        """
+        if isinstance(other, CSCMatrix):
+            other = other.tocsr()
+        if len(other) != self.cols:
+            raise ValueError("Số cột của A phải bằng số hàng của B")
+
+        if isinstance(other, CSRMatrix):
+            # Mỗi hàng của C là tổ hợp tuyến tính các hàng của B
+            rows = []
+            for i in range(self.rows):
+                acc = {}
+                for k, a in self.row_items(i):
+                    for j, b in other.row_items(k):
+                        acc[j] = acc.get(j, 0.0) + a * b
+                rows.append(acc)
+            return CSRMatrix.from_rows(rows, other.cols)
+
+        packed = isinstance(other, Matrix)
+        B = other.tolist() if packed else other
+        p = len(B[0]) if B else 0
+        C = []
+        for i in range(self.rows):
+            acc = [0.0] * p
+            for k, a in self.row_items(i):
+                acc = [x + a * y for x, y in zip(acc, B[k])]
+            C.append(acc)
+        return Matrix.from_lists(C) if packed else C
+
+    def rmultiply(self, other):
+        """Nhân ma trận dày với ma trận thưa: C = B * A (B là list of lists hoặc Matrix)"""
+        packed = isinstance(other, Matrix)
+        B = other.tolist() if packed else other
+        if B and len(B[0]) != self.rows:
+            raise ValueError("Số cột của A phải bằng số hàng của B")
+        C = [self.rmatvec(row) for row in B]
+        return Matrix.from_lists(C) if packed else C
+
+
+class CSCMatrix:
+    """
+    Ma trận thưa lưu theo cột (Compressed Sparse Column): các phần tử khác 0 của cột j là
+    data[indptr[j]:indptr[j+1]], chỉ số hàng tương ứng là indices[indptr[j]:indptr[j+1]].
+    """
+
+    __slots__ = ('rows', 'cols', 'indptr', 'indices', 'data')
+
+    def __init__(self, rows, cols, indptr=None, indices=None, data=None):
+        self.rows = rows
+        self.cols = cols
+        self.indptr = array('l', indptr) if indptr is not None else array('l', [0]) * (cols + 1)
+        self.indices = array('i', indices) if indices is not None else array('i')
+        self.data = array('d', data) if data is not None else array('d')
+
+    @classmethod
+    def from_dense(cls, A, tol=0.0):
+        """Tạo ma trận thưa (CSC) từ list of lists hoặc Matrix"""
+        return CSRMatrix.from_dense(A, tol).tocsc()
+
+    @property
+    def shape(self):
+        return self.rows, self.cols
+
+    @property
+    def nnz(self):
+        return len(self.data)
+
+    def __len__(self):
+        return self.rows
+
+    def __repr__(self):
+        return f"CSCMatrix({self.rows}x{self.cols}, nnz={self.nnz})"
+
+    def col_items(self, j):
+        """Các cặp (hàng, giá trị) khác 0 của cột j"""
+        start, end = self.indptr[j], self.indptr[j + 1]
+        return zip(self.indices[start:end], self.data[start:end])
+
+    def copy(self):
+        """Tạo bản sao của ma trận"""
+        return CSCMatrix(self.rows, self.cols, self.indptr, self.indices, self.data)
+
+    def transpose(self):
+        """Ma trận chuyển vị: dùng lại các mảng dưới dạng CSR (không sao chép phần tử)"""
+        T = CSRMatrix.__new__(CSRMatrix)
+        T.rows, T.cols = self.cols, self.rows
+        T.indptr, T.indices, T.data = self.indptr, self.indices, self.data
+        return T
+
+    def tocsr(self):
+        """Chuyển sang dạng lưu theo hàng (CSR), O(nnz)"""
+        return self.transpose().tocsc().transpose()
+
+    def tolist(self):
+        """Chuyển về ma trận dày dạng list of lists"""
+        return self.tocsr().tolist()
+
+    def matvec(self, x):
+        """Tích ma trận - vector y = A*x, cộng dồn theo từng cột, O(nnz)"""
+        if len(x) != self.cols:
+            raise ValueError("Độ dài vector phải bằng số cột của ma trận")
+        y = [0.0] * self.rows
+        for j in range(self.cols):
+            x_j = x[j]
+            if x_j == 0:
+                continue
+            for i, a in self.col_items(j):
+                y[i] += a * x_j
+        return y
+
+    def multiply(self, other):
+        """Nhân A * B (xem CSRMatrix.multiply)"""
+        return self.tocsr().multiply(other)
+
+
+def as_sparse(A, tol=0.0):
+    """Chuyển ma trận về CSRMatrix (giữ nguyên nếu đã là CSRMatrix)"""
+    if isinstance(A, CSRMatrix):
+        return A
+    if isinstance(A, CSCMatrix):
+        return A.tocsr()
+    return CSRMatrix.from_dense(A, tol)
+
+
+def _permutation_sign(perm):
+    """Dấu của hoán vị (+1 hoặc -1)"""
+    seen = [False] * len(perm)
+    sign = 1
+    for start in range(len(perm)):
+        if seen[start]:
+            continue
+        length = 0
+        k = start
+        while not seen[k]:
+            seen[k] = True
+            k = perm[k]
+            length += 1
+        if length % 2 == 0:
+            sign = -sign
+    return sign
+
+
+class SparseLU:
+    """
+    Phân tích LU của ma trận thưa với chọn pivot Markowitz để hạn chế phần tử lấp đầy (fill-in):
+    mỗi bước chọn cột còn ít phần tử khác 0 nhất, trong cột đó chọn hàng ngắn nhất trong số các
+    phần tử đủ lớn (|a| >= threshold * max|cột|) để vẫn ổn định số học.
+    Cho phép ma trận suy biến; cùng giao diện với lu.LUFactorization
+    (rank, is_singular, determinant, solve, inverse, nullspace).
+    """
+
+    def __init__(self, A, tol=1e-10, threshold=0.1):
+        A = as_sparse(A)
+        m, n = A.shape
+        rows = A.row_dicts()
+        col_rows = [set() for _ in range(n)]
+        for i, row in enumerate(rows):
+            for j in row:
+                col_rows[j].add(i)
+
+        active_rows = set(range(m))
+        active_cols = set(range(n))
+        heap = [(len(col_rows[j]), j) for j in range(n)]
+        heapq.heapify(heap)
+
+        pivot_rows = []
+        pivot_cols = []
+        u_rows = []     # u_rows[k]: hàng pivot bước k {cột: giá trị}
+        l_cols = []     # l_cols[k]: hệ số khử bước k {hàng: hệ số}
+
+        while heap and len(pivot_rows) < m:
+            count, j = heapq.heappop(heap)
+            if j not in active_cols:
+                continue
+            if count != len(col_rows[j]):
+                heapq.heappush(heap, (len(col_rows[j]), j))  # Số phần tử đã thay đổi
+                continue
+
+            column = [(i, rows[i][j]) for i in col_rows[j]]
+            max_val = max((abs(x) for _, x in column), default=0.0)
+            if max_val < tol:
+                active_cols.discard(j)  # Cột không có pivot (biến tự do)
+                continue
+
+            # Markowitz: hàng ngắn nhất trong các phần tử đủ lớn
+            candidates = [(len(rows[i]), -abs(x), i) for i, x in column if abs(x) >= threshold * max_val]
+            r = min(candidates)[2]
+            pivot_row = rows[r]
+            pivot = pivot_row[j]
+
+            multipliers = {}
+            for i in col_rows[j]:
+                if i == r:
+                    continue
+                row = rows[i]
+                factor = row.pop(j) / pivot
+                multipliers[i] = factor
+                for c, v in pivot_row.items():
+                    if c == j:
+                        continue
+                    value = row.get(c, 0.0) - factor * v
+                    if value == 0.0:
+                        if c in row:
+                            del row[c]
+                            col_rows[c].discard(i)
+                    else:
+                        if c not in row:
+                            col_rows[c].add(i)
+                        row[c] = value
+
+            # Loại hàng và cột pivot khỏi phần còn lại
+            for c in pivot_row:
+                col_rows[c].discard(r)
+                if c != j and c in active_cols:
+                    heapq.heappush(heap, (len(col_rows[c]), c))
+            col_rows[j] = set()
+            active_rows.discard(r)
+            active_cols.discard(j)
+            rows[r] = {}
+
+            pivot_rows.append(r)
+            pivot_cols.append(j)
+            u_rows.append(pivot_row)
+            l_cols.append(multipliers)
+
+        self.pivot_rows = pivot_rows
+        self.pivot_cols = pivot_cols
+        self.u_rows = u_rows
+        self.l_cols = l_cols
+        self.rows = m
+        self.cols = n
+        self.tol = tol
+        self._inverse = None
+
+    @property
+    def rank(self):
+        return len(self.pivot_cols)
+
+    @property
+    def nnz(self):
+        """Số phần tử khác 0 của L và U (đo mức lấp đầy)"""
+        return sum(len(row) for row in self.u_rows) + sum(len(col) for col in self.l_cols)
+
+    def is_singular(self):
+        """Ma trận vuông suy biến (hạng nhỏ hơn n)"""
+        return self.rows != self.cols or self.rank < self.cols
+
+    def determinant(self):
+        """Định thức của ma trận ban đầu"""
+        if self.rows != self.cols:
+            raise ValueError("Ma trận phải là ma trận vuông")
+        if self.is_singular():
+            return 0
+        # A[pivot_rows[k]][pivot_cols[k]] là pivot bước k: det = dấu(hoán vị hàng, cột) * tích pivot
+        row_perm = [0] * self.rows
+        for k, r in enumerate(self.pivot_rows):
+            row_perm[r] = k
+        col_perm = [0] * self.cols
+        for k, c in enumerate(self.pivot_cols):
+            col_perm[c] = k
+        det = _permutation_sign(row_perm) * _permutation_sign(col_perm)
+        for row, c in zip(self.u_rows, self.pivot_cols):
+            det *= row[c]
+        return det
+
+    def _solve_vector(self, b):
+        """Giải Ax = b với một vector b"""
+        y = list(b)
+        # Thế xuôi: áp dụng lần lượt các bước khử lên vế phải
+        for r, multipliers in zip(self.pivot_rows, self.l_cols):
+            y_r = y[r]
+            if y_r == 0:
+                continue
+            for i, factor in multipliers.items():
+                y[i] -= factor * y_r
+        # Thế ngược theo thứ tự pivot ngược lại
+        x = [0.0] * self.cols
+        for k in range(self.rank - 1, -1, -1):
+            row = self.u_rows[k]
+            c = self.pivot_cols[k]
+            s = y[self.pivot_rows[k]]
+            for j, v in row.items():
+                if j != c:
+                    s -= v * x[j]
+            x[c] = s / row[c]
+        return x
+
+    def solve(self, b):
+        """Giải Ax = b với b là vector hoặc ma trận dày (mỗi cột là một vế phải)"""
+        if self.is_singular():
+            raise ValueError("Ma trận suy biến, không có nghiệm duy nhất")
+        if isinstance(b, Matrix):
+            b = b.tolist()
+        if b and isinstance(b[0], (list, tuple)):
+            columns = [self._solve_vector([row[j] for row in b]) for j in range(len(b[0]))]
+            return [[col[i] for col in columns] for i in range(self.rows)]
+        return self._solve_vector(b)
+
+    def inverse(self):
+        """Ma trận nghịch đảo dạng dày (chỉ tính ở lần gọi đầu tiên)"""
+        if self._inverse is None:
+            if self.is_singular():
+                raise ValueError("Ma trận suy biến, không có ma trận nghịch đảo")
+            n = self.rows
+            columns = []
+            for j in range(n):
+                e = [0.0] * n
+                e[j] = 1.0
+                columns.append(self._solve_vector(e))
+            self._inverse = [[col[i] for col in columns] for i in range(n)]
+        return [row[:] for row in self._inverse]
+
+    def nullspace(self):
+        """Cơ sở của không gian nghiệm Ax = 0 (mỗi biến tự do cho một vector)"""
+        n = self.cols
+        pivots = set(self.pivot_cols)
+        basis = []
+        for free_var in range(n):
+            if free_var in pivots:
+                continue
+            vec = [0.0] * n
+            vec[free_var] = 1.0
+            for k in range(self.rank - 1, -1, -1):
+                row = self.u_rows[k]
+                c = self.pivot_cols[k]
+                s = 0.0
+                for j, v in row.items():
+                    if j != c:
+                        s += v * vec[j]
+                vec[c] = -s / row[c]
+            basis.append(vec)
+        return basis
+
+
+def gauss_elimination(A, tol=1e-10):
+    """
+    Dạng bậc thang rút gọn (RREF) của ma trận thưa, chỉ duyệt các phần tử khác 0.
+    Thứ tự cột được giữ nguyên (RREF phụ thuộc thứ tự cột); trong mỗi cột chọn hàng ngắn nhất
+    trong các phần tử đủ lớn để hạn chế lấp đầy. Trả về (CSRMatrix, vị trí các pivot).
+    """
+    A = as_sparse(A)
+    m, n = A.shape
+    rows = A.row_dicts()
+    col_rows = [set() for _ in range(n)]
+    for i, row in enumerate(rows):
+        for j in row:
+            col_rows[j].add(i)
+
+    remaining = set(range(m))
+    order = []
+    pivot_positions = []
+
+    for k in range(n):
+        if not remaining:
+            break
+        column = [(i, rows[i][k]) for i in col_rows[k] if i in remaining]
+        max_val = max((abs(x) for _, x in column), default=0.0)
+        if max_val < tol:
+            continue
+
+        candidates = [(len(rows[i]), -abs(x), i) for i, x in column if abs(x) >= 0.1 * max_val]
+        h = min(candidates)[2]
+        pivot_row = rows[h]
+        pivot = pivot_row[k]
+        for c in pivot_row:
+            pivot_row[c] /= pivot
+
+        # Khử cột k ở mọi hàng khác (cả trên và dưới)
+        for i in list(col_rows[k]):
+            if i == h:
+                continue
+            row = rows[i]
+            factor = row[k]
+            for c, v in pivot_row.items():
+                value = row.get(c, 0.0) - factor * v
+                if abs(value) < tol:
+                    if c in row:
+                        del row[c]
+                        col_rows[c].discard(i)
+                else:
+                    if c not in row:
+                        col_rows[c].add(i)
+                    row[c] = value
+
+        remaining.discard(h)
+        order.append(h)
+        pivot_positions.append(k)
+
+    # Các hàng pivot theo thứ tự, sau đó là các hàng còn lại (đã bằng 0 trong phạm vi tol)
+    result = [{c: v for c, v in rows[i].items() if abs(v) >= tol} for i in order]
+    result += [{} for _ in range(m - len(order))]
+    return CSRMatrix.from_rows(result, n), pivot_positions
@@ -0,0 +1,131 @@
+import math
+
+from lu import _to_lists
+from sparse import CSCMatrix, CSRMatrix
+
+
+def _entries(A):
+    """
+    Sinh các bộ (i, j, a_ij). Với CSRMatrix/CSCMatrix chỉ duyệt các phần tử khác 0 đã lưu
+    (O(nnz) thay vì dựng lại từng hàng dày qua A[i][j]); với ma trận dày duyệt mọi phần tử.
+    """
+    if isinstance(A, CSRMatrix):
+        for i in range(A.rows):
+            for j, value in A.row_items(i):
+                yield i, j, value
+    elif isinstance(A, CSCMatrix):
+        for j in range(A.cols):
+            for i, value in A.col_items(j):
+                yield i, j, value
+    else:
+        for i in range(len(A)):
+            row = A[i]
+            for j in range(len(row)):
+                yield i, j, row[j]
+
+
+def _tolerance(A, tol):
+    """
+    Ngưỡng tuyệt đối chung cho mọi phép kiểm tra cấu trúc: tol * max(1, max |a_ij|).
+    Mọi hàm is_* so sánh |a_ij| (hoặc |a_ij - a_ji|) với cùng một ngưỡng này; tol=0 là so sánh chính xác.
+    """
+    if not tol:
+        return 0
+    return tol * max(1, max((abs(value) for _, _, value in _entries(A)), default=0))
+
+
+def _is_zero_where(A, tol, outside):
+    """Mọi phần tử a_ij với outside(i, j) đều xấp xỉ 0"""
+    eps = _tolerance(A, tol)
+    return all(abs(value) <= eps for i, j, value in _entries(A) if outside(i, j))
+
+
+def is_diagonal(A, tol=1e-10):
+    """Kiểm tra ma trận đường chéo"""
+    return _is_zero_where(A, tol, lambda i, j: i != j)
+
+
+def is_symmetric(A, tol=1e-10):
+    """Kiểm tra ma trận đối xứng"""
+    eps = _tolerance(A, tol)
+    if isinstance(A, (CSRMatrix, CSCMatrix)):
+        # Ghép a_ij với a_ji qua dict các phần tử đã lưu; phần tử không lưu được coi là 0
+        stored = {(i, j): value for i, j, value in _entries(A)}
+        return all(abs(value - stored.get((j, i), 0)) <= eps for (i, j), value in stored.items())
+    n = len(A)
+    return all(abs(A[i][j] - A[j][i]) <= eps for i in range(n) for j in range(i + 1, n))
+
+
+def is_upper_triangular(A, tol=1e-10):
+    """Kiểm tra ma trận tam giác trên"""
+    return _is_zero_where(A, tol, lambda i, j: i > j)
+
+
+def is_lower_triangular(A, tol=1e-10):
+    """Kiểm tra ma trận tam giác dưới"""
+    return _is_zero_where(A, tol, lambda i, j: i < j)
+
+
+def detect_structure(A, tol=1e-10):
+    """Nhận diện cấu trúc ma trận: 'diagonal', 'symmetric', 'triangular' hoặc 'general'"""
+    if is_diagonal(A, tol):
+        return 'diagonal'
+    if is_symmetric(A, tol):
+        return 'symmetric'
+    if is_upper_triangular(A, tol) or is_lower_triangular(A, tol):
+        return 'triangular'
+    return 'general'
+
+
+def jacobi_eigen(A, tol=1e-12, max_sweeps=100):
+    """
+    Tìm trị riêng và vector riêng của ma trận đối xứng bằng phương pháp Jacobi (quay vòng).
+    Trả về (eigenvalues, V) với các trị riêng tăng dần và V là ma trận trực giao
+    có các cột là vector riêng tương ứng, A = V * diag(eigenvalues) * V^T.
+    """
+    a = [[float(x) for x in row] for row in _to_lists(A)]
+    n = len(a)
+    V = [[1.0 if i == j else 0.0 for j in range(n)] for i in range(n)]
+
+    norm = math.sqrt(sum(x * x for row in a for x in row)) or 1.0
+
+    for _ in range(max_sweeps):
+        off = math.sqrt(sum(a[i][j] ** 2 for i in range(n) for j in range(i + 1, n)))
+        if off <= tol * norm:
+            break
+
+        for p in range(n - 1):
+            for q in range(p + 1, n):
+                a_pq = a[p][q]
+                if abs(a_pq) <= tol * norm * 1e-3:
+                    continue
+
+                # Góc quay làm triệt tiêu phần tử a[p][q]
+                theta = (a[q][q] - a[p][p]) / (2 * a_pq)
+                t = (1.0 if theta >= 0 else -1.0) / (abs(theta) + math.sqrt(theta * theta + 1))
+                c = 1 / math.sqrt(t * t + 1)
+                s = t * c
+
+                # A <- J^T * A * J
+                for k in range(n):
+                    row = a[k]
+                    a_kp, a_kq = row[p], row[q]
+                    row[p] = c * a_kp - s * a_kq
+                    row[q] = s * a_kp + c * a_kq
+                row_p, row_q = a[p], a[q]
+                for k in range(n):
+                    a_pk, a_qk = row_p[k], row_q[k]
+                    row_p[k] = c * a_pk - s * a_qk
+                    row_q[k] = s * a_pk + c * a_qk
+
+                # V <- V * J
+                for row in V:
+                    v_p, v_q = row[p], row[q]
+                    row[p] = c * v_p - s * v_q
+                    row[q] = s * v_p + c * v_q
+
+    # Sắp xếp trị riêng tăng dần
+    order = sorted(range(n), key=lambda i: a[i][i])
+    eigenvalues = [a[i][i] for i in order]
+    V = [[row[i] for i in order] for row in V]
+    return eigenvalues, V
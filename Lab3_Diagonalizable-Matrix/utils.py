@@ -1,3 +1,21 @@
+"""
+Tìm trị riêng thực (kèm bội) từ đa thức đặc trưng.
+
+- Hệ số nguyên/phân số: phân tích chính xác thành các nhân tử không có nghiệm bội (thuật toán Yun),
+  cô lập nghiệm của từng nhân tử bằng dãy Sturm rồi tinh chỉnh bằng Newton có bảo vệ.
+- Hệ số thực (float, ví dụ đa thức đặc trưng của ma trận số thực): không dùng Yun/Sturm để xác định bội.
+  Hệ số float đã mang sai số làm tròn nên đa thức lưu trong máy gần như không bao giờ có nghiệm bội chính xác:
+  phân tích Yun trên bản hữu tỉ chính xác của nó chỉ cho nhân tử bội 1, còn nghiệm bội bị tách thành các
+  nghiệm gần nhau hoặc cặp nghiệm phức mà Sturm không đếm được. Làm tròn hệ số về số hữu tỉ "đơn giản"
+  lại biến hệ số vô tỉ thành một đa thức khác. Vì vậy mọi nghiệm phức được tìm bằng Aberth - Ehrlich,
+  các nghiệm gần nhau được gộp thành nhóm và bội được xác định bằng số thực: nhóm m nghiệm chỉ là
+  nghiệm bội m khi đa thức và các đạo hàm tới cấp m - 1 đều gần 0 tại tâm nhóm (xem find_real_roots_numeric).
+"""
+import cmath
+import sys
+from fractions import Fraction
+from math import exp, gcd, log, pi, sqrt
+
 def find_eigenvalues(poly):
     """Tìm các trị riêng từ đa thức đặc trưng (chỉ xét nghiệm thực)"""
     # Đa thức đặc trưng có các hệ số theo lũy thừa giảm dần
@@ -11,8 +29,11 @@ def find_eigenvalues(poly):
     if len(poly) <= 1:
         return {}
     
-    # Chuẩn hóa đa thức để hệ số cao nhất là 1
-    poly = [coef / poly[0] for coef in poly]
+    # Chuẩn hóa đa thức để hệ số cao nhất là 1 (hệ số nguyên/phân số được giữ chính xác)
+    if _is_exact_polynomial(poly):
+        poly = [Fraction(coef) / poly[0] for coef in poly]
+    else:
+        poly = [coef / poly[0] for coef in poly]
     
     # Tìm nghiệm của đa thức bằng phương pháp cải tiến
     roots_with_multiplicity = find_polynomial_roots_with_multiplicity(poly)
@@ -54,235 +75,420 @@ def find_polynomial_roots_with_multiplicity(poly, tol=1e-10):
             # Đa thức có nghiệm phức, nhưng ta chỉ quan tâm đến nghiệm thực
             return []
     
-    # Với đa thức bậc 3 trở lên, sử dụng phương pháp tìm nghiệm và xác định bội
+    # Với đa thức bậc 3 trở lên
     else:
+        # Hệ số thực: nghiệm bội bị sai số tách ra (có thể thành cặp nghiệm phức),
+        # bội được xác định bằng số thực
+        if not _is_exact_polynomial(poly):
+            return find_real_roots_numeric(poly)
+
+        # Hệ số nguyên/phân số: phân tích chính xác thành các nhân tử không có nghiệm bội,
+        # nghiệm của nhân tử thứ k có bội k, rồi cô lập nghiệm bằng dãy Sturm
         roots_with_multiplicity = []
-        working_poly = poly.copy()
-        
-        while len(working_poly) > 1:  # Đa thức có bậc ít nhất là 1
-            # Tìm một nghiệm
-            roots = find_real_roots_with_bisection(working_poly)
-            if not roots:
-                break  # Không tìm thấy nghiệm thực nào khác
-            
-            root = roots[0]  # Lấy một nghiệm đã tìm được
-            
-            # Xác định bội của nghiệm bằng cách kiểm tra đạo hàm
-            multiplicity = 0
-            current_poly = working_poly.copy()
-            
-            while len(current_poly) > 1:
-                # Kiểm tra nếu root là nghiệm của đa thức hiện tại
-                value = evaluate_polynomial(current_poly, root)
-                if abs(value) > tol:
-                    break
-                
-                multiplicity += 1
-                current_poly = derivative_polynomial(current_poly)
-            
-            # Thêm nghiệm và bội số vào kết quả
-            roots_with_multiplicity.append((root, multiplicity))
-            
-            # Giảm bậc đa thức bằng cách chia cho (x - root)^multiplicity
-            for _ in range(multiplicity):
-                working_poly = polynomial_deflation(working_poly, root)
-        
+        for factor, multiplicity in square_free_decomposition(poly):
+            for root in find_real_roots_with_sturm(factor, tol):
+                roots_with_multiplicity.append((root, multiplicity))
+
+        roots_with_multiplicity.sort(key=lambda item: item[0])
         return roots_with_multiplicity
 
-def polynomial_deflation(poly, root):
-    """Chia đa thức cho (x - root) bằng thuật toán Horner"""
+def evaluate_polynomial(poly, x):
+    """Tính giá trị của đa thức tại x"""
+    result = 0
+    for coef in poly:
+        result = result * x + coef
+    return result
+
+def derivative_polynomial(poly):
+    """Tính đạo hàm của đa thức"""
     n = len(poly)
     if n <= 1:
-        return []
+        return [0]
     
-    result = [poly[0]]
-    for i in range(1, n - 1):
-        result.append(poly[i] + result[i-1] * root)
+    deriv = []
+    for i in range(n - 1):
+        deriv.append((n - i - 1) * poly[i])
     
-    # Kiểm tra phần dư (remainder) gần 0
-    remainder = poly[n-1] + result[n-2] * root
-    if abs(remainder) > 1e-8:
-        print(f"Cảnh báo: Phần dư khi chia đa thức cho (x - {root}) không gần 0: {remainder}")
+    return deriv
+
+# ===== Cô lập nghiệm thực bằng dãy Sturm =====
+
+def _is_exact_polynomial(poly):
+    """Kiểm tra các hệ số đều là số nguyên hoặc phân số"""
+    return all(isinstance(c, (int, Fraction)) for c in poly)
+
+def _trim_polynomial(poly):
+    """Loại bỏ các hệ số 0 ở đầu (đa thức 0 trả về [])"""
+    start = 0
+    while start < len(poly) and poly[start] == 0:
+        start += 1
+    return list(poly[start:])
+
+def _subtract_polynomial(p1, p2):
+    """Tính p1 - p2 (hệ số theo lũy thừa giảm dần)"""
+    n = max(len(p1), len(p2))
+    p1 = [0] * (n - len(p1)) + list(p1)
+    p2 = [0] * (n - len(p2)) + list(p2)
+    return [x - y for x, y in zip(p1, p2)]
+
+def polynomial_divmod(a, b):
+    """Chia đa thức a cho b, trả về (thương, phần dư)"""
+    a = list(a)
+    if not b or b[0] == 0:
+        raise ValueError("Không thể chia cho đa thức 0")
     
-    return result
+    q_len = len(a) - len(b) + 1
+    if q_len <= 0:
+        return [0], a
+    
+    quotient = []
+    for i in range(q_len):
+        coef = a[i] / b[0]
+        quotient.append(coef)
+        if coef != 0:
+            for j in range(1, len(b)):
+                a[i + j] -= coef * b[j]
+    
+    return quotient, a[q_len:]
+
+def polynomial_gcd(a, b):
+    """Ước chung lớn nhất (monic) của hai đa thức hệ số hữu tỉ bằng thuật toán Euclid"""
+    a = _trim_polynomial([Fraction(c) for c in a])
+    b = _trim_polynomial([Fraction(c) for c in b])
+    while b:
+        a, b = b, _trim_polynomial(polynomial_divmod(a, b)[1])
+    return [c / a[0] for c in a]
 
-# def find_polynomial_roots(poly):
-#     """Tìm nghiệm thực của đa thức"""
-#     n = len(poly) - 1  # Bậc của đa thức
+def square_free_decomposition(poly):
+    """
+    Phân tích đa thức hệ số hữu tỉ thành tích các nhân tử không có nghiệm bội (thuật toán Yun):
+    poly = c * f_1 * f_2^2 * f_3^3 * ...
+    Trả về danh sách (f_k, k) với các f_k khác hằng số.
+    """
+    poly = _trim_polynomial([Fraction(c) for c in poly])
+    if len(poly) <= 1:
+        return []
     
-#     # Với đa thức bậc 1: ax + b = 0
-#     if n == 1:
-#         return [-poly[1] / poly[0]]
+    deriv = derivative_polynomial(poly)
+    g = polynomial_gcd(poly, deriv)
+    b = polynomial_divmod(poly, g)[0]
+    c = polynomial_divmod(deriv, g)[0]
+    d = _subtract_polynomial(c, derivative_polynomial(b))
     
-#     # Với đa thức bậc 2: ax^2 + bx + c = 0, dùng công thức nghiệm
-#     elif n == 2:
-#         a, b, c = poly
-#         delta = b**2 - 4*a*c
-        
-#         if abs(delta) < 1e-10:  # Delta gần 0
-#             return [-b / (2*a), -b / (2*a)]
-#         elif delta > 0:
-#             sqrt_delta = delta**0.5
-#             return [(-b + sqrt_delta) / (2*a), (-b - sqrt_delta) / (2*a)]
-#         else:
-#             # Đa thức có nghiệm phức, nhưng ta chỉ quan tâm đến nghiệm thực
-#             return []
+    factors = []
+    k = 1
+    while len(b) > 1:
+        a = polynomial_gcd(b, d)
+        if len(a) > 1:
+            factors.append((a, k))
+            b = polynomial_divmod(b, a)[0]
+        c = polynomial_divmod(d, a)[0]
+        d = _subtract_polynomial(c, derivative_polynomial(b))
+        k += 1
     
-#     # Với đa thức bậc 3 trở lên, sử dụng phương pháp lặp
-#     else:
-#         return find_real_roots_with_bisection(poly)
+    return factors
 
-def evaluate_polynomial(poly, x):
-    """Tính giá trị của đa thức tại x"""
-    result = 0
-    for coef in poly:
-        result = result * x + coef
-    return result
+def _integer_polynomial(poly):
+    """Nhân đa thức với một số dương để được các hệ số nguyên nguyên tố cùng nhau"""
+    fractions = [Fraction(c) for c in poly]
+    denominator = 1
+    for f in fractions:
+        denominator = denominator * f.denominator // gcd(denominator, f.denominator)
+    return _primitive_part([int(f * denominator) for f in fractions])
 
-def find_real_roots_with_bisection(poly, range_min=-100, range_max=100, steps=1000, tol=1e-10):
-    """Tìm nghiệm thực của đa thức bằng phương pháp chia đôi"""
-    roots = []
-    step_size = (range_max - range_min) / steps
+def _primitive_part(poly):
+    """Chia đa thức hệ số nguyên cho ước chung dương của các hệ số"""
+    content = 0
+    for c in poly:
+        content = gcd(content, c)
+    if content > 1:
+        poly = [c // content for c in poly]
+    return poly
+
+def _pseudo_remainder(a, b):
+    """
+    Phần dư giả của phép chia đa thức nguyên a cho b, nhân với một số DƯƠNG
+    (|lc(b)|^k) nên giữ nguyên dấu so với phần dư thật
+    """
+    a = list(a)
+    lead = b[0]
+    lead_abs = abs(lead)
+    sign = 1 if lead > 0 else -1
+    while len(a) >= len(b):
+        factor = a[0] * sign
+        a = [lead_abs * x for x in a]
+        for j in range(1, len(b)):
+            a[j] -= factor * b[j]
+        a = _trim_polynomial(a[1:])
+    return a
+
+def sturm_sequence(poly):
+    """
+    Dãy Sturm p0 = p, p1 = p', p_{k+1} = -rem(p_{k-1}, p_k) tính chính xác trên số nguyên:
+    mỗi phần tử chỉ sai khác phần tử thật một hằng số dương nên số lần đổi dấu không đổi
+    """
+    p = _integer_polynomial(poly)
+    sequence = [p, _primitive_part(derivative_polynomial(p))]
     
-    # Tìm các khoảng có thể chứa nghiệm
-    x_prev = range_min
-    y_prev = evaluate_polynomial(poly, x_prev)
+    while len(sequence[-1]) > 1:
+        r = _pseudo_remainder(sequence[-2], sequence[-1])
+        if not r:
+            break
+        sequence.append(_primitive_part([-c for c in r]))
     
-    for i in range(1, steps + 1):
-        x_curr = range_min + i * step_size
-        y_curr = evaluate_polynomial(poly, x_curr)
-        
-        # Kiểm tra xem có đổi dấu hay không
-        if y_prev * y_curr <= 0:
-            # Tìm nghiệm chính xác hơn bằng phương pháp chia đôi
-            root = bisection_method(poly, x_prev, x_curr, tol)
-            # Kiểm tra xem nghiệm này đã có trong danh sách chưa
-            is_duplicate = False
-            for existing_root in roots:
-                if abs(root - existing_root) < tol:
-                    is_duplicate = True
-                    break
-            if not is_duplicate:
-                roots.append(root)
-        
-        x_prev = x_curr
-        y_prev = y_curr
+    return sequence
+
+def _sign_at(poly, x):
+    """Dấu của đa thức nguyên tại số hữu tỉ x (tính bằng số nguyên)"""
+    num, den = x.numerator, x.denominator
+    value = 0
+    den_power = 1
+    for c in poly:
+        value = value * num + c * den_power
+        den_power *= den
+    return (value > 0) - (value < 0)
+
+def sign_variations(sequence, x):
+    """Số lần đổi dấu của dãy Sturm tại x (bỏ qua các giá trị 0)"""
+    x = Fraction(x)
+    count = 0
+    prev_sign = 0
+    for p in sequence:
+        sign = _sign_at(p, x)
+        if sign == 0:
+            continue
+        if prev_sign and sign != prev_sign:
+            count += 1
+        prev_sign = sign
+    return count
+
+def _log_abs(x):
+    """log|x|, tính được cả với số nguyên/phân số quá lớn để đổi sang float"""
+    if isinstance(x, Fraction):
+        return log(abs(x.numerator)) - log(x.denominator)
+    return log(abs(x))
+
+def root_bound(poly):
+    """Cận trên cho trị tuyệt đối các nghiệm: min(cận Cauchy, cận Fujiwara)"""
+    n = len(poly) - 1
+    # Tính theo logarit của |c_k / c_0| để không tràn số với hệ số nguyên rất lớn
+    log_lead = _log_abs(poly[0])
+    log_ratios = [_log_abs(c) - log_lead if c != 0 else float('-inf') for c in poly[1:]]
     
-    # Tìm nghiệm dùng phương pháp Newton để tăng độ chính xác
-    refined_roots = []
-    for root in roots:
-        refined_root = newton_method(poly, root, tol)
-        # Kiểm tra xem nghiệm tinh chỉnh đã có trong danh sách chưa
-        is_duplicate = False
-        for existing_root in refined_roots:
-            if abs(refined_root - existing_root) < tol:
-                is_duplicate = True
-                break
-        if not is_duplicate:
-            refined_roots.append(refined_root)
+    fujiwara_terms = [log_ratios[k - 1] / k for k in range(1, n)]
+    fujiwara_terms.append((log_ratios[n - 1] - log(2)) / n)
+    largest = max(fujiwara_terms)
+    if largest > 700:
+        # Vượt quá phạm vi float: dùng cận Cauchy tính bằng số nguyên
+        lead = abs(Fraction(poly[0]))
+        return 1 + max(-(-abs(Fraction(c)) // lead) for c in poly[1:])
     
-    return refined_roots
+    fujiwara = 2 * exp(largest)
+    cauchy = 1 + exp(max(log_ratios)) if max(log_ratios) < 700 else fujiwara
+    return min(cauchy, fujiwara)
 
-def bisection_method(poly, a, b, tol=1e-10, max_iter=100):
-    """Tìm nghiệm của đa thức trong khoảng [a, b] bằng phương pháp chia đôi"""
-    fa = evaluate_polynomial(poly, a)
-    fb = evaluate_polynomial(poly, b)
+def isolate_real_roots(poly):
+    """
+    Cô lập các nghiệm thực phân biệt của đa thức bằng định lý Sturm.
+    Hệ số thực được đổi chính xác sang số hữu tỉ nên việc đếm nghiệm không bị sai số.
+    Trả về danh sách khoảng (a, b) tăng dần (a, b là Fraction), mỗi khoảng chứa đúng
+    một nghiệm và p(a), p(b) khác 0.
+    """
+    sequence = sturm_sequence(poly)
+    p = sequence[0]
     
-    # Kiểm tra xem khoảng có chứa nghiệm không
-    if fa * fb > 0:
-        # Không có nghiệm trong khoảng hoặc có số chẵn nghiệm
-        return (a + b) / 2
+    bound = Fraction(int(root_bound(poly)) + 1)
+    lo, hi = -bound, bound
     
-    # Nếu một trong hai đầu mút là nghiệm
-    if abs(fa) < tol:
-        return a
-    if abs(fb) < tol:
-        return b
+    # Theo định lý Sturm, số nghiệm phân biệt trong (a, b] là V(a) - V(b)
+    intervals = []
+    stack = [(lo, hi, sign_variations(sequence, lo), sign_variations(sequence, hi))]
     
-    # Thực hiện phương pháp chia đôi
-    for _ in range(max_iter):
-        c = (a + b) / 2
-        fc = evaluate_polynomial(poly, c)
-        
-        if abs(fc) < tol:
-            return c
+    while stack:
+        a, b, va, vb = stack.pop()
+        count = va - vb
+        if count <= 0:
+            continue
+        if count == 1:
+            intervals.append((a, b))
+            continue
         
-        if fa * fc < 0:
-            b = c
-            fb = fc
-        else:
-            a = c
-            fa = fc
-        
-        # Điều kiện dừng
-        if (b - a) < tol:
-            return (a + b) / 2
+        # Chọn điểm chia gần trung điểm sao cho không trùng nghiệm
+        half = (b - a) / 2
+        m = a + half
+        shift = 2
+        while _sign_at(p, m) == 0:
+            m = a + half + half / 2 ** shift
+            shift += 1
+        vm = sign_variations(sequence, m)
+        stack.append((m, b, vm, vb))
+        stack.append((a, m, va, vm))
     
-    return (a + b) / 2
+    intervals.sort(key=lambda interval: interval[0])
+    return intervals
 
-def newton_method(poly, x0, tol=1e-10, max_iter=100):
-    """Tìm nghiệm của đa thức bằng phương pháp Newton"""
-    x = x0
+def safeguarded_newton(poly, a, b, tol=1e-12, max_iter=100):
+    """
+    Tìm nghiệm đơn trong khoảng [a, b] (p(a), p(b) trái dấu) bằng phương pháp Newton,
+    quay về chia đôi khi bước Newton ra khỏi khoảng đang giữ nghiệm.
+    Với hệ số nguyên/phân số, giá trị đa thức được tính chính xác tại mỗi điểm.
+    """
+    if _is_exact_polynomial(poly):
+        f = lambda x: float(evaluate_polynomial(poly, Fraction(x)))
+    else:
+        f = lambda x: evaluate_polynomial(poly, x)
+    deriv = [float(c) for c in derivative_polynomial(poly)]
+    a, b = float(a), float(b)
     
+    fa = f(a)
+    if fa == 0:
+        return a
+    if f(b) == 0:
+        return b
+    
+    x = (a + b) / 2
     for _ in range(max_iter):
-        # Tính giá trị của đa thức và đạo hàm tại x
-        f_x = evaluate_polynomial(poly, x)
-        
-        if abs(f_x) < tol:
+        fx = f(x)
+        if fx == 0:
             return x
         
-        # Tính đạo hàm
-        df_x = 0
-        for i in range(len(poly) - 1):
-            df_x = df_x * x + (len(poly) - i - 1) * poly[i]
-        
-        if abs(df_x) < tol:  # Tránh chia cho 0
-            break
+        # Thu hẹp khoảng chứa nghiệm
+        if (fx < 0) == (fa < 0):
+            a, fa = x, fx
+        else:
+            b = x
         
-        # Áp dụng công thức Newton
-        x_new = x - f_x / df_x
+        dfx = evaluate_polynomial(deriv, x)
+        x_new = x - fx / dfx if dfx != 0 else a
+        if not a < x_new < b:
+            x_new = (a + b) / 2
         
-        # Kiểm tra hội tụ
-        if abs(x_new - x) < tol:
+        if abs(x_new - x) <= tol * (1 + abs(x)):
             return x_new
-        
         x = x_new
     
     return x
 
-def derivative_polynomial(poly):
-    """Tính đạo hàm của đa thức"""
-    n = len(poly)
-    if n <= 1:
-        return [0]
-    
-    deriv = []
-    for i in range(n - 1):
-        deriv.append((n - i - 1) * poly[i])
+def find_real_roots_with_sturm(poly, tol=1e-10):
+    """Tìm các nghiệm thực phân biệt (tăng dần) của đa thức không có nghiệm bội"""
+    poly = _trim_polynomial(poly)
+    if len(poly) <= 1:
+        return []
     
-    return deriv
+    return [safeguarded_newton(poly, a, b, min(tol, 1e-12)) for a, b in isolate_real_roots(poly)]
 
-def find_real_roots_with_newton(poly, initial_guesses=None, tol=1e-10):
-    """Tìm nghiệm thực của đa thức bằng phương pháp Newton với nhiều giá trị ban đầu"""
-    if initial_guesses is None:
-        # Tạo các giá trị ban đầu trong khoảng [-10, 10]
-        initial_guesses = [-10 + i for i in range(21)]
-    
-    roots = []
-    
-    for guess in initial_guesses:
-        root = newton_method(poly, guess, tol)
-        
-        # Kiểm tra xem đây có phải là nghiệm thực không
-        f_root = evaluate_polynomial(poly, root)
-        if abs(f_root) < tol:
-            # Kiểm tra xem nghiệm này đã có trong danh sách chưa
-            is_duplicate = False
-            for existing_root in roots:
-                if abs(root - existing_root) < tol:
-                    is_duplicate = True
-                    break
-            if not is_duplicate:
-                roots.append(root)
-    
-    return roots
\ No newline at end of file
+
+
+# ===== Nghiệm bội của đa thức hệ số thực =====
+
+EPS = sys.float_info.epsilon
+RESIDUAL_TOL = sqrt(EPS)  # Sai số tương đối cho phép của giá trị đa thức (và các đạo hàm) tại nghiệm
+CLUSTER_TOL = 1e-3        # Khoảng cách (tương đối) lớn nhất ban đầu để gộp các nghiệm thành một nhóm
+
+def relative_residual(poly, x):
+    """|p(x)| / Σ|c_k||x|^k: sai số tương đối của giá trị đa thức tại x"""
+    scale = evaluate_polynomial([abs(c) for c in poly], abs(x))
+    return abs(evaluate_polynomial(poly, x)) / scale if scale else 0.0
+
+def aberth_roots(poly, max_iter=500):
+    """
+    Tất cả các nghiệm phức của đa thức hệ số thực bằng phương pháp Aberth - Ehrlich
+    (mọi nghiệm được cập nhật đồng thời, mỗi nghiệm bị "đẩy" khỏi các nghiệm còn lại).
+    """
+    poly = [float(c) / float(poly[0]) for c in poly]
+    n = len(poly) - 1
+    deriv = derivative_polynomial(poly)
+    radius = min(root_bound(poly), 1e100)
+    # Điểm xuất phát trên đường tròn chứa mọi nghiệm, lệch góc để không đối xứng qua trục thực
+    roots = [radius * cmath.exp(1j * (2 * pi * k / n + 0.4)) for k in range(n)]
+
+    for _ in range(max_iter):
+        converged = True
+        for k in range(n):
+            z = roots[k]
+            if relative_residual(poly, z) <= 4 * n * EPS:
+                continue
+            converged = False
+            try:
+                ratio = evaluate_polynomial(poly, z) / evaluate_polynomial(deriv, z)
+                repulsion = sum(1 / (z - w) for j, w in enumerate(roots) if j != k)
+                roots[k] = z - ratio / (1 - ratio * repulsion)
+            except ZeroDivisionError:
+                # Đạo hàm bằng 0 hoặc hai nghiệm trùng nhau: dịch nhẹ điểm đang xét
+                roots[k] = z + RESIDUAL_TOL * (1 + abs(z)) * cmath.exp(1j * k)
+        if converged:
+            break
+
+    return roots
+
+def _cluster(roots, tol):
+    """Chia các nghiệm phức thành nhóm: hai nghiệm cách nhau <= tol * (1 + |z|) thuộc cùng một nhóm"""
+    clusters = []
+    for z in roots:
+        radius = tol * (1 + abs(z))
+        merged = [z]
+        rest = []
+        for cluster in clusters:
+            if any(abs(z - w) <= radius for w in cluster):
+                merged.extend(cluster)
+            else:
+                rest.append(cluster)
+        clusters = rest + [merged]
+    return clusters
+
+def _cluster_center(poly, cluster, tol=RESIDUAL_TOL):
+    """
+    Tâm của nhóm m nghiệm nếu đó là nghiệm bội m của poly, ngược lại None.
+    Nghiệm bội m là nghiệm đơn của đạo hàm cấp m - 1 nên tâm được tính bằng Newton trên đạo hàm đó
+    (xuất phát từ trung bình của nhóm); các đạo hàm cấp 0..m-1 tại tâm đều phải có sai số tương đối <= tol.
+    """
+    m = len(cluster)
+    derivs = [poly]
+    for _ in range(m - 1):
+        derivs.append(derivative_polynomial(derivs[-1]))
+    top, top_deriv = derivs[-1], derivative_polynomial(derivs[-1])
+
+    center = sum(cluster) / m
+    for _ in range(50):
+        slope = evaluate_polynomial(top_deriv, center)
+        if slope == 0:
+            break
+        step = evaluate_polynomial(top, center) / slope
+        center -= step
+        if abs(step) <= EPS * (1 + abs(center)):
+            break
+
+    if all(relative_residual(d, center) <= tol for d in derivs):
+        return center
+    return None
+
+def find_real_roots_numeric(poly, tol=RESIDUAL_TOL):
+    """
+    Nghiệm thực kèm bội của đa thức hệ số thực (float), tăng dần.
+    Nghiệm bội m bị sai số tách thành m nghiệm (thực hoặc phức) cách nhau cỡ eps^(1/m), nên:
+    tìm mọi nghiệm phức (Aberth - Ehrlich), gộp các nghiệm gần nhau thành nhóm và chỉ nhận nhóm
+    là nghiệm bội khi tâm thỏa mãn đa thức gốc cùng các đạo hàm (sai số tương đối <= tol ~ sqrt(eps));
+    nhóm không thỏa mãn được chia lại với khoảng cách nhỏ hơn.
+    """
+    poly = _trim_polynomial(poly)
+    roots_with_multiplicity = []
+    stack = [(cluster, CLUSTER_TOL) for cluster in _cluster(aberth_roots(poly), CLUSTER_TOL)]
+
+    while stack:
+        cluster, link = stack.pop()
+        center = _cluster_center(poly, cluster, tol)
+        if center is None:
+            if len(cluster) > 1:
+                link /= 10
+                parts = _cluster(cluster, link) if link > EPS else [[z] for z in cluster]
+                stack.extend((part, link) for part in parts)
+            else:
+                print(f"Cảnh báo: Bỏ qua nghiệm {cluster[0]} không thỏa mãn đa thức (sai số tương đối "
+                      f"{relative_residual(poly, cluster[0]):.2e})")
+            continue
+        # Chỉ giữ nghiệm thực
+        if abs(center.imag) <= tol * (1 + abs(center)):
+            roots_with_multiplicity.append((center.real, len(cluster)))
+
+    roots_with_multiplicity.sort(key=lambda item: item[0])
+    return roots_with_multiplicity
@@ -0,0 +1,165 @@
+from dataset import check_folds, fold_bounds, shuffled_order
+from linalg import cholesky, cholesky_solve, dot, forward_substitution
+from stats import ResidualStats
+from streaming_ols import StreamingOLS
+
+
+def fold_assignment(n_samples, n_folds=5, random_seed=42):
+    """
+    Số thứ tự fold của từng mẫu, chia giống hệt kfold_cross_validation trong notebook
+    (random.seed(random_seed) rồi random.shuffle, các fold đầu nhận thêm phần dư).
+    """
+    check_folds(n_samples, n_folds)
+    order = shuffled_order(n_samples, random_seed)
+
+    folds = [0] * n_samples
+    for fold, (start, stop) in enumerate(fold_bounds(n_samples, n_folds)):
+        for i in order[start:stop]:
+            folds[i] = fold
+    return folds
+
+
+class FoldStatistics:
+    """
+    Các tổng Σx, Σx², Σxy (cho từng đặc trưng), Σy, Σy² và số mẫu của từng fold,
+    tính trong một lần duyệt dữ liệu. Dữ liệu được trừ đi giá trị của mẫu đầu tiên
+    trước khi cộng dồn để tránh mất chính xác khi phương sai nhỏ so với giá trị trung bình.
+    """
+
+    def __init__(self, X_all, y, folds, n_folds):
+        n_features = len(X_all[0])
+        self.n_folds = n_folds
+        self.n_features = n_features
+        self.count = [0] * n_folds
+        self.sum_y = [0.0] * n_folds
+        self.sum_yy = [0.0] * n_folds
+        self.sum_x = [[0.0] * n_features for _ in range(n_folds)]
+        self.sum_xx = [[0.0] * n_features for _ in range(n_folds)]
+        self.sum_xy = [[0.0] * n_features for _ in range(n_folds)]
+
+        shift_x = list(X_all[0])
+        shift_y = y[0]
+        features = range(n_features)
+        for row, target, f in zip(X_all, y, folds):
+            dy = target - shift_y
+            self.count[f] += 1
+            self.sum_y[f] += dy
+            self.sum_yy[f] += dy * dy
+            sx, sxx, sxy = self.sum_x[f], self.sum_xx[f], self.sum_xy[f]
+            for j in features:
+                dx = row[j] - shift_x[j]
+                sx[j] += dx
+                sxx[j] += dx * dx
+                sxy[j] += dx * dy
+
+        self.shift_x = shift_x
+        self.shift_y = shift_y
+
+    def _sums(self, j, fold, exclude):
+        """(n, Σx, Σy, Σx², Σxy, Σy²) của fold (exclude=False) hoặc của các fold còn lại (exclude=True)"""
+        if exclude:
+            folds = [f for f in range(self.n_folds) if f != fold]
+        else:
+            folds = [fold]
+        return (sum(self.count[f] for f in folds),
+                sum(self.sum_x[f][j] for f in folds),
+                sum(self.sum_y[f] for f in folds),
+                sum(self.sum_xx[f][j] for f in folds),
+                sum(self.sum_xy[f][j] for f in folds),
+                sum(self.sum_yy[f] for f in folds))
+
+    def fit(self, j, fold):
+        """
+        Hồi quy y = beta_0 + beta_1 * x_j trên các fold còn lại (tập huấn luyện).
+        Trả về hệ số theo dữ liệu đã dịch (beta_0 cho dy, beta_1)
+        """
+        n, sx, sy, sxx, sxy, _ = self._sums(j, fold, exclude=True)
+        sxx_c = sxx - sx * sx / n
+        sxy_c = sxy - sx * sy / n
+        beta_1 = sxy_c / sxx_c if sxx_c > 0 else 0.0
+        beta_0 = (sy - beta_1 * sx) / n
+        return beta_0, beta_1
+
+    def evaluate(self, j, fold):
+        """MSE, R^2 và chuẩn vector phần dư trên fold kiểm tra, tính từ các tổng"""
+        beta_0, beta_1 = self.fit(j, fold)
+        n, sx, sy, sxx, sxy, syy = self._sums(j, fold, exclude=False)
+        # RSS = Σ(dy - b0 - b1*dx)²
+        rss = (syy - 2 * beta_0 * sy - 2 * beta_1 * sxy
+               + n * beta_0 * beta_0 + 2 * beta_0 * beta_1 * sx + beta_1 * beta_1 * sxx)
+        rss = max(rss, 0.0)
+        tss = syy - sy * sy / n
+        mse = rss / n
+        r_squared = 1 - rss / tss if tss > 0 else 0.0
+        return mse, r_squared, rss ** 0.5
+
+    def coefficients(self, j, fold):
+        """Hệ số (beta_0, beta_1) theo dữ liệu gốc của mô hình huấn luyện khi bỏ fold ra"""
+        beta_0, beta_1 = self.fit(j, fold)
+        return beta_0 + self.shift_y - beta_1 * self.shift_x[j], beta_1
+
+
+def rank_features_by_cv(X_all, y, feature_names, k=10, random_seed=42):
+    """
+    Xếp hạng các đặc trưng theo hiệu suất k-fold Cross Validation của mô hình một đặc trưng.
+    Kết quả giống rank_features_by_cv trong notebook nhưng chỉ duyệt dữ liệu một lần:
+    mô hình của mỗi fold được tính từ (tổng toàn bộ - tổng của fold).
+    Trả về list (tên đặc trưng, MSE trung bình, R^2 trung bình, chuẩn phần dư trung bình),
+    sắp xếp theo R^2 giảm dần.
+    """
+    folds = fold_assignment(len(y), n_folds=k, random_seed=random_seed)
+    stats = FoldStatistics(X_all, y, folds, k)
+
+    feature_scores = []
+    for j, name in enumerate(feature_names):
+        results = [stats.evaluate(j, fold) for fold in range(k)]
+        avg_mse = sum(r[0] for r in results) / k
+        avg_r2 = sum(r[1] for r in results) / k
+        avg_residuals_norm = sum(r[2] for r in results) / k
+        feature_scores.append((name, avg_mse, avg_r2, avg_residuals_norm))
+
+    feature_scores.sort(key=lambda x: x[2], reverse=True)
+    return feature_scores
+
+
+def loo_residuals(X, y, fit_intercept=True, tol=1e-12):
+    """
+    Phần dư leave-one-out của mô hình OLS trên (X, y) mà chỉ cần huấn luyện một lần:
+        e_(i) = e_i / (1 - h_ii),   h_ii = x_i^T (X^T X)^(-1) x_i = ||L^(-1) x_i||^2
+    với X^T X = L L^T (Cholesky), nên không cần tạo ma trận hat n x n.
+    Trả về list các phần dư e_(i) = y_i - y_hat_(i) (y_hat_(i) dự đoán khi bỏ mẫu i ra).
+    """
+    # X, y được duyệt hai lần (thống kê rồi phần dư) nên iterator được đọc vào list trước
+    if not hasattr(X, '__getitem__'):
+        X = list(X)
+    if not hasattr(y, '__getitem__'):
+        y = list(y)
+    estimator = StreamingOLS(fit_intercept)
+    estimator.partial_fit(X, y)
+    # Một phân tích Cholesky dùng cho cả hệ số và h_ii
+    L = cholesky(estimator.xtx)
+    beta = cholesky_solve(L, estimator.xty)
+
+    residuals = []
+    for row, target in zip(X, y):
+        x = [1.0] + list(row) if fit_intercept else row
+        z = forward_substitution(L, x)
+        leverage = dot(z, z)
+        if 1 - leverage < tol:
+            raise ValueError("Có mẫu với h_ii = 1: bỏ mẫu này ra thì mô hình không xác định")
+        residuals.append((target - dot(beta, x)) / (1 - leverage))
+    return residuals
+
+
+def leave_one_out_cv(X, y, fit_intercept=True):
+    """
+    Leave-one-out Cross Validation cho mô hình OLS nhiều đặc trưng, chi phí tương đương một lần huấn luyện.
+    Trả về MSE (PRESS / n), R^2 (1 - PRESS / TSS) và chuẩn vector phần dư LOO,
+    giống evaluate_model(y, các dự đoán leave-one-out).
+    """
+    # y được dùng lại sau loo_residuals nên iterator được đọc vào list trước
+    if not hasattr(y, '__getitem__'):
+        y = list(y)
+    residuals = loo_residuals(X, y, fit_intercept)
+    predictions = [target - e for target, e in zip(y, residuals)]
+    return ResidualStats().update(y, predictions).metrics()
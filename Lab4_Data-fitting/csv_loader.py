@@ -0,0 +1,224 @@
+"""
+Đọc file CSV theo cột với bộ nhớ đệm nhị phân.
+
+Lần đọc đầu tiên: chuẩn hóa tên cột (bỏ dấu ngoặc kép như trong wine.csv), suy luận kiểu dữ liệu
+của từng cột (int, float hoặc phân loại), mã hóa one-hot các cột phân loại (ví dụ region),
+rồi ghi toàn bộ các cột vào một file nhị phân có khóa là mã băm SHA-256 của file nguồn.
+Các lần sau chỉ cần ánh xạ file nhị phân vào bộ nhớ (mmap): các cột là memoryview trỏ thẳng
+vào file, không phân tích cú pháp và không sao chép dữ liệu.
+
+Ví dụ:
+    table = load_csv('wine.csv')
+    y = table['quality']
+    X_rows = table.rows(table.names[1:])
+"""
+import csv
+import hashlib
+import json
+import mmap
+import os
+import struct
+
+MAGIC = b'COLCACHE'
+VERSION = 1
+DEFAULT_CACHE_DIR = '.csv_cache'
+
+
+def clean_header(name):
+    """Loại bỏ dấu ngoặc kép và khoảng trắng thừa trong tên cột (wine.csv có dạng \"\"\"quality\"\"\")"""
+    return name.replace('"', '').strip()
+
+
+def file_hash(path, block_size=1 << 20):
+    """Mã băm SHA-256 của nội dung file"""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def infer_type(values):
+    """Kiểu dữ liệu của một cột: 'int', 'float' hoặc 'category' (ô trống được coi là thiếu giá trị)"""
+    kind = 'int'
+    for value in values:
+        if value == '':
+            kind = 'float'  # Giá trị thiếu được lưu là NaN
+            continue
+        if kind == 'int':
+            try:
+                int(value)
+                continue
+            except ValueError:
+                kind = 'float'
+        try:
+            float(value)
+        except ValueError:
+            return 'category'
+    return kind
+
+
+class ColumnarTable:
+    """
+    Bảng dữ liệu lưu theo cột. Mỗi cột số là một memoryview (kiểu 'd' hoặc 'q'),
+    cột phân loại đã được thay bằng các cột one-hot tên dạng 'region_North'.
+    """
+
+    def __init__(self, names, columns, n_rows, categories=None, source=None, _mmap=None):
+        self.names = list(names)
+        self.columns = dict(zip(self.names, columns))
+        self.n_rows = n_rows
+        self.categories = categories or {}
+        self.source = source
+        self._mmap = _mmap
+
+    def __len__(self):
+        return self.n_rows
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def __contains__(self, name):
+        return name in self.columns
+
+    def __repr__(self):
+        return f"ColumnarTable({self.n_rows} hàng, cột={self.names})"
+
+    def rows(self, names=None):
+        """Duyệt từng hàng (tuple) của các cột names mà không tạo bản sao của cả bảng"""
+        columns = [self.columns[name] for name in (names or self.names)]
+        return zip(*columns)
+
+    def matrix(self, names=None):
+        """Ma trận dạng list of lists (có sao chép), dùng cho các hàm cũ cần list"""
+        return [list(row) for row in self.rows(names)]
+
+    def close(self):
+        """Giải phóng ánh xạ bộ nhớ của file đệm (các memoryview không còn dùng được)"""
+        if self._mmap is not None:
+            for column in self.columns.values():
+                column.release()
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _parse(path, categorical=None, one_hot=True, drop_first=True):
+    """Đọc CSV, trả về (danh sách (tên, kiểu, giá trị)), số hàng, các mức của cột phân loại)"""
+    with open(path, newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = [clean_header(name) for name in next(reader)]
+        raw = [[] for _ in header]
+        for row in reader:
+            if not row:
+                continue
+            for column, value in zip(raw, row):
+                column.append(value.strip())
+    n_rows = len(raw[0]) if raw else 0
+
+    output = []
+    categories = {}
+    for name, values in zip(header, raw):
+        kind = 'category' if categorical and name in categorical else infer_type(values)
+        if kind == 'int':
+            output.append((name, 'q', [int(v) for v in values]))
+        elif kind == 'float':
+            output.append((name, 'd', [float(v) if v != '' else float('nan') for v in values]))
+        elif one_hot:
+            # Bỏ mức đầu tiên (drop_first) để không phụ thuộc tuyến tính với cột hệ số chặn
+            levels = sorted(set(values))
+            categories[name] = levels
+            for level in levels[1 if drop_first else 0:]:
+                output.append((f"{name}_{level}", 'd', [1.0 if v == level else 0.0 for v in values]))
+        else:
+            levels = sorted(set(values))
+            categories[name] = levels
+            index = {level: i for i, level in enumerate(levels)}
+            output.append((name, 'q', [index[v] for v in values]))
+    return output, n_rows, categories
+
+
+def _write_cache(cache_path, columns, n_rows, categories, source_hash):
+    """
+    Ghi file đệm: MAGIC, độ dài phần mô tả (JSON), phần mô tả, rồi dữ liệu các cột liên tiếp
+    (mỗi cột bắt đầu ở vị trí chia hết cho 8 để cast memoryview trực tiếp)
+    """
+    meta = {'version': VERSION, 'source': source_hash, 'n_rows': n_rows,
+            'categories': categories, 'columns': []}
+    offset = 0
+    for name, code, _ in columns:
+        meta['columns'].append({'name': name, 'type': code, 'offset': offset})
+        offset += 8 * n_rows
+    header = json.dumps(meta, ensure_ascii=False).encode('utf-8')
+    start = len(MAGIC) + 8 + len(header)
+    padding = (-start) % 8
+
+    os.makedirs(os.path.dirname(cache_path) or '.', exist_ok=True)
+    temp_path = cache_path + '.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(MAGIC)
+        f.write(struct.pack('<Q', len(header) + padding))
+        f.write(header + b' ' * padding)
+        for _, code, values in columns:
+            f.write(struct.pack(f'<{n_rows}{code}', *values))
+    os.replace(temp_path, cache_path)  # Ghi xong mới đổi tên để không đọc phải file dở dang
+
+
+def _open_cache(cache_path, source_path=None):
+    """Ánh xạ file đệm vào bộ nhớ, trả về ColumnarTable (các cột trỏ thẳng vào file)"""
+    with open(cache_path, 'rb') as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if mm[:len(MAGIC)] != MAGIC:
+        mm.close()
+        raise ValueError(f"File đệm không hợp lệ: {cache_path}")
+    (header_size,) = struct.unpack_from('<Q', mm, len(MAGIC))
+    data_start = len(MAGIC) + 8 + header_size
+    meta = json.loads(mm[len(MAGIC) + 8:data_start].decode('utf-8'))
+    if meta.get('version') != VERSION:
+        mm.close()
+        raise ValueError(f"Phiên bản file đệm không hỗ trợ: {cache_path}")
+
+    n_rows = meta['n_rows']
+    buffer = memoryview(mm)
+    names, columns = [], []
+    for column in meta['columns']:
+        start = data_start + column['offset']
+        names.append(column['name'])
+        columns.append(buffer[start:start + 8 * n_rows].cast(column['type']))
+    buffer.release()
+    return ColumnarTable(names, columns, n_rows, meta['categories'], source_path, mm)
+
+
+def cache_path_for(path, cache_dir=None, options=''):
+    """Đường dẫn file đệm: <cache_dir>/<tên file>.<băm của nội dung và tùy chọn>.bin"""
+    digest = hashlib.sha256((file_hash(path) + options).encode()).hexdigest()[:32]
+    cache_dir = cache_dir or os.path.join(os.path.dirname(os.path.abspath(path)), DEFAULT_CACHE_DIR)
+    return os.path.join(cache_dir, f"{os.path.basename(path)}.{digest}.bin")
+
+
+def load_csv(path, categorical=None, one_hot=True, drop_first=True, cache=True, cache_dir=None):
+    """
+    Đọc file CSV thành ColumnarTable.
+        categorical: các cột luôn coi là phân loại (mặc định tự nhận các cột không phải số)
+        one_hot: mã hóa one-hot cột phân loại (False: thay bằng mã số nguyên 0, 1, ...)
+        drop_first: bỏ mức đầu tiên khi mã hóa one-hot (tránh phụ thuộc tuyến tính với hệ số chặn)
+        cache: dùng/ghi file đệm nhị phân (khóa là mã băm của file nguồn và các tùy chọn)
+    """
+    if not cache:
+        columns, n_rows, categories = _parse(path, categorical, one_hot, drop_first)
+        from array import array
+        return ColumnarTable([c[0] for c in columns],
+                             [memoryview(array(c[1], c[2])) for c in columns],
+                             n_rows, categories, path)
+
+    options = json.dumps([sorted(categorical or []), one_hot, drop_first])
+    cache_path = cache_path_for(path, cache_dir, options)
+    if not os.path.exists(cache_path):
+        columns, n_rows, categories = _parse(path, categorical, one_hot, drop_first)
+        _write_cache(cache_path, columns, n_rows, categories, file_hash(path))
+    return _open_cache(cache_path, path)
@@ -0,0 +1,195 @@
+"""
+Các khung nhìn (view) dữ liệu theo chỉ số, không sao chép hàng.
+
+IndexedView giữ tham chiếu tới dữ liệu gốc và một mảng chỉ số gọn (array('q')); các hàm huấn luyện
+và đánh giá duyệt trực tiếp qua view như duyệt một list. kfold sinh các fold lần lượt (generator),
+tập huấn luyện của mỗi fold là "thứ tự xáo trộn trừ đi đoạn [start, stop)" nên không cần tạo
+indices[:start] + indices[stop:]. Cách gọi random.seed / random.shuffle giữ nguyên như notebook
+nên các fold và phép chia train/test giống hệt kết quả cũ.
+"""
+import random
+from array import array
+from collections.abc import Sequence
+from itertools import chain
+
+
+def check_folds(n_samples, n_folds):
+    """Kiểm tra điều kiện chia fold (cùng thông báo lỗi với kfold_cross_validation)"""
+    if n_samples <= 0:
+        raise ValueError("Số lượng mẫu phải lớn hơn 0")
+    if n_folds <= 1:
+        raise ValueError("Số lượng fold phải lớn hơn 1")
+    if n_folds > n_samples:
+        raise ValueError("Số lượng fold không thể lớn hơn số lượng mẫu")
+
+
+def shuffled_order(n_samples, random_seed=42):
+    """Thứ tự xáo trộn các chỉ số 0..n-1 sau random.seed(random_seed), dạng array('q')"""
+    random.seed(random_seed)
+    indices = list(range(n_samples))
+    random.shuffle(indices)
+    return array('q', indices)
+
+
+def fold_bounds(n_samples, n_folds):
+    """Vị trí (start, stop) của từng fold trong thứ tự xáo trộn, các fold đầu nhận thêm phần dư"""
+    fold_sizes = [n_samples // n_folds] * n_folds
+    for i in range(n_samples % n_folds):
+        fold_sizes[i] += 1
+    bounds = []
+    current = 0
+    for fold_size in fold_sizes:
+        bounds.append((current, current + fold_size))
+        current += fold_size
+    return bounds
+
+
+class ExcludedSpan(Sequence):
+    """Dãy order bỏ đi đoạn [start, stop), không tạo bản sao"""
+
+    __slots__ = ('order', 'start', 'stop')
+
+    def __init__(self, order, start, stop):
+        self.order = memoryview(order)
+        self.start = start
+        self.stop = stop
+
+    def __len__(self):
+        return len(self.order) - (self.stop - self.start)
+
+    def __getitem__(self, k):
+        if isinstance(k, slice):
+            return array('q', (self[i] for i in range(*k.indices(len(self)))))
+        if k < 0:
+            k += len(self)
+        if not 0 <= k < len(self):
+            raise IndexError("Chỉ số nằm ngoài phạm vi")
+        return self.order[k] if k < self.start else self.order[k + self.stop - self.start]
+
+    def __iter__(self):
+        return chain(self.order[:self.start], self.order[self.stop:])
+
+
+class IndexedView(Sequence):
+    """
+    Dãy base[i] với i lần lượt thuộc indices. Cắt lát (slice) hoặc lấy view của view
+    chỉ tạo mảng chỉ số mới, không sao chép phần tử.
+    """
+
+    __slots__ = ('base', 'indices')
+
+    def __init__(self, base, indices):
+        if isinstance(base, IndexedView):
+            indices = array('q', (base.indices[i] for i in indices))
+            base = base.base
+        self.base = base
+        self.indices = indices
+
+    def __len__(self):
+        return len(self.indices)
+
+    def __getitem__(self, k):
+        if isinstance(k, slice):
+            return IndexedView(self.base, self.indices[k])
+        return self.base[self.indices[k]]
+
+    def __iter__(self):
+        return map(self.base.__getitem__, self.indices)
+
+    def __repr__(self):
+        return f"IndexedView({len(self)} phần tử)"
+
+    def tolist(self):
+        """Sao chép thành list (chỉ dùng khi hàm cũ bắt buộc cần list)"""
+        return list(self)
+
+
+class TableRows(Sequence):
+    """Truy cập theo hàng vào một ColumnarTable (hoặc các cột cùng độ dài), mỗi hàng là một tuple"""
+
+    __slots__ = ('columns',)
+
+    def __init__(self, table, names=None):
+        if hasattr(table, 'columns') and isinstance(table.columns, dict):
+            names = names or table.names
+            self.columns = [table[name] for name in names]
+        else:
+            self.columns = list(table)
+
+    def __len__(self):
+        return len(self.columns[0])
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return IndexedView(self, range(len(self))[i])
+        return tuple(column[i] for column in self.columns)
+
+    def __iter__(self):
+        return zip(*self.columns)
+
+
+def get_subset_by_indices(data, indices):
+    """View các phần tử data[i] với i thuộc indices (thay cho list mới)"""
+    if not isinstance(indices, (array, ExcludedSpan, range, memoryview)):
+        indices = array('q', indices)
+    return IndexedView(data, indices)
+
+
+def kfold(n_samples, n_folds=5, random_seed=42):
+    """
+    Sinh lần lượt (train_indices, test_indices) cho từng fold, giống kfold_cross_validation trong notebook.
+    random.seed và random.shuffle được gọi ngay khi gọi hàm (như bản cũ), chỉ các fold được sinh dần.
+    """
+    check_folds(n_samples, n_folds)
+    order = shuffled_order(n_samples, random_seed)
+    bounds = fold_bounds(n_samples, n_folds)
+
+    def folds():
+        view = memoryview(order)
+        for start, stop in bounds:
+            yield ExcludedSpan(order, start, stop), view[start:stop]
+
+    return folds()
+
+
+class Dataset:
+    """Cặp (X, y) dạng view: X, y là list/IndexedView/TableRows, hai view con dùng chung dữ liệu gốc"""
+
+    def __init__(self, X, y):
+        if len(X) != len(y):
+            raise ValueError("Số hàng của X phải bằng độ dài của y")
+        self.X = X
+        self.y = y
+
+    @classmethod
+    def from_table(cls, table, target, features=None):
+        """Từ ColumnarTable: target là tên cột mục tiêu, features là các cột đặc trưng (mặc định các cột còn lại)"""
+        features = features or [name for name in table.names if name != target]
+        return cls(TableRows(table, features), table[target])
+
+    def __len__(self):
+        return len(self.y)
+
+    def subset(self, indices):
+        """Dataset con gồm các mẫu có chỉ số indices (không sao chép hàng)"""
+        if not isinstance(indices, (array, ExcludedSpan, range, memoryview)):
+            indices = array('q', indices)
+        return Dataset(IndexedView(self.X, indices), IndexedView(self.y, indices))
+
+    def folds(self, n_folds=5, random_seed=42):
+        """Sinh lần lượt (tập huấn luyện, tập kiểm tra) của k-fold Cross Validation"""
+        for train_indices, test_indices in kfold(len(self), n_folds, random_seed):
+            yield self.subset(train_indices), self.subset(test_indices)
+
+    def train_test_split(self, test_ratio=0.2, random_seed=42):
+        """(tập huấn luyện, tập kiểm tra), chia giống train_test_split trong notebook"""
+        order = shuffled_order(len(self), random_seed)
+        test_size = int(len(self) * test_ratio)
+        view = memoryview(order)
+        return self.subset(view[test_size:]), self.subset(view[:test_size])
+
+
+def train_test_split(X, y, test_ratio=0.2, random_seed=42):
+    """Chia dữ liệu thành X_train, X_test, y_train, y_test (các view) giống train_test_split trong notebook"""
+    train, test = Dataset(X, y).train_test_split(test_ratio, random_seed)
+    return train.X, test.X, train.y, test.y
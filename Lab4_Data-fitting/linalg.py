@@ -0,0 +1,97 @@
+from operator import mul
+
+
+def dot(u, v):
+    """Tích vô hướng của hai vector"""
+    return sum(map(mul, u, v))
+
+
+def cholesky(A):
+    """
+    Phân tích Cholesky A = L * L^T của ma trận đối xứng xác định dương A.
+    Trả về ma trận tam giác dưới L (list of lists), lỗi ValueError nếu A không xác định dương.
+    """
+    n = len(A)
+    L = [[0.0] * n for _ in range(n)]
+    for i in range(n):
+        row_i = L[i]
+        for j in range(i + 1):
+            row_j = L[j]
+            s = A[i][j] - dot(row_i[:j], row_j[:j])
+            if i == j:
+                if s <= 0:
+                    raise ValueError("Ma trận không xác định dương (các đặc trưng phụ thuộc tuyến tính?)")
+                row_i[i] = s ** 0.5
+            else:
+                row_i[j] = s / row_j[j]
+    return L
+
+
+def forward_substitution(L, b):
+    """Giải Lx = b với L là ma trận tam giác dưới"""
+    x = []
+    for i, row in enumerate(L):
+        x.append((b[i] - dot(row[:i], x)) / row[i])
+    return x
+
+
+def back_substitution_transposed(L, b):
+    """Giải L^T x = b với L là ma trận tam giác dưới (không tạo L^T)"""
+    n = len(L)
+    x = [0.0] * n
+    for i in range(n - 1, -1, -1):
+        s = b[i]
+        for k in range(i + 1, n):
+            s -= L[k][i] * x[k]
+        x[i] = s / L[i][i]
+    return x
+
+
+def cholesky_solve(L, b):
+    """Giải Ax = b khi đã có A = L * L^T"""
+    return back_substitution_transposed(L, forward_substitution(L, b))
+
+
+def spd_inverse(A):
+    """Ma trận nghịch đảo của ma trận đối xứng xác định dương A qua phân tích Cholesky"""
+    L = cholesky(A)
+    n = len(A)
+    columns = [cholesky_solve(L, [1.0 if i == j else 0.0 for i in range(n)]) for j in range(n)]
+    return [[columns[j][i] for j in range(n)] for i in range(n)]
+
+
+def symmetric_eigen(A, tol=1e-12, max_sweeps=100):
+    """
+    Phân tích trị riêng A = V diag(w) V^T của ma trận đối xứng bằng phương pháp quay Jacobi.
+    Trả về (w, V) với V[i][k] là thành phần i của vector riêng thứ k (các cột trực chuẩn).
+    """
+    n = len(A)
+    A = [list(map(float, row)) for row in A]
+    V = [[1.0 if i == j else 0.0 for j in range(n)] for i in range(n)]
+    scale = sum(A[i][i] ** 2 for i in range(n)) ** 0.5 or 1.0
+    for _ in range(max_sweeps):
+        off = sum(A[i][j] ** 2 for i in range(n) for j in range(i + 1, n)) ** 0.5
+        if off <= tol * scale:
+            break
+        for p in range(n - 1):
+            for q in range(p + 1, n):
+                if A[p][q] == 0.0:
+                    continue
+                # Góc quay triệt tiêu A[p][q]
+                theta = (A[q][q] - A[p][p]) / (2 * A[p][q])
+                t = (1.0 if theta >= 0 else -1.0) / (abs(theta) + (theta * theta + 1) ** 0.5)
+                c = 1 / (t * t + 1) ** 0.5
+                s = t * c
+                for k in range(n):
+                    akp, akq = A[k][p], A[k][q]
+                    A[k][p] = c * akp - s * akq
+                    A[k][q] = s * akp + c * akq
+                for k in range(n):
+                    apk, aqk = A[p][k], A[q][k]
+                    A[p][k] = c * apk - s * aqk
+                    A[q][k] = s * apk + c * aqk
+                for row in V:
+                    vkp, vkq = row[p], row[q]
+                    row[p] = c * vkp - s * vkq
+                    row[q] = s * vkp + c * vkq
+    return [A[i][i] for i in range(n)], V
@@ -0,0 +1,139 @@
+"""
+Mô hình tuyến tính đã huấn luyện dùng để dự đoán theo lô.
+
+Hệ số được lưu trong array('d'), hệ số chặn được cộng ngầm nên không cần tạo [1] + row cho mỗi hàng.
+Dữ liệu có thể là list, generator hoặc các khối (chunk) đọc dần từ file; việc dự đoán
+chạy theo luồng (streaming) nên không cần giữ toàn bộ bảng trong bộ nhớ.
+Hệ số được lưu/nạp bằng một file nhị phân nhỏ để dự đoán mà không phải huấn luyện lại.
+"""
+import json
+import struct
+from array import array
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from operator import mul
+
+MAGIC = b'OLSMODEL'
+VERSION = 1
+
+
+class LinearModel:
+    """
+    y_hat = intercept + Σ coef[j] * x[j]
+    Tạo từ list hệ số của ols (hệ số chặn đứng đầu) bằng LinearModel.from_coefficients
+    hoặc từ StreamingOLS bằng LinearModel.from_estimator.
+    """
+
+    def __init__(self, coef, intercept=0.0, feature_names=None):
+        self.coef = array('d', coef)
+        self.intercept = float(intercept)
+        self.feature_names = list(feature_names) if feature_names is not None else None
+        if self.feature_names is not None and len(self.feature_names) != len(self.coef):
+            raise ValueError("Số tên đặc trưng phải bằng số hệ số")
+
+    @classmethod
+    def from_coefficients(cls, coefficients, feature_names=None, fit_intercept=True):
+        """Từ kết quả của ols (list hệ số hoặc vector cột [[b0], [b1], ...], b0 là hệ số chặn)"""
+        values = [c[0] if isinstance(c, list) else c for c in coefficients]
+        if fit_intercept:
+            return cls(values[1:], values[0], feature_names)
+        return cls(values, 0.0, feature_names)
+
+    @classmethod
+    def from_estimator(cls, estimator):
+        """Từ một StreamingOLS đã huấn luyện"""
+        coef = estimator.coef_ if estimator.coef_ is not None else estimator.solve()
+        return cls.from_coefficients(coef, estimator.feature_names, estimator.fit_intercept)
+
+    @property
+    def n_features(self):
+        return len(self.coef)
+
+    def __repr__(self):
+        return f"LinearModel(intercept={self.intercept}, coef={self.coef.tolist()})"
+
+    def _width_error(self, row):
+        return ValueError(f"Số đặc trưng của hàng ({len(row)}) khác số hệ số ({self.n_features})")
+
+    def predict_one(self, row):
+        """Dự đoán cho một hàng"""
+        if len(row) != len(self.coef):
+            raise self._width_error(row)
+        return self.intercept + sum(map(mul, row, self.coef))
+
+    def predict_iter(self, rows):
+        """Dự đoán lần lượt cho từng hàng của một iterable (generator), trả về generator"""
+        coef, intercept = self.coef, self.intercept
+        n = len(coef)
+        for row in rows:
+            if len(row) != n:
+                raise self._width_error(row)
+            yield intercept + sum(map(mul, row, coef))
+
+    def _predict_block(self, rows):
+        """Dự đoán cho một khối hàng (list hoặc generator, chỉ duyệt một lần), trả về array('d')"""
+        return array('d', self.predict_iter(rows))
+
+    def predict_chunks(self, chunks):
+        """Dự đoán cho từng khối hàng (ví dụ X_chunk của read_csv_chunks), sinh ra array('d') cho mỗi khối"""
+        for chunk in chunks:
+            yield self._predict_block(chunk)
+
+    def predict(self, X, chunk_size=10000, threads=1):
+        """
+        Dự đoán cho cả tập X (list các hàng hoặc iterable), trả về list.
+        threads > 1: các khối chunk_size hàng được chia cho nhiều luồng
+        (có ích khi các hàng là memoryview/mmap hoặc khi chạy trên trình thông dịch không có GIL);
+        chỉ tối đa 2 * threads khối được đọc trước nên X vẫn được đọc dần.
+        """
+        if threads <= 1:
+            return list(self.predict_iter(X))
+
+        def blocks():
+            iterator = iter(X)
+            while True:
+                block = list(islice(iterator, chunk_size))
+                if not block:
+                    return
+                yield block
+
+        predictions = []
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            for block in blocks():
+                pending.append(executor.submit(self._predict_block, block))
+                if len(pending) >= 2 * threads:
+                    predictions.extend(pending.popleft().result())
+            while pending:
+                predictions.extend(pending.popleft().result())
+        return predictions
+
+    def save(self, path):
+        """
+        Lưu mô hình: MAGIC, (phiên bản, số hệ số, độ dài tên), tên đặc trưng (JSON),
+        hệ số chặn và các hệ số dạng double little-endian
+        """
+        names = json.dumps(self.feature_names, ensure_ascii=False).encode('utf-8')
+        with open(path, 'wb') as f:
+            f.write(MAGIC)
+            f.write(struct.pack('<III', VERSION, len(self.coef), len(names)))
+            f.write(names)
+            f.write(struct.pack(f'<{len(self.coef) + 1}d', self.intercept, *self.coef))
+
+    @classmethod
+    def load(cls, path):
+        """Nạp mô hình đã lưu bằng save"""
+        with open(path, 'rb') as f:
+            data = f.read()
+        if data[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"File mô hình không hợp lệ: {path}")
+        offset = len(MAGIC)
+        version, n_coef, names_size = struct.unpack_from('<III', data, offset)
+        if version != VERSION:
+            raise ValueError(f"Phiên bản file mô hình không hỗ trợ: {version}")
+        offset += 12
+        feature_names = json.loads(data[offset:offset + names_size].decode('utf-8'))
+        offset += names_size
+        values = struct.unpack_from(f'<{n_coef + 1}d', data, offset)
+        return cls(values[1:], values[0], feature_names)
@@ -0,0 +1,362 @@
+"""
+Tìm tập đặc trưng tốt nhất cho mô hình OLS: vét cạn (exhaustive), tiến (forward) và lùi (backward).
+
+Mỗi tập ứng viên được đánh giá bằng k-fold Cross Validation chỉ từ ma trận Gram của từng fold
+(cột hằng số 1, các đặc trưng và y), không cần duyệt lại dữ liệu:
+    Gram huấn luyện = Gram toàn bộ - Gram của fold kiểm tra.
+Khi thêm hoặc bớt một đặc trưng, ma trận nghịch đảo của Gram được cập nhật hạng một trong O(k^2)
+thay vì tính lại từ đầu. Dữ liệu và ma trận Gram được đặt trong bộ nhớ dùng chung
+(multiprocessing.shared_memory) để các tiến trình con đọc trực tiếp, không phải pickle.
+"""
+import os
+import time
+from array import array
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+
+from cross_validation import fold_assignment
+from linalg import dot, spd_inverse
+
+
+# ===== Bộ nhớ dùng chung =====
+
+def _create_shared(values):
+    """Tạo vùng nhớ dùng chung chứa các số thực values, trả về SharedMemory"""
+    values = array('d', values)
+    shm = SharedMemory(create=True, size=max(len(values), 1) * values.itemsize)
+    view = shm.buf.cast('d')
+    view[:len(values)] = values
+    view.release()
+    return shm
+
+
+_worker = {}  # Các vùng nhớ đã gắn (và Evaluator) của tiến trình hiện tại
+
+
+def _shared_view(name):
+    """View (memoryview số thực, không sao chép) của vùng nhớ dùng chung name"""
+    if name not in _worker:
+        shm = SharedMemory(name=name)
+        _worker[name] = (shm, shm.buf.cast('d'))
+    return _worker[name][1]
+
+
+def _release_shared():
+    """Đóng mọi vùng nhớ dùng chung đã gắn trong tiến trình hiện tại"""
+    for key in list(_worker):
+        value = _worker.pop(key)
+        if isinstance(value, tuple):
+            shm, view = value
+            view.release()
+            shm.close()
+
+
+# ===== Ma trận Gram của từng fold =====
+
+def _partial_grams(task):
+    """Ma trận Gram mở rộng [1, x_1..x_p, y] của từng fold trên các hàng [start, stop)"""
+    data_name, n_cols, n_folds, start, stop = task
+    data = _shared_view(data_name)
+    size = n_cols + 1  # Thêm cột hằng số 1
+    grams = [[0.0] * (size * size) for _ in range(n_folds)]
+
+    # Mỗi hàng lưu: fold, x_1..x_p, y (đã dịch theo hàng đầu tiên)
+    width = n_cols + 1
+    for i in range(start, stop):
+        row = data[i * width:(i + 1) * width].tolist()
+        gram = grams[int(row[0])]
+        v = [1.0] + row[1:]
+        for a in range(size):
+            v_a = v[a]
+            if v_a == 0.0:
+                continue
+            base = a * size
+            for b in range(a, size):
+                gram[base + b] += v_a * v[b]
+    return grams
+
+
+def _unflatten(flat, size):
+    """Chuyển ma trận đối xứng đã lưu nửa trên dạng phẳng về list of lists đầy đủ"""
+    M = [flat[i * size:(i + 1) * size] for i in range(size)]
+    for i in range(size):
+        for j in range(i):
+            M[i][j] = M[j][i]
+    return M
+
+
+class _Evaluator:
+    """Đánh giá các tập đặc trưng từ ma trận Gram của từng fold"""
+
+    def __init__(self, gram_values, n_folds, size):
+        block = size * size
+        self.folds = [_unflatten(gram_values[f * block:(f + 1) * block], size) for f in range(n_folds)]
+        total = [[sum(G[i][j] for G in self.folds) for j in range(size)] for i in range(size)]
+        self.train = [[[total[i][j] - G[i][j] for j in range(size)] for i in range(size)]
+                      for G in self.folds]
+        self.y = size - 1
+
+    def inverses(self, cols):
+        """Nghịch đảo Gram huấn luyện (theo các cột cols) của từng fold, None nếu suy biến"""
+        try:
+            return [spd_inverse([[T[i][j] for j in cols] for i in cols]) for T in self.train]
+        except ValueError:
+            return None
+
+    def add(self, inverses, cols, j):
+        """Cập nhật nghịch đảo khi thêm cột j (công thức bù Schur), None nếu suy biến"""
+        result = []
+        for T, B in zip(self.train, inverses):
+            b = [T[i][j] for i in cols]
+            u = [dot(row, b) for row in B]
+            s = T[j][j] - dot(b, u)
+            if s <= 1e-12 * T[j][j]:
+                return None
+            new = [[B[r][c] + u[r] * u[c] / s for c in range(len(cols))] + [-u[r] / s]
+                   for r in range(len(cols))]
+            new.append([-x / s for x in u] + [1 / s])
+            result.append(new)
+        return result
+
+    @staticmethod
+    def remove(inverses, position):
+        """Cập nhật nghịch đảo khi bỏ cột ở vị trí position: B' = B_-p,-p - b b^T / b_pp"""
+        result = []
+        for B in inverses:
+            b = B[position]
+            d = b[position]
+            keep = [r for r in range(len(B)) if r != position]
+            result.append([[B[r][c] - b[r] * b[c] / d for c in keep] for r in keep])
+        return result
+
+    def score(self, inverses, cols):
+        """MSE, R^2 và chuẩn vector phần dư trung bình trên các fold kiểm tra"""
+        y = self.y
+        total_mse = total_r2 = total_norm = 0.0
+        for T, G, B in zip(self.train, self.folds, inverses):
+            beta = [dot(row, [T[i][y] for i in cols]) for row in B]
+            G_beta = [dot([G[i][j] for j in cols], beta) for i in cols]
+            rss = max(G[y][y] - 2 * dot(beta, [G[i][y] for i in cols]) + dot(beta, G_beta), 0.0)
+            n = G[0][0]
+            tss = G[y][y] - G[0][y] ** 2 / n
+            total_mse += rss / n
+            total_r2 += 1 - rss / tss if tss > 0 else 0.0
+            total_norm += rss ** 0.5
+        k = len(self.folds)
+        return total_mse / k, total_r2 / k, total_norm / k
+
+
+def _evaluator(gram_name, n_folds, size):
+    """Evaluator của tiến trình hiện tại (tạo một lần từ vùng nhớ dùng chung)"""
+    key = ('evaluator', gram_name)
+    if key not in _worker:
+        _worker[key] = _Evaluator(_shared_view(gram_name).tolist(), n_folds, size)
+    return _worker[key]
+
+
+def _gray_batch(task):
+    """
+    Đánh giá các tập con theo mã Gray từ start đến stop - 1: hai tập liên tiếp chỉ khác nhau
+    một đặc trưng nên chỉ cần cập nhật hạng một
+    """
+    gram_name, n_folds, size, start, stop = task
+    ev = _evaluator(gram_name, n_folds, size)
+    results = []
+    cols = None
+    inverses = None
+    for i in range(start, stop):
+        code = i ^ (i >> 1)
+        if code == 0:
+            continue
+        subset = [b + 1 for b in range(size - 2) if code >> b & 1]
+        if inverses is not None:
+            # Bit thay đổi giữa mã Gray i-1 và i là bit thấp nhất của i
+            bit = (i & -i).bit_length()
+            if code >> (bit - 1) & 1:
+                inverses = ev.add(inverses, cols, bit)
+                cols = cols + [bit]
+            else:
+                position = cols.index(bit)
+                inverses = ev.remove(inverses, position)
+                cols = cols[:position] + cols[position + 1:]
+        if inverses is None:
+            cols = [0] + subset
+            inverses = ev.inverses(cols)
+            if inverses is None:
+                continue
+        results.append((tuple(sorted(cols[1:])),) + ev.score(inverses, cols))
+    return results
+
+
+def _step_batch(task):
+    """Đánh giá các tập current +/- một đặc trưng (bước của forward/backward)"""
+    gram_name, n_folds, size, current, candidates, adding = task
+    ev = _evaluator(gram_name, n_folds, size)
+    cols = [0] + list(current)
+    base = ev.inverses(cols)
+    results = []
+    for j in candidates:
+        if adding:
+            inverses = ev.add(base, cols, j) if base is not None else None
+            new_cols = cols + [j]
+            if inverses is None:
+                inverses = ev.inverses(new_cols)
+        else:
+            position = cols.index(j)
+            new_cols = cols[:position] + cols[position + 1:]
+            inverses = ev.remove(base, position) if base is not None else ev.inverses(new_cols)
+        if inverses is None:
+            continue
+        results.append((tuple(sorted(new_cols[1:])),) + ev.score(inverses, new_cols))
+    return results
+
+
+def print_progress(done, total, elapsed, best):
+    """In tiến độ sau mỗi lô ứng viên"""
+    line = f"Lô {done}/{total} - {elapsed:.2f}s"
+    if best is not None:
+        line += f" - R^2 tốt nhất: {best[2]:.5f}"
+    print(line)
+
+
+class ModelSearch:
+    """
+    Tìm tập đặc trưng tốt nhất theo R^2 trung bình của k-fold Cross Validation
+    (các fold giống kfold_cross_validation của notebook với cùng random_seed).
+    processes = 0 chạy tuần tự trong tiến trình hiện tại; ngược lại dùng Pool(processes).
+    Kết quả là list (tên các đặc trưng, MSE, R^2, chuẩn phần dư) giống rank_features_by_cv.
+    Dùng với câu lệnh with (hoặc gọi close()) để giải phóng bộ nhớ dùng chung.
+    """
+
+    def __init__(self, X_all, y, feature_names, k=10, random_seed=42,
+                 processes=None, batch_size=64, progress=print_progress):
+        self.feature_names = list(feature_names)
+        self.n_features = len(self.feature_names)
+        self.k = k
+        self.batch_size = batch_size
+        self.progress = progress
+        self.size = self.n_features + 2  # [1, x_1..x_p, y]
+
+        # Dữ liệu dùng chung: mỗi hàng gồm fold, x_1..x_p, y (dịch theo hàng đầu để giữ độ chính xác)
+        folds = fold_assignment(len(y), n_folds=k, random_seed=random_seed)
+        shift = list(X_all[0]) + [y[0]]
+        flat = array('d')
+        for row, target, fold in zip(X_all, y, folds):
+            flat.append(fold)
+            flat.extend([v - s for v, s in zip(list(row) + [target], shift)])
+        self.n_samples = len(y)
+        self._data = _create_shared(flat)
+        del flat
+
+        # Số tiến trình thực tế (0 là chạy tuần tự)
+        self.processes = 0 if processes == 0 else processes or os.cpu_count() or 1
+        self._pool = Pool(self.processes) if self.processes else None
+        self._gram = None
+        self._gram = _create_shared(self._compute_grams())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Dừng các tiến trình con và giải phóng bộ nhớ dùng chung"""
+        _release_shared()
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+        for shm in (self._data, self._gram):
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+        self._data = self._gram = None
+
+    def _map(self, func, tasks):
+        """Chạy func trên từng lô, báo cáo tiến độ sau mỗi lô, trả về các kết quả theo thứ tự xong"""
+        start = time.perf_counter()
+        if self._pool is None:
+            results = map(func, tasks)
+        else:
+            results = self._pool.imap_unordered(func, tasks)
+        best = None
+        for done, batch in enumerate(results, 1):
+            for result in batch if isinstance(batch, list) else []:
+                if best is None or result[2] > best[2]:
+                    best = result
+            if self.progress is not None and func is not _partial_grams:
+                self.progress(done, len(tasks), time.perf_counter() - start, best)
+            yield batch
+
+    def _compute_grams(self):
+        """Tính ma trận Gram của từng fold song song trên các khối hàng"""
+        n_cols = self.n_features + 1
+        step = max(1, -(-self.n_samples // (4 * max(self.processes, 1))))
+        tasks = [(self._data.name, n_cols, self.k, start, min(start + step, self.n_samples))
+                 for start in range(0, self.n_samples, step)]
+        total = [[0.0] * (self.size * self.size) for _ in range(self.k)]
+        for grams in self._map(_partial_grams, tasks):
+            for acc, gram in zip(total, grams):
+                for i, value in enumerate(gram):
+                    acc[i] += value
+        return [value for gram in total for value in gram]
+
+    def _named(self, results):
+        """Đổi chỉ số cột sang tên đặc trưng, sắp xếp theo R^2 giảm dần"""
+        named = [(tuple(self.feature_names[j - 1] for j in cols), mse, r2, norm)
+                 for cols, mse, r2, norm in results]
+        named.sort(key=lambda x: x[2], reverse=True)
+        return named
+
+    def exhaustive(self, max_features=None):
+        """Đánh giá mọi tập con khác rỗng (tối đa max_features đặc trưng), sắp xếp theo R^2 giảm dần"""
+        total = 1 << self.n_features
+        tasks = [(self._gram.name, self.k, self.size, start, min(start + self.batch_size, total))
+                 for start in range(0, total, self.batch_size)]
+        results = [r for batch in self._map(_gray_batch, tasks) for r in batch
+                   if max_features is None or len(r[0]) <= max_features]
+        return self._named(results)
+
+    def _stepwise(self, current, adding, stop_size):
+        path = []
+        while len(current) != stop_size:
+            if adding:
+                candidates = [j for j in range(1, self.n_features + 1) if j not in current]
+            else:
+                candidates = list(current)
+            tasks = [(self._gram.name, self.k, self.size, tuple(current),
+                      candidates[start:start + self.batch_size], adding)
+                     for start in range(0, len(candidates), self.batch_size)]
+            results = [r for batch in self._map(_step_batch, tasks) for r in batch]
+            if not results:
+                break
+            best = max(results, key=lambda r: r[2])
+            current = list(best[0])
+            path.append(best)
+        return [self._named([r])[0] for r in path]
+
+    def forward(self, max_features=None):
+        """
+        Chọn tiến: mỗi bước thêm đặc trưng làm R^2 tăng nhiều nhất.
+        Trả về đường đi (tập tốt nhất ở mỗi số đặc trưng 1, 2, ..., max_features)
+        """
+        return self._stepwise([], True, max_features or self.n_features)
+
+    def backward(self, min_features=1):
+        """
+        Loại lùi: bắt đầu từ mọi đặc trưng, mỗi bước bỏ đặc trưng làm R^2 giảm ít nhất.
+        Trả về đường đi (tập tốt nhất ở mỗi số đặc trưng p-1, p-2, ..., min_features),
+        phần tử đầu tiên là mô hình đầy đủ
+        """
+        full = list(range(1, self.n_features + 1))
+        ev = _evaluator(self._gram.name, self.k, self.size)
+        cols = [0] + full
+        inverses = ev.inverses(cols)
+        first = [(tuple(full),) + ev.score(inverses, cols)] if inverses is not None else []
+        return self._named(first) + self._stepwise(full, False, min_features)
+
+
+def best_subset(results):
+    """Tập đặc trưng có R^2 lớn nhất trong kết quả của exhaustive/forward/backward"""
+    return max(results, key=lambda r: r[2])
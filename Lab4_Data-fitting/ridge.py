@@ -0,0 +1,178 @@
+"""
+Đường hồi quy Ridge (beta(lambda) = (X^T X + lambda I)^(-1) X^T y) từ một lần phân tích.
+
+Dữ liệu được trừ trung bình (hệ số chặn không bị phạt), sau đó X^T X = V diag(d) V^T được phân tích
+trị riêng một lần và lưu lại. Trong hệ tọa độ riêng, với c = V^T X^T y:
+    beta(lambda) = V a,  a_k = c_k / (d_k + lambda)
+    RSS(lambda)  = y^T y - 2 Σ a_k c_k + Σ d_k a_k^2
+    df(lambda)   = Σ d_k / (d_k + lambda)
+    GCV(lambda)  = n * RSS / (n - 1 - df)^2   (trừ thêm 1 bậc tự do cho hệ số chặn)
+nên mỗi giá trị lambda chỉ tốn O(p) cho GCV (O(p^2) khi cần hệ số theo tọa độ gốc).
+Với k-fold Cross Validation, phân tích của từng fold huấn luyện cũng được lưu lại.
+"""
+from math import log10
+
+from cross_validation import fold_assignment
+from linalg import dot, symmetric_eigen
+
+
+def _centered_moments(X, y, weights=None):
+    """
+    Trung bình của X, y và các tổng đã trừ trung bình S_xx, S_xy, S_yy.
+    weights: list 0/1 chọn các mẫu tham gia (None là tất cả).
+    """
+    rows = [(row, target) for row, target, w in zip(X, y, weights or [1] * len(y)) if w]
+    n = len(rows)
+    p = len(rows[0][0])
+    x_mean = [sum(row[j] for row, _ in rows) / n for j in range(p)]
+    y_mean = sum(target for _, target in rows) / n
+    columns = [[row[j] - x_mean[j] for row, _ in rows] for j in range(p)]
+    dy = [target - y_mean for _, target in rows]
+    sxx = [[dot(columns[i], columns[j]) for j in range(p)] for i in range(p)]
+    sxy = [dot(column, dy) for column in columns]
+    return n, x_mean, y_mean, sxx, sxy, dot(dy, dy)
+
+
+def _test_moments(X, y, members, x_center, y_center):
+    """Các tổng S_xx, S_xy, S_yy của tập kiểm tra, lấy quanh trung bình của tập huấn luyện"""
+    rows = [(row, target) for row, target, m in zip(X, y, members) if m]
+    p = len(x_center)
+    columns = [[row[j] - x_center[j] for row, _ in rows] for j in range(p)]
+    dy = [target - y_center for _, target in rows]
+    sxx = [[dot(columns[i], columns[j]) for j in range(p)] for i in range(p)]
+    sxy = [dot(column, dy) for column in columns]
+    n = len(rows)
+    y_mean = sum(target for _, target in rows) / n
+    tss = sum((target - y_mean) ** 2 for _, target in rows)
+    return n, sxx, sxy, dot(dy, dy), tss
+
+
+class _Decomposition:
+    """Phân tích trị riêng của S_xx và các đại lượng đã xoay sang hệ tọa độ riêng"""
+
+    def __init__(self, n, x_mean, y_mean, sxx, sxy, syy):
+        self.n = n
+        self.x_mean = x_mean
+        self.y_mean = y_mean
+        self.syy = syy
+        self.d, self.V = symmetric_eigen(sxx)
+        self.d = [max(value, 0.0) for value in self.d]
+        p = len(sxy)
+        self.c = [sum(self.V[i][k] * sxy[i] for i in range(p)) for k in range(p)]
+
+    def rotated(self, lam):
+        """Hệ số trong hệ tọa độ riêng a_k = c_k / (d_k + lambda)"""
+        return [c / (d + lam) if d + lam > 0 else 0.0 for c, d in zip(self.c, self.d)]
+
+    def beta(self, lam):
+        a = self.rotated(lam)
+        return [dot(row, a) for row in self.V]
+
+    def rss(self, lam):
+        a = self.rotated(lam)
+        return max(self.syy - 2 * dot(a, self.c) + sum(d * ak * ak for d, ak in zip(self.d, a)), 0.0)
+
+    def df(self, lam):
+        return sum(d / (d + lam) for d in self.d if d + lam > 0)
+
+
+class RidgePath:
+    """
+    Hồi quy Ridge cho cả một dãy giá trị lambda với phân tích được lưu lại.
+    Nên chuẩn hóa X (stats.standardize) trước để mức phạt như nhau giữa các đặc trưng.
+    """
+
+    def __init__(self, X, y, feature_names=None):
+        self.X = X
+        self.y = y
+        self.feature_names = feature_names
+        self._full = _Decomposition(*_centered_moments(X, y))
+        self._folds = {}
+
+    @property
+    def n_samples(self):
+        return self._full.n
+
+    def coefficients(self, lam):
+        """Hệ số [beta_0, beta_1, ..., beta_p] theo dữ liệu gốc (cùng thứ tự với ols)"""
+        beta = self._full.beta(lam)
+        return [self._full.y_mean - dot(beta, self._full.x_mean)] + beta
+
+    def gcv(self, lam):
+        """Generalized Cross Validation: n * RSS / (n - 1 - df)^2, df tính cả hệ số chặn là 1 + df(lambda)"""
+        n = self._full.n
+        residual_df = n - 1 - self._full.df(lam)  # Trừ thêm 1 cho hệ số chặn
+        return n * self._full.rss(lam) / residual_df ** 2 if residual_df > 0 else float('inf')
+
+    def training_metrics(self, lam):
+        """MSE, R^2 và chuẩn phần dư trên dữ liệu huấn luyện"""
+        rss = self._full.rss(lam)
+        return rss / self._full.n, 1 - rss / self._full.syy, rss ** 0.5
+
+    def _fold_data(self, k, random_seed):
+        """Phân tích của từng fold huấn luyện và tổng của fold kiểm tra (tính một lần cho mỗi (k, seed))"""
+        key = (k, random_seed)
+        if key not in self._folds:
+            folds = fold_assignment(len(self.y), n_folds=k, random_seed=random_seed)
+            data = []
+            for fold in range(k):
+                train = [f != fold for f in folds]
+                decomposition = _Decomposition(*_centered_moments(self.X, self.y, train))
+                n, sxx, sxy, syy, tss = _test_moments(self.X, self.y, [not t for t in train],
+                                                     decomposition.x_mean, decomposition.y_mean)
+                V = decomposition.V
+                p = len(sxy)
+                # Xoay tổng của fold kiểm tra sang hệ tọa độ riêng của fold huấn luyện
+                g = [sum(V[i][m] * sxy[i] for i in range(p)) for m in range(p)]
+                sxx_v = [[dot(sxx[i], [V[j][m] for j in range(p)]) for m in range(p)] for i in range(p)]
+                G = [[sum(V[i][a] * sxx_v[i][b] for i in range(p)) for b in range(p)] for a in range(p)]
+                data.append((decomposition, n, G, g, syy, tss))
+            self._folds[key] = data
+        return self._folds[key]
+
+    def cv_metrics(self, lam, k=10, random_seed=42):
+        """
+        MSE, R^2 và chuẩn phần dư trung bình trên k fold kiểm tra
+        (chia fold giống kfold_cross_validation trong notebook)
+        """
+        results = []
+        for decomposition, n, G, g, syy, tss in self._fold_data(k, random_seed):
+            a = decomposition.rotated(lam)
+            rss = max(syy - 2 * dot(a, g) + dot(a, [dot(row, a) for row in G]), 0.0)
+            results.append((rss / n, 1 - rss / tss if tss > 0 else 0.0, rss ** 0.5))
+        return tuple(sum(r[i] for r in results) / len(results) for i in range(3))
+
+    def default_grid(self, n_values=50, low=-6, high=2):
+        """Lưới lambda theo thang log, tỉ lệ với trị riêng lớn nhất của X^T X"""
+        top = max(self._full.d) or 1.0
+        start = log10(top) + low
+        step = (high - low) / (n_values - 1)
+        return [10 ** (start + i * step) for i in range(n_values)]
+
+    def path(self, lambdas=None, cv=None, random_seed=42):
+        """
+        Kết quả cho từng lambda: list (lambda, GCV, bậc tự do hiệu dụng, MSE, R^2, chuẩn phần dư).
+        cv=None: MSE/R^2/chuẩn phần dư trên dữ liệu huấn luyện; cv=k: trung bình k-fold.
+        """
+        results = []
+        for lam in lambdas or self.default_grid():
+            if cv:
+                metrics = self.cv_metrics(lam, cv, random_seed)
+            else:
+                metrics = self.training_metrics(lam)
+            results.append((lam, self.gcv(lam), self._full.df(lam)) + tuple(metrics))
+        return results
+
+    def select(self, lambdas=None, criterion='gcv', k=10, random_seed=42):
+        """
+        Chọn lambda tốt nhất: criterion='gcv' (GCV nhỏ nhất) hoặc 'cv' (R^2 k-fold lớn nhất).
+        Trả về (lambda, hệ số).
+        """
+        lambdas = lambdas or self.default_grid()
+        if criterion == 'gcv':
+            best = min(lambdas, key=self.gcv)
+        elif criterion == 'cv':
+            best = max(lambdas, key=lambda lam: self.cv_metrics(lam, k, random_seed)[1])
+        else:
+            raise ValueError("criterion phải là 'gcv' hoặc 'cv'")
+        return best, self.coefficients(best)
@@ -0,0 +1,203 @@
+"""
+Thống kê một lần duyệt (Welford/Chan) cho dữ liệu dạng hàng.
+
+Dữ liệu được đọc theo từng khối: trong mỗi khối các cột được tính bằng vòng lặp C (sum, map),
+sau đó kết quả của khối được gộp vào kết quả chung bằng công thức Chan:
+    M2 = M2_a + M2_b + delta^2 * n_a * n_b / n,   delta = mean_b - mean_a
+nên mỗi phần tử chỉ được đọc một lần và sai số không tích lũy như khi dùng Σx² - n*mean².
+Hai đối tượng thống kê (từ các khối hoặc luồng khác nhau) gộp được bằng merge.
+
+Các hàm mean, std_dev, standardize, evaluate_model thay thế trực tiếp các hàm cùng tên trong notebook.
+"""
+from itertools import islice, zip_longest
+from math import inf, sqrt
+from numbers import Number
+from operator import mul, sub
+
+CHUNK_SIZE = 4096
+
+
+def _chunks(rows, chunk_size):
+    """Chia một iterable thành các khối tối đa chunk_size phần tử (cắt lát trực tiếp nếu là list/tuple)"""
+    if isinstance(rows, (list, tuple)):
+        for start in range(0, len(rows), chunk_size):
+            yield rows[start:start + chunk_size]
+        return
+    iterator = iter(rows)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _block_moments(values):
+    """(n, mean, M2, min, max) của một khối giá trị"""
+    n = len(values)
+    m = sum(values) / n
+    deviations = [x - m for x in values]
+    return n, m, sum(map(mul, deviations, deviations)), min(values), max(values)
+
+
+def _chan(n_a, mean_a, m2_a, n_b, mean_b, m2_b):
+    """Gộp (n, mean, M2) của hai phần dữ liệu theo công thức Chan"""
+    n = n_a + n_b
+    if n_a == 0:
+        return n_b, mean_b, m2_b
+    delta = mean_b - mean_a
+    return n, mean_a + delta * n_b / n, m2_a + m2_b + delta * delta * n_a * n_b / n
+
+
+class ColumnStats:
+    """
+    Số mẫu, trung bình, M2 (tổng bình phương độ lệch), min và max của từng cột.
+    Phương sai theo tổng thể (chia cho n) giống std_dev trong notebook.
+    """
+
+    def __init__(self, n_features=None):
+        self.count = 0
+        self.n_features = None
+        if n_features is not None:
+            self._init(n_features)
+
+    def _init(self, n_features):
+        self.n_features = n_features
+        self.means = [0.0] * n_features
+        self.m2 = [0.0] * n_features
+        self.minimum = [inf] * n_features
+        self.maximum = [-inf] * n_features
+
+    def update(self, rows, chunk_size=CHUNK_SIZE):
+        """Cộng dồn các hàng (list các vector cùng độ dài) vào thống kê"""
+        for chunk in _chunks(rows, chunk_size):
+            columns = list(zip(*chunk))
+            if self.n_features is None:
+                self._init(len(columns))
+            elif len(columns) != self.n_features:
+                raise ValueError(f"Số cột không khớp: {len(columns)} != {self.n_features}")
+            self._merge_block([_block_moments(column) for column in columns])
+        return self
+
+    def update_vector(self, values, chunk_size=CHUNK_SIZE):
+        """Cộng dồn một vector (coi như một cột duy nhất)"""
+        if self.n_features is None:
+            self._init(1)
+        for chunk in _chunks(values, chunk_size):
+            self._merge_block([_block_moments(chunk)])
+        return self
+
+    def _merge_block(self, moments):
+        count = self.count
+        for j, (n, m, m2, lo, hi) in enumerate(moments):
+            _, self.means[j], self.m2[j] = _chan(count, self.means[j], self.m2[j], n, m, m2)
+            self.minimum[j] = min(self.minimum[j], lo)
+            self.maximum[j] = max(self.maximum[j], hi)
+        self.count += moments[0][0]
+
+    def merge(self, other):
+        """Gộp thống kê của phần dữ liệu khác (khối hoặc luồng khác) vào đối tượng này"""
+        if other.count == 0:
+            return self
+        if self.n_features is None:
+            self._init(other.n_features)
+        elif other.n_features != self.n_features:
+            raise ValueError("Hai thống kê phải có cùng số cột")
+        self._merge_block(list(zip([other.count] * other.n_features, other.means, other.m2,
+                                   other.minimum, other.maximum)))
+        return self
+
+    @property
+    def variances(self):
+        return [m2 / self.count for m2 in self.m2] if self.count else [0.0] * (self.n_features or 0)
+
+    @property
+    def stds(self):
+        return [sqrt(v) for v in self.variances]
+
+
+class ResidualStats:
+    """
+    Thống kê đánh giá mô hình trong một lần duyệt (y_true, y_pred):
+    số mẫu, trung bình và M2 của y_true (TSS = M2), tổng phần dư, RSS, min/max phần dư.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.y_mean = 0.0
+        self.y_m2 = 0.0
+        self.residual_sum = 0.0
+        self.rss = 0.0
+        self.residual_min = inf
+        self.residual_max = -inf
+
+    def update(self, y_true, y_pred, chunk_size=CHUNK_SIZE):
+        """Cộng dồn các cặp (giá trị thật, giá trị dự đoán)"""
+        for truth, predicted in zip_longest(_chunks(y_true, chunk_size), _chunks(y_pred, chunk_size)):
+            if truth is None or predicted is None or len(truth) != len(predicted):
+                raise ValueError("y_true và y_pred phải có cùng độ dài")
+            residuals = list(map(sub, truth, predicted))
+            n, m, m2, _, _ = _block_moments(truth)
+            self._merge(n, m, m2, sum(residuals), sum(map(mul, residuals, residuals)),
+                        min(residuals), max(residuals))
+        return self
+
+    def _merge(self, n, y_mean, y_m2, residual_sum, rss, residual_min, residual_max):
+        self.count, self.y_mean, self.y_m2 = _chan(self.count, self.y_mean, self.y_m2, n, y_mean, y_m2)
+        self.residual_sum += residual_sum
+        self.rss += rss
+        self.residual_min = min(self.residual_min, residual_min)
+        self.residual_max = max(self.residual_max, residual_max)
+
+    def merge(self, other):
+        """Gộp thống kê của phần dữ liệu khác vào đối tượng này"""
+        if other.count:
+            self._merge(other.count, other.y_mean, other.y_m2, other.residual_sum, other.rss,
+                        other.residual_min, other.residual_max)
+        return self
+
+    @property
+    def tss(self):
+        return self.y_m2
+
+    def metrics(self):
+        """MSE, R^2 và chuẩn vector phần dư (cùng thứ tự với evaluate_model)"""
+        mse = self.rss / self.count
+        r_squared = 1 - self.rss / self.tss
+        return mse, r_squared, sqrt(self.rss)
+
+
+def mean(values):
+    """Tính giá trị trung bình của một list"""
+    return sum(values) / len(values) if values else 0
+
+
+def std_dev(values):
+    """Độ lệch chuẩn (chia cho n) của một list"""
+    return ColumnStats().update_vector(values).stds[0]
+
+
+def standardize(X):
+    """
+    Chuẩn hóa Z-score theo từng cột (X là ma trận, mỗi hàng là list/tuple/dãy bất kỳ)
+    hoặc cả vector (X là vector các số).
+    Trung bình và độ lệch chuẩn của mọi cột được tính trong cùng một lần duyệt;
+    cột có độ lệch chuẩn bằng 0 chỉ được trừ trung bình.
+    """
+    if not hasattr(X, '__getitem__'):
+        X = list(X)  # Iterator (ví dụ ColumnarTable.rows) được đọc hai lần: thống kê rồi chuẩn hóa
+    if isinstance(X[0], Number):
+        stats = ColumnStats().update_vector(X)
+        m, s = stats.means[0], stats.stds[0] or 1
+        return [(x - m) / s for x in X]
+
+    stats = ColumnStats().update(X)
+    means = stats.means
+    stds = [s if s > 0 else 1.0 for s in stats.stds]
+    return [[(x - m) / s for x, m, s in zip(row, means, stds)] for row in X]
+
+
+def evaluate_model(y_true, y_pred):
+    """
+    Tính các chỉ số đánh giá mô hình: MSE, R^2, chuẩn vector của phần dư
+    """
+    return ResidualStats().update(y_true, y_pred).metrics()
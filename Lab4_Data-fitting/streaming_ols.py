@@ -0,0 +1,159 @@
+import csv
+from itertools import islice
+from operator import mul
+
+from csv_loader import clean_header
+from linalg import cholesky, cholesky_solve, dot
+
+
+def read_csv_chunks(path, target=0, features=None, chunk_size=10000):
+    """
+    Đọc file CSV theo từng khối tối đa chunk_size dòng, không nạp cả file vào bộ nhớ.
+    target: tên hoặc chỉ số cột mục tiêu; features: danh sách tên cột đặc trưng
+    (mặc định là mọi cột còn lại).
+    Sinh ra (feature_names, X_chunk, y_chunk) cho mỗi khối.
+    """
+    with open(path, newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = [clean_header(name) for name in next(reader)]
+
+        target_index = target if isinstance(target, int) else header.index(clean_header(target))
+        if features is None:
+            feature_indices = [j for j in range(len(header)) if j != target_index]
+        else:
+            feature_indices = [header.index(clean_header(name)) for name in features]
+        feature_names = [header[j] for j in feature_indices]
+
+        while True:
+            rows = list(islice(reader, chunk_size))
+            if not rows:
+                break
+            X_chunk = [[float(row[j]) for j in feature_indices] for row in rows if row]
+            y_chunk = [float(row[target_index]) for row in rows if row]
+            yield feature_names, X_chunk, y_chunk
+
+
+class StreamingOLS:
+    """
+    Hồi quy OLS theo luồng: chỉ lưu các thống kê đủ X^T X, X^T y, Σy, Σy² và số mẫu,
+    cập nhật dần theo từng khối dữ liệu (partial_fit) nên bộ nhớ chỉ phụ thuộc số đặc trưng.
+    Hệ số được tính một lần bằng phân tích Cholesky của X^T X (không tính ma trận nghịch đảo).
+    Với fit_intercept=True cột hằng số 1 được thêm ngầm, coef_[0] là hệ số chặn
+    (cùng thứ tự với kết quả của ols(X_with_intercept, y)).
+    """
+
+    def __init__(self, fit_intercept=True):
+        self.fit_intercept = fit_intercept
+        self.n_features = None
+        self.n_samples = 0
+        self.xtx = None
+        self.xty = None
+        self.y_sum = 0.0
+        self.y_sq_sum = 0.0
+        self.coef_ = None
+        self.feature_names = None
+
+    @property
+    def n_params(self):
+        return self.n_features + (1 if self.fit_intercept else 0)
+
+    def _init_stats(self, n_features):
+        self.n_features = n_features
+        p = self.n_params
+        self.xtx = [[0.0] * p for _ in range(p)]
+        self.xty = [0.0] * p
+
+    def partial_fit(self, X, y):
+        """Cập nhật các thống kê với một khối dữ liệu (X: list các hàng, y: list giá trị)"""
+        X = list(X)
+        y = list(y)
+        if len(X) != len(y):
+            raise ValueError("Số hàng của X phải bằng độ dài của y")
+        if not X:
+            return self
+        if self.n_features is None:
+            self._init_stats(len(X[0]))
+
+        # Duyệt theo cột của khối để các tích vô hướng chạy trong vòng lặp C
+        columns = [list(col) for col in zip(*X)]
+        if len(columns) != self.n_features:
+            raise ValueError(f"Số đặc trưng không khớp: {len(columns)} != {self.n_features}")
+        if self.fit_intercept:
+            columns.insert(0, None)
+
+        p = self.n_params
+        for i in range(p):
+            col_i = columns[i]
+            row = self.xtx[i]
+            for j in range(i, p):
+                col_j = columns[j]
+                if col_i is None:
+                    value = len(X) if col_j is None else sum(col_j)
+                else:
+                    value = dot(col_i, col_j)
+                row[j] += value
+                if j != i:
+                    self.xtx[j][i] += value
+            self.xty[i] += sum(y) if col_i is None else dot(col_i, y)
+
+        self.n_samples += len(y)
+        self.y_sum += sum(y)
+        self.y_sq_sum += sum(map(mul, y, y))
+        self.coef_ = None
+        return self
+
+    def merge(self, other):
+        """Gộp thống kê của một estimator khác (huấn luyện trên phần dữ liệu khác) vào estimator này"""
+        if other.n_samples == 0:
+            return self
+        if other.fit_intercept != self.fit_intercept:
+            raise ValueError("Hai estimator phải cùng cấu hình fit_intercept")
+        if self.n_features is None:
+            self._init_stats(other.n_features)
+            self.feature_names = other.feature_names
+        elif other.n_features != self.n_features:
+            raise ValueError("Hai estimator phải có cùng số đặc trưng")
+
+        for row, other_row in zip(self.xtx, other.xtx):
+            for j, value in enumerate(other_row):
+                row[j] += value
+        self.xty = [a + b for a, b in zip(self.xty, other.xty)]
+        self.n_samples += other.n_samples
+        self.y_sum += other.y_sum
+        self.y_sq_sum += other.y_sq_sum
+        self.coef_ = None
+        return self
+
+    def solve(self):
+        """Tính hệ số beta từ X^T X beta = X^T y bằng phân tích Cholesky"""
+        if self.n_samples == 0:
+            raise ValueError("Chưa có dữ liệu để huấn luyện")
+        L = cholesky(self.xtx)
+        self.coef_ = cholesky_solve(L, self.xty)
+        return self.coef_
+
+    def fit(self, X, y):
+        """Huấn luyện lại từ đầu trên (X, y), trả về hệ số"""
+        self.__init__(self.fit_intercept)
+        self.partial_fit(X, y)
+        return self.solve()
+
+    def fit_csv(self, path, target=0, features=None, chunk_size=10000):
+        """Huấn luyện trên file CSV, đọc theo từng khối chunk_size dòng, trả về hệ số"""
+        for feature_names, X_chunk, y_chunk in read_csv_chunks(path, target, features, chunk_size):
+            self.feature_names = feature_names
+            self.partial_fit(X_chunk, y_chunk)
+        return self.solve()
+
+    def metrics(self):
+        """
+        MSE, R^2 và chuẩn vector phần dư trên dữ liệu huấn luyện, tính từ các thống kê đủ:
+        RSS = Σy² - 2 beta^T X^T y + beta^T X^T X beta
+        """
+        beta = self.coef_ if self.coef_ is not None else self.solve()
+        xtx_beta = [dot(row, beta) for row in self.xtx]
+        rss = max(self.y_sq_sum - 2 * dot(beta, self.xty) + dot(beta, xtx_beta), 0.0)
+        tss = self.y_sq_sum - self.y_sum ** 2 / self.n_samples
+        mse = rss / self.n_samples
+        r_squared = 1 - rss / tss if tss > 0 else 0.0
+        return mse, r_squared, rss ** 0.5
@@ -0,0 +1,22 @@
+import random
+import unittest
+
+from cross_validation import leave_one_out_cv, loo_residuals
+
+
+class LeaveOneOutTest(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(0)
+        self.X = [[rng.random(), rng.random()] for _ in range(50)]
+        self.y = [a + 2 * b + rng.random() for a, b in self.X]
+
+    def test_generator_inputs(self):
+        """X, y dạng generator cho cùng kết quả với list"""
+        expected = leave_one_out_cv(self.X, self.y)
+        result = leave_one_out_cv((row for row in self.X), (target for target in self.y))
+        self.assertEqual(result, expected)
+        self.assertEqual(loo_residuals(iter(self.X), iter(self.y)), loo_residuals(self.X, self.y))
+
+
+if __name__ == '__main__':
+    unittest.main()
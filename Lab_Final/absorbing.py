@@ -0,0 +1,131 @@
+"""
+Xích hấp thụ cho bài toán tung xúc xắc tới khi tổng chia hết cho modulus (câu d, 23120023_cau2.ipynb).
+
+- dice_chain(faces, modulus): ma trận chuyển P_2 (quy ước cột như notebook) và phân phối sau lần tung đầu.
+- stopping_probabilities: sinh P(kết thúc <= n) với n = 1, 2, ... trong một lần duyệt
+  (mỗi bước một phép nhân ma trận - vector thay vì tính lại từ đầu cho từng n).
+- AbsorbingChain: P(kết thúc <= n) với n lớn trong O(log n) phép nhân (lũy thừa bằng bình phương),
+  kỳ vọng và phương sai của thời điểm dừng từ ma trận cơ bản N = (I - Q)^(-1).
+"""
+from functools import lru_cache
+
+from markov import MatrixPower, inverse, matrix_vector_multiply
+
+
+def dice_chain(faces=6, modulus=7):
+    """
+    Ma trận chuyển P (P[j][i] là xác suất trạng thái i -> j, trạng thái 0 hấp thụ)
+    và phân phối pi_1 của S_1 mod modulus sau lần tung đầu tiên
+    """
+    if faces < 1 or modulus < 2:
+        raise ValueError("Cần faces >= 1 và modulus >= 2")
+    P = [[0.0] * modulus for _ in range(modulus)]
+    P[0][0] = 1.0
+    for current_state in range(1, modulus):
+        for dice_value in range(1, faces + 1):
+            P[(current_state + dice_value) % modulus][current_state] += 1 / faces
+    pi = [0.0] * modulus
+    for dice_value in range(1, faces + 1):
+        pi[dice_value % modulus] += 1 / faces
+    return P, pi
+
+
+class AbsorbingChain:
+    """
+    Xích hấp thụ với ma trận chuyển P theo quy ước cột và tập trạng thái hấp thụ absorbing.
+    pi: phân phối tại lần tung đầu tiên (n = 1).
+    """
+
+    def __init__(self, P, pi, absorbing=(0,)):
+        n = len(P)
+        if len(pi) != n:
+            raise ValueError("Kích thước ma trận P và vector pi không khớp")
+        self.absorbing = sorted(absorbing)
+        self.transient = [s for s in range(n) if s not in set(absorbing)]
+        # Q[a][b]: xác suất chuyển từ trạng thái tạm thời b sang a (quy ước cột)
+        self.Q = [[P[a][b] for b in self.transient] for a in self.transient]
+        self.start = [pi[s] for s in self.transient]
+        self.absorbed_at_start = sum(pi[s] for s in self.absorbing)
+        # r[b]: xác suất bị hấp thụ ngay bước kế tiếp khi đang ở trạng thái tạm thời b
+        self.r = [sum(P[a][b] for a in self.absorbing) for b in self.transient]
+        # Ma trận mở rộng [[Q, 0], [r, 1]]: thêm một trạng thái cộng dồn khối lượng đã bị hấp thụ,
+        # nhờ đó P(kết thúc <= n) được cộng trực tiếp thay vì lấy 1 - tổng phần còn lại (mất chính xác khi gần 0)
+        self._powers = MatrixPower([row + [0.0] for row in self.Q] + [self.r + [1.0]])
+        self._fundamental = None
+
+    @classmethod
+    @lru_cache(maxsize=32)
+    def dice(cls, faces=6, modulus=7):
+        """
+        Bài toán xúc xắc faces mặt, dừng khi tổng chia hết cho modulus.
+        Xích được lưu lại (lru_cache) nên các lũy thừa của Q được dùng lại giữa các lần gọi.
+        """
+        P, pi = dice_chain(faces, modulus)
+        return cls(P, pi)
+
+    def probability_stop_by(self, n):
+        """P(kết thúc sau không quá n lần tung) = khối lượng đã bị hấp thụ sau n - 1 bước của ma trận mở rộng"""
+        if n < 1:
+            raise ValueError("Số lần tung n phải lớn hơn hoặc bằng 1")
+        state = matrix_vector_multiply(self._powers.power(n - 1), self.start + [self.absorbed_at_start])
+        return state[-1]
+
+    def stopping_probabilities(self, max_n=None):
+        """Sinh P(kết thúc <= n) với n = 1, 2, ... (tới max_n nếu có), mỗi bước một phép nhân Q x v"""
+        remaining = list(self.start)
+        absorbed = self.absorbed_at_start
+        n = 1
+        while max_n is None or n <= max_n:
+            yield absorbed
+            absorbed += sum(p * x for p, x in zip(self.r, remaining))
+            remaining = matrix_vector_multiply(self.Q, remaining)
+            n += 1
+
+    def fundamental_matrix(self):
+        """N = (I - Q)^(-1) (quy ước cột): N[a][b] là số lần kỳ vọng ở a khi xuất phát từ b"""
+        if self._fundamental is None:
+            size = len(self.Q)
+            I_minus_Q = [[(1.0 if a == b else 0.0) - self.Q[a][b] for b in range(size)] for a in range(size)]
+            self._fundamental = inverse(I_minus_Q)
+        return self._fundamental
+
+    def absorption_times(self):
+        """(kỳ vọng, moment bậc hai) của số bước tới khi bị hấp thụ, xuất phát từ từng trạng thái tạm thời"""
+        N = self.fundamental_matrix()
+        size = len(N)
+        # Theo quy ước hàng N_r = N^T: t = N_r 1, E[T^2] = (2 N_r - I) t
+        t = [sum(N[a][b] for a in range(size)) for b in range(size)]
+        second = [2 * sum(N[a][b] * t[a] for a in range(size)) - t[b] for b in range(size)]
+        return t, second
+
+    def expected_stopping_time(self):
+        """Kỳ vọng số lần tung cho tới khi dừng (tính cả lần tung đầu tiên)"""
+        t, _ = self.absorption_times()
+        return 1.0 + sum(p * x for p, x in zip(self.start, t))
+
+    def stopping_time_variance(self):
+        """Phương sai của số lần tung cho tới khi dừng"""
+        t, second = self.absorption_times()
+        mean = sum(p * x for p, x in zip(self.start, t))
+        return sum(p * x for p, x in zip(self.start, second)) - mean * mean
+
+
+@lru_cache(maxsize=32)
+def _chain(P, pi):
+    """Xích hấp thụ của (P, pi) dạng tuple, tạo một lần cho mỗi cặp"""
+    return AbsorbingChain(P, pi)
+
+
+def calculate_dice_probability(n, P=None, pi=None, faces=6, modulus=7):
+    """
+    Tính xác suất tung xúc xắc không quá n lần để tổng chia hết cho modulus.
+    Cùng cách gọi với notebook: calculate_dice_probability(n, P_2, pi);
+    không có P, pi thì dùng xích của xúc xắc faces mặt (dice_chain).
+    """
+    if (P is None) != (pi is None):
+        raise ValueError("Cần truyền cả P và pi")
+    if P is None:
+        chain = AbsorbingChain.dice(faces, modulus)
+    else:
+        chain = _chain(tuple(map(tuple, P)), tuple(pi))
+    return chain.probability_stop_by(n)
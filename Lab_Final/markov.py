@@ -0,0 +1,312 @@
+"""
+Các phép toán cho xích Markov trong 23120023_cau2.ipynb.
+
+- matrix_power: lũy thừa ma trận bằng bình phương liên tiếp (O(log n) phép nhân thay vì n),
+  lũy thừa âm dùng ma trận nghịch đảo được lưu lại, ma trận đối xứng có thể dùng phân tích trị riêng.
+- is_regular_matrix: kiểm tra ma trận chính quy trên mẫu khác 0 (boolean) của P bằng các lũy thừa
+  tăng dần, giới hạn bởi cận Wielandt (n - 1)^2 + 1 = n^2 - 2n + 2, không cần phép nhân số thực.
+- stationary_times: đưa nhiều phân phối đầu cùng hội tụ (một phép nhân ma trận - ma trận mỗi bước),
+  mỗi cột dừng riêng khi đã đủ gần phân phối dừng; mixing_time_bound cho cận trên của số bước
+  từ hệ số Dobrushin hoặc khoảng cách phổ.
+"""
+from math import ceil, log, sqrt
+
+
+def create_identity_matrix(n):
+    """Tạo ma trận đơn vị"""
+    return [[1.0 if i == j else 0.0 for j in range(n)] for i in range(n)]
+
+
+def matrix_multiply(A, B):
+    """Nhân ma trận A và B (B là ma trận), duyệt theo hàng để tận dụng các hàng thưa"""
+    cols_B = len(B[0])
+    if len(A[0]) != len(B):
+        raise ValueError(f"Kích thước không phù hợp: ({len(A)}x{len(A[0])}) và ({len(B)}x{cols_B})")
+    C = []
+    for row in A:
+        result = [0.0] * cols_B
+        for a, row_B in zip(row, B):
+            if a:
+                for j, b in enumerate(row_B):
+                    result[j] += a * b
+        C.append(result)
+    return C
+
+
+def matrix_vector_multiply(A, v):
+    """Nhân ma trận A với vector v"""
+    if len(A[0]) != len(v):
+        raise ValueError("Số cột của ma trận phải bằng độ dài của vector")
+    return [sum(a * x for a, x in zip(row, v)) for row in A]
+
+
+def inverse(A, tol=1e-12):
+    """Ma trận nghịch đảo bằng Gauss - Jordan với chọn pivot lớn nhất, lỗi ValueError nếu A suy biến"""
+    n = len(A)
+    augmented = [[float(x) for x in row] + [1.0 if i == j else 0.0 for j in range(n)]
+                 for i, row in enumerate(A)]
+    for i in range(n):
+        max_row = max(range(i, n), key=lambda k: abs(augmented[k][i]))
+        if abs(augmented[max_row][i]) < tol:
+            raise ValueError("Ma trận suy biến, không có lũy thừa âm")
+        augmented[i], augmented[max_row] = augmented[max_row], augmented[i]
+        pivot_row = augmented[i]
+        pivot = pivot_row[i]
+        for j in range(i, 2 * n):
+            pivot_row[j] /= pivot
+        for k in range(n):
+            factor = augmented[k][i]
+            if k != i and factor:
+                row = augmented[k]
+                for j in range(i, 2 * n):
+                    row[j] -= factor * pivot_row[j]
+    return [row[n:] for row in augmented]
+
+
+def is_symmetric(A, tol=1e-12):
+    n = len(A)
+    return all(abs(A[i][j] - A[j][i]) <= tol for i in range(n) for j in range(i + 1, n))
+
+
+def symmetric_eigen(A, tol=1e-14, max_sweeps=100):
+    """
+    Phân tích A = V diag(w) V^T của ma trận đối xứng bằng phương pháp quay Jacobi.
+    Trả về (w, V), cột k của V là vector riêng ứng với w[k].
+    """
+    n = len(A)
+    A = [[float(x) for x in row] for row in A]
+    V = create_identity_matrix(n)
+    scale = sqrt(sum(A[i][j] ** 2 for i in range(n) for j in range(n))) or 1.0
+    for _ in range(max_sweeps):
+        off = sqrt(sum(A[i][j] ** 2 for i in range(n) for j in range(i + 1, n)))
+        if off <= tol * scale:
+            break
+        for p in range(n - 1):
+            for q in range(p + 1, n):
+                if A[p][q] == 0.0:
+                    continue
+                theta = (A[q][q] - A[p][p]) / (2 * A[p][q])
+                t = (1.0 if theta >= 0 else -1.0) / (abs(theta) + sqrt(theta * theta + 1))
+                c = 1 / sqrt(t * t + 1)
+                s = t * c
+                for row in A:
+                    row[p], row[q] = c * row[p] - s * row[q], s * row[p] + c * row[q]
+                A[p], A[q] = ([c * x - s * y for x, y in zip(A[p], A[q])],
+                              [s * x + c * y for x, y in zip(A[p], A[q])])
+                for row in V:
+                    row[p], row[q] = c * row[p] - s * row[q], s * row[p] + c * row[q]
+    return [A[i][i] for i in range(n)], V
+
+
+class MatrixPower:
+    """
+    Tính A^n cho nhiều giá trị n của cùng một ma trận A.
+    Các lũy thừa A^(2^k) và ma trận nghịch đảo được lưu lại nên các lần gọi sau
+    chỉ tốn tối đa log2(|n|) phép nhân.
+    Với ma trận đối xứng (như P trong câu a) có thể dùng method='eigen':
+    A^n = V diag(w^n) V^T, mỗi lũy thừa chỉ tốn O(size^3) một lần nhân, không phụ thuộc n.
+    """
+
+    def __init__(self, A):
+        self.A = [[float(x) for x in row] for row in A]
+        self.size = len(A)
+        self._squares = {1: [self.A]}   # dấu -> [M, M^2, M^4, ...]
+        self._inverse = None
+        self._eigen = None
+
+    def _base(self, sign):
+        if sign not in self._squares:
+            if self._inverse is None:
+                self._inverse = inverse(self.A)
+            self._squares[sign] = [self._inverse]
+        return self._squares[sign]
+
+    def inverse(self):
+        """Ma trận nghịch đảo A^(-1) (tính một lần)"""
+        return self._base(-1)[0]
+
+    def eigendecomposition(self):
+        """(w, V) của ma trận đối xứng A (tính một lần)"""
+        if self._eigen is None:
+            if not is_symmetric(self.A):
+                raise ValueError("Phân tích trị riêng trực giao chỉ áp dụng cho ma trận đối xứng")
+            self._eigen = symmetric_eigen(self.A)
+        return self._eigen
+
+    def power(self, n, method='squaring'):
+        """A^n (n nguyên, có thể âm); method: 'squaring' hoặc 'eigen' (ma trận đối xứng)"""
+        if n == 0:
+            return create_identity_matrix(self.size)
+        if method == 'eigen':
+            w, V = self.eigendecomposition()
+            if n < 0 and any(abs(x) < 1e-12 for x in w):
+                raise ValueError("Ma trận suy biến, không có lũy thừa âm")
+            scaled = [[v * x ** n for v, x in zip(row, w)] for row in V]
+            return [[sum(a * b for a, b in zip(row, other)) for other in V] for row in scaled]
+        if method != 'squaring':
+            raise ValueError("method phải là 'squaring' hoặc 'eigen'")
+
+        squares = self._base(1 if n > 0 else -1)
+        n = abs(n)
+        result = None
+        k = 0
+        while n:
+            if k == len(squares):
+                squares.append(matrix_multiply(squares[-1], squares[-1]))
+            if n & 1:
+                result = squares[k] if result is None else matrix_multiply(result, squares[k])
+            n >>= 1
+            k += 1
+        return [row[:] for row in result]
+
+
+def matrix_power(A, n, method='squaring'):
+    """
+    Tính lũy thừa bậc n của ma trận A (n < 0 dùng ma trận nghịch đảo)
+    """
+    return MatrixPower(A).power(n, method)
+
+
+def pattern(A, tol=0.0):
+    """Mẫu khác 0 của A: mỗi hàng là một số nguyên, bit j bật nếu |A[i][j]| > tol"""
+    return [sum(1 << j for j, x in enumerate(row) if abs(x) > tol) for row in A]
+
+
+def pattern_multiply(A, B):
+    """Tích boolean của hai mẫu: hàng i của kết quả là OR các hàng B[k] với bit k của A[i] bật"""
+    result = []
+    for mask in A:
+        row = 0
+        k = 0
+        while mask:
+            if mask & 1:
+                row |= B[k]
+            mask >>= 1
+            k += 1
+        result.append(row)
+    return result
+
+
+def wielandt_bound(n):
+    """Lũy thừa lớn nhất cần xét: ma trận nguyên thủy cấp n có P^m > 0 với m = (n - 1)^2 + 1"""
+    return n * n - 2 * n + 2
+
+
+def regularity_exponent(P, tol=0.0):
+    """
+    Lũy thừa m nhỏ nhất sao cho mọi phần tử của P^m dương, hoặc None nếu P không chính quy.
+    Chỉ dùng mẫu khác 0 (phép OR trên số nguyên), nhân dần với P tới cận Wielandt.
+    """
+    n = len(P)
+    full = (1 << n) - 1
+    base = pattern(P, tol)
+    current = base
+    for m in range(1, wielandt_bound(n) + 1):
+        if all(row == full for row in current):
+            return m
+        current = pattern_multiply(current, base)
+    return None
+
+
+def is_regular_matrix(P):
+    """
+    Kiểm tra ma trận chính quy (có lũy thừa m sao cho tất cả phần tử > 0)
+    """
+    m = regularity_exponent(P)
+    if m is not None:
+        return True, f"Ma trận chính quy với lũy thừa m = {m}"
+    return False, "Ma trận không phải là ma trận chính quy"
+
+
+def dobrushin_coefficient(P, column_stochastic=True):
+    """
+    Hệ số Dobrushin delta(P) = 1 - min_{i,j} Σ_k min(p_ik, p_jk), với p_ik là xác suất i -> k.
+    ||mu P - nu P||_1 <= delta(P) * ||mu - nu||_1 với mọi cặp phân phối mu, nu.
+    """
+    rows = [list(col) for col in zip(*P)] if column_stochastic else P
+    overlap = min(sum(map(min, rows[i], rows[j]))
+                  for i in range(len(rows)) for j in range(i + 1, len(rows))) if len(rows) > 1 else 1.0
+    return max(0.0, 1.0 - overlap)
+
+
+def second_eigenvalue_modulus(P):
+    """Trị tuyệt đối lớn nhất của các trị riêng khác trị riêng 1 (ma trận đối xứng)"""
+    if not is_symmetric(P):
+        raise ValueError("Khoảng cách phổ chỉ tính cho ma trận đối xứng")
+    w, _ = symmetric_eigen(P)
+    w = sorted(w, key=abs, reverse=True)
+    return abs(w[1]) if len(w) > 1 else 0.0
+
+
+def mixing_time_bound(P, tolerance=1e-6, column_stochastic=True):
+    """
+    Số bước t đủ để ||pi_t - pi||_2 < tolerance với mọi phân phối đầu, hoặc None nếu không có cận:
+    - Dobrushin: ||pi_t - pi||_2 <= ||pi_t - pi||_1 <= 2 * delta^t
+    - Khoảng cách phổ (P đối xứng): ||pi_t - pi||_2 <= lambda_2^t * ||pi_0 - pi||_2 <= sqrt(2) * lambda_2^t
+    Lấy cận nhỏ hơn trong hai cận.
+    """
+    def steps(rate, constant):
+        if rate <= 0:
+            return 1
+        if rate >= 1 - 1e-12:  # Không co (ví dụ xích tuần hoàn): không có cận
+            return None
+        return max(1, ceil(log(tolerance / constant) / log(rate)))
+
+    bounds = [steps(dobrushin_coefficient(P, column_stochastic), 2.0)]
+    if is_symmetric(P):
+        bounds.append(steps(second_eigenvalue_modulus(P), sqrt(2)))
+    bounds = [b for b in bounds if b is not None]
+    return min(bounds) if bounds else None
+
+
+def stationary_times(P, initial_distributions, stationary_pi, tolerance=1e-6, max_iterations=1000,
+                     bound=None):
+    """
+    Thời điểm t đầu tiên mà ||P^t pi_0 - pi||_2 < tolerance cho từng phân phối đầu pi_0.
+    Các phân phối đầu được xếp thành các cột của một ma trận và nhân với P cùng lúc;
+    cột nào đã hội tụ được loại khỏi ma trận.
+    bound: cận trên số bước đã tính trước (ví dụ mixing_time_bound(P, tolerance)) để giới hạn thêm
+    max_iterations; không tự tính vì cận tốn O(n^3), thường lâu hơn chính vòng lặp.
+    Trả về list (t, pi_t, distance) theo thứ tự các phân phối đầu (t là None nếu chưa hội tụ).
+    """
+    n = len(P)
+    if bound is not None:
+        max_iterations = min(max_iterations, bound)
+
+    starts = [[float(x) for x in pi_0] for pi_0 in initial_distributions]
+    results = [None] * len(starts)
+    active = list(range(len(starts)))
+    rows = [[start[i] for start in starts] for i in range(n)]   # Ma trận n x (số cột còn lại)
+
+    def distances(rows):
+        totals = [0.0] * len(active)
+        for row, target in zip(rows, stationary_pi):
+            for c, x in enumerate(row):
+                totals[c] += (x - target) ** 2
+        return [sqrt(t) for t in totals]
+
+    for t in range(1, max_iterations + 1):
+        rows = matrix_multiply(P, rows)
+        keep = []
+        for c, distance in enumerate(distances(rows)):
+            if distance < tolerance:
+                results[active[c]] = (t, [row[c] for row in rows], distance)
+            else:
+                keep.append(c)
+        if len(keep) < len(active):
+            active = [active[c] for c in keep]
+            rows = [[row[c] for c in keep] for row in rows]
+        if not active:
+            break
+
+    final = distances(rows) if active else []
+    for c, k in enumerate(active):
+        results[k] = (None, [row[c] for row in rows], final[c])
+    return results
+
+
+def find_stationary_time(P, pi_0, stationary_pi, tolerance=1e-6, max_iterations=1000, bound=None):
+    """
+    Tìm thời điểm t sao cho phân phối xác suất pi_t chính là phân phối dừng
+    """
+    return stationary_times(P, [pi_0], stationary_pi, tolerance, max_iterations, bound)[0]
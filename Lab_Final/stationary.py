@@ -0,0 +1,315 @@
+"""
+Tìm phân phối dừng cho xích Markov lớn (10^4 - 10^5 trạng thái).
+
+Xích được lưu thưa: với mỗi trạng thái i là danh sách (j, p) các bước chuyển i -> j với xác suất p > 0.
+Ma trận trong notebook theo quy ước cột (P[j][i] là xác suất i -> j, pi_{n+1} = P x pi_n);
+Chain.from_dense nhận quy ước này mặc định.
+
+Các phương pháp:
+- 'gth': khử Grassmann - Taksar - Heyman. Chỉ cộng các số không âm (không có phép trừ),
+  nên chính xác và không sinh thành phần âm. Thực hiện trên cấu trúc thưa, chi phí phụ thuộc độ lấp đầy.
+- 'power': lặp lũy thừa pi <- pi P, chỉ cần một phép nhân ma trận - vector mỗi bước.
+- 'gauss_seidel' / 'sor': pi_i = Σ_{j != i} pi_j p_ji / (1 - p_ii), dùng ngay giá trị vừa cập nhật.
+Xích khả quy được tách thành các thành phần liên thông mạnh (Tarjan); mỗi lớp đóng có một
+phân phối dừng riêng, các trạng thái tạm thời có xác suất dừng bằng 0.
+"""
+from operator import mul, sub
+
+
+class Chain:
+    """Xích Markov thưa: out_edges[i] là list (j, p) với p = P(X_{n+1} = j | X_n = i)"""
+
+    def __init__(self, n, out_edges):
+        self.n = n
+        self.out_edges = out_edges
+        self._in_edges = None
+
+    @classmethod
+    def from_dense(cls, P, column_stochastic=True, tol=0.0):
+        """Từ ma trận đầy đủ; column_stochastic=True: P[j][i] là xác suất i -> j (như trong notebook)"""
+        n = len(P)
+        out_edges = [[] for _ in range(n)]
+        for r, row in enumerate(P):
+            for c, p in enumerate(row):
+                if p > tol:
+                    if column_stochastic:
+                        out_edges[c].append((r, float(p)))
+                    else:
+                        out_edges[r].append((c, float(p)))
+        return cls(n, out_edges)
+
+    @classmethod
+    def from_transitions(cls, n, transitions):
+        """Từ các bộ (i, j, p); các bước chuyển trùng nhau được cộng dồn"""
+        merged = [{} for _ in range(n)]
+        for i, j, p in transitions:
+            if p > 0:
+                merged[i][j] = merged[i].get(j, 0.0) + p
+        return cls(n, [list(row.items()) for row in merged])
+
+    @classmethod
+    def from_function(cls, n, step):
+        """Từ hàm step(i) trả về các cặp (j, p) (ví dụ xúc xắc: ((i + d) % m, 1/6) với d = 1..6)"""
+        return cls.from_transitions(n, ((i, j, p) for i in range(n) for j, p in step(i)))
+
+    @property
+    def in_edges(self):
+        """in_edges[j] là list (i, p) các bước chuyển i -> j"""
+        if self._in_edges is None:
+            in_edges = [[] for _ in range(self.n)]
+            for i, row in enumerate(self.out_edges):
+                for j, p in row:
+                    in_edges[j].append((i, p))
+            self._in_edges = in_edges
+        return self._in_edges
+
+    @property
+    def nnz(self):
+        return sum(len(row) for row in self.out_edges)
+
+    def validate(self, tol=1e-10):
+        """Lỗi ValueError nếu tổng xác suất đi ra của một trạng thái khác 1"""
+        for i, row in enumerate(self.out_edges):
+            total = sum(p for _, p in row)
+            if abs(total - 1.0) > tol:
+                raise ValueError(f"Tổng xác suất đi ra từ trạng thái {i} = {total:.6f} không bằng 1")
+
+    def step(self, pi):
+        """Phân phối sau một bước: (pi P)_j = Σ_i pi_i p_ij"""
+        result = [0.0] * self.n
+        for x, row in zip(pi, self.out_edges):
+            if x:
+                for j, p in row:
+                    result[j] += x * p
+        return result
+
+    def subchain(self, states):
+        """Xích con trên tập trạng thái đóng states (đánh lại chỉ số 0..len-1)"""
+        index = {s: k for k, s in enumerate(states)}
+        out_edges = [[(index[j], p) for j, p in self.out_edges[s] if j in index] for s in states]
+        return Chain(len(states), out_edges)
+
+
+def strongly_connected_components(chain):
+    """Các thành phần liên thông mạnh (thuật toán Tarjan, không đệ quy)"""
+    n = chain.n
+    index = [-1] * n
+    low = [0] * n
+    on_stack = [False] * n
+    stack = []
+    components = []
+    counter = 0
+    for root in range(n):
+        if index[root] != -1:
+            continue
+        work = [(root, 0)]
+        while work:
+            v, k = work.pop()
+            if k == 0:
+                index[v] = low[v] = counter
+                counter += 1
+                stack.append(v)
+                on_stack[v] = True
+            edges = chain.out_edges[v]
+            while k < len(edges):
+                w = edges[k][0]
+                k += 1
+                if index[w] == -1:
+                    work.append((v, k))
+                    work.append((w, 0))
+                    break
+                if on_stack[w]:
+                    low[v] = min(low[v], index[w])
+            else:
+                if low[v] == index[v]:
+                    component = []
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = False
+                        component.append(w)
+                        if w == v:
+                            break
+                    components.append(sorted(component))
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[v])
+    return components
+
+
+def closed_classes(chain):
+    """Các lớp đóng (lớp hồi quy): thành phần liên thông mạnh không có bước chuyển ra ngoài"""
+    classes = []
+    for component in strongly_connected_components(chain):
+        members = set(component)
+        if all(j in members for s in component for j, _ in chain.out_edges[s]):
+            classes.append(component)
+    return classes
+
+
+def gth(chain, max_fill=None):
+    """
+    Phân phối dừng của xích tối giản bằng khử GTH trên cấu trúc thưa.
+    Khử lần lượt trạng thái k = n-1, ..., 1: với mỗi i < k có bước i -> k,
+    q_ij += q_ik * q_kj / s_k (j < k), s_k = Σ_{j<k} q_kj (tổng không âm, không dùng 1 - q_kk).
+    max_fill: số phần tử khác 0 tối đa cho phép (vượt quá thì trả về None).
+    """
+    n = chain.n
+    rows = [dict(row) for row in chain.out_edges]
+    preds = [set() for _ in range(n)]
+    for i, row in enumerate(rows):
+        for j in row:
+            if i < j:
+                preds[j].add(i)
+    fill = sum(len(row) for row in rows)
+
+    for k in range(n - 1, 0, -1):
+        row_k = [(j, q) for j, q in rows[k].items() if j < k]
+        s = sum(q for _, q in row_k)
+        if s <= 0:
+            raise ValueError("Xích không tối giản: có trạng thái không quay lại được các trạng thái trước")
+        for i in preds[k]:
+            row_i = rows[i]
+            factor = row_i[k] / s
+            row_i[k] = factor  # Giữ lại cho bước thế ngược
+            for j, q in row_k:
+                if j in row_i:
+                    row_i[j] += factor * q
+                else:
+                    row_i[j] = factor * q
+                    fill += 1
+                    if i < j:
+                        preds[j].add(i)
+        if max_fill is not None and fill > max_fill:
+            return None
+
+    pi = [0.0] * n
+    pi[0] = 1.0
+    succs = [[] for _ in range(n)]
+    for i in range(n):
+        for j, q in rows[i].items():
+            if i < j:
+                succs[j].append((i, q))
+    for k in range(1, n):
+        pi[k] = sum(pi[i] * q for i, q in succs[k])
+    total = sum(pi)
+    return [x / total for x in pi]
+
+
+def power_iteration(chain, tol=1e-12, max_iterations=100000, pi_0=None, lazy=False):
+    """
+    Lặp pi <- pi P tới khi ||pi_{t+1} - pi_t||_1 < tol.
+    lazy=True dùng (I + P) / 2 (cùng phân phối dừng) để hội tụ cả khi xích tuần hoàn.
+    Trả về (pi, số bước lặp).
+    """
+    n = chain.n
+    pi = list(pi_0) if pi_0 is not None else [1.0 / n] * n
+    for t in range(1, max_iterations + 1):
+        new = chain.step(pi)
+        if lazy:
+            new = [(a + b) / 2 for a, b in zip(new, pi)]
+        # P ngẫu nhiên nên tổng được bảo toàn, chỉ chuẩn hóa khi kết thúc
+        diff = sum(map(abs, map(sub, new, pi)))
+        pi = new
+        if diff < tol:
+            total = sum(pi)
+            return [x / total for x in pi], t
+    raise ValueError(f"Lặp lũy thừa không hội tụ sau {max_iterations} bước")
+
+
+def gauss_seidel(chain, tol=1e-12, max_iterations=10000, omega=1.0, pi_0=None, residual_tol=1e-9):
+    """
+    Giải pi (I - P) = 0 bằng Gauss - Seidel (omega = 1) hoặc SOR (0 < omega < 2):
+        pi_i <- (1 - omega) pi_i + omega * Σ_{j != i} pi_j p_ji / (1 - p_ii)
+    Chuẩn hóa sau mỗi vòng. Trả về (pi, số vòng lặp).
+    Kết quả chỉ được nhận khi phần dư ||pi P - pi||_1 <= residual_tol.
+    SOR không chắc hội tụ với mọi xích: vòng lặp có tổng <= 0 hoặc thành phần âm bị báo lỗi ValueError.
+    """
+    n = chain.n
+    incoming = []
+    diagonal = []
+    for j, edges in enumerate(chain.in_edges):
+        incoming.append(([i for i, _ in edges if i != j], [p for i, p in edges if i != j]))
+        diagonal.append(1.0 - sum(p for i, p in edges if i == j))
+    if any(d <= 0 for d in diagonal):
+        raise ValueError("Có trạng thái hấp thụ: dùng closed_classes để tách xích trước")
+
+    pi = list(pi_0) if pi_0 is not None else [1.0 / n] * n
+    for sweep in range(1, max_iterations + 1):
+        diff = 0.0
+        get = pi.__getitem__
+        for i, (sources, probs) in enumerate(incoming):
+            value = sum(map(mul, probs, map(get, sources))) / diagonal[i]
+            if omega != 1.0:
+                value = (1 - omega) * pi[i] + omega * value
+            diff += abs(value - pi[i])
+            pi[i] = value
+        total = sum(pi)
+        if total <= 0 or min(pi) < 0:
+            raise ValueError(f"SOR với omega = {omega} không hội tụ tới phân phối xác suất, hãy giảm omega")
+        for i in range(n):
+            pi[i] /= total
+        if diff / total < tol:
+            residual = sum(map(abs, map(sub, chain.step(pi), pi)))
+            if residual <= residual_tol:
+                return pi, sweep
+    raise ValueError(f"Gauss - Seidel không hội tụ sau {max_iterations} vòng")
+
+
+SOR_OMEGA = 1.2  # Hệ số mặc định của method='sor'
+
+
+def _solve_irreducible(chain, method, tol, omega=SOR_OMEGA):
+    if chain.n == 1:
+        return [1.0]
+    if method == 'auto':
+        # GTH nếu độ lấp đầy còn nhỏ, nếu không chuyển sang Gauss - Seidel
+        pi = gth(chain, max_fill=4 * chain.nnz + chain.n)
+        return pi if pi is not None else gauss_seidel(chain, tol)[0]
+    if method == 'gth':
+        return gth(chain)
+    if method == 'power':
+        return power_iteration(chain, tol, lazy=True)[0]
+    if method == 'gauss_seidel':
+        return gauss_seidel(chain, tol)[0]
+    if method == 'sor':
+        return gauss_seidel(chain, tol, omega=omega)[0]
+    raise ValueError("method phải là 'auto', 'gth', 'power', 'gauss_seidel' hoặc 'sor'")
+
+
+def stationary_distributions(chain, method='auto', tol=1e-12, omega=SOR_OMEGA):
+    """
+    Phân phối dừng của từng lớp đóng: list các cặp (lớp, pi) với pi là vector độ dài n
+    (bằng 0 ngoài lớp). Mọi phân phối dừng của xích là tổ hợp lồi của các vector này.
+    omega: hệ số của method='sor'.
+    """
+    results = []
+    for states in closed_classes(chain):
+        local = _solve_irreducible(chain.subchain(states), method, tol, omega)
+        pi = [0.0] * chain.n
+        for s, x in zip(states, local):
+            pi[s] = x
+        results.append((states, pi))
+    return results
+
+
+def stationary_distribution(P, method='auto', tol=1e-12, column_stochastic=True, omega=SOR_OMEGA):
+    """
+    Phân phối dừng duy nhất của xích (P là Chain hoặc ma trận đầy đủ theo quy ước của notebook).
+    Lỗi ValueError nếu xích có nhiều lớp đóng (phân phối dừng không duy nhất).
+    """
+    chain = P if isinstance(P, Chain) else Chain.from_dense(P, column_stochastic)
+    chain.validate()
+    results = stationary_distributions(chain, method, tol, omega)
+    if len(results) != 1:
+        raise ValueError(f"Xích có {len(results)} lớp đóng, phân phối dừng không duy nhất")
+    return results[0][1]
+
+
+def find_stationary_distribution(P, method='auto'):
+    """
+    Tìm phân phối dừng của xích Markov với ma trận chuyển P (cùng cách trả về với notebook)
+    """
+    try:
+        return stationary_distribution(P, method), "Tìm thấy phân phối dừng"
+    except ValueError as error:
+        return None, str(error)
@@ -0,0 +1,203 @@
+"""
+Mô phỏng Monte Carlo trò chơi tung xúc xắc tới khi tổng chia hết cho modulus (simulate_dice_game trong collections.ipynb).
+
+- Các ván được chơi theo lô: với numpy, mỗi bước tung xúc xắc cho mọi ván còn đang chơi cùng lúc
+  và loại các ván đã dừng; không có numpy thì dùng vòng lặp Python với random.Random riêng.
+- Các lô được chia cho nhiều tiến trình (Pool); lô thứ i luôn dùng dòng số ngẫu nhiên riêng sinh từ (seed, i)
+  nên kết quả không phụ thuộc số tiến trình.
+- Kết quả chỉ lưu histogram số lần tung (các ván quá max_steps lần được đếm riêng), không lưu từng ván.
+- Sau mỗi vòng các lô, khoảng tin cậy của P(kết thúc <= n) được cập nhật; dừng sớm khi nửa độ rộng
+  khoảng tin cậy lớn nhất nhỏ hơn target_half_width.
+"""
+import random
+import time
+from math import sqrt
+from multiprocessing import Pool, cpu_count
+
+try:
+    import numpy as np
+except ImportError:  # numpy là tùy chọn
+    np = None
+
+
+Z_VALUES = {0.90: 1.6448536269514722, 0.95: 1.959963984540054, 0.99: 2.5758293035489004}
+
+
+class StreamingHistogram:
+    """counts[k]: số ván dừng ở lần tung thứ k (1 <= k <= max_steps), counts[max_steps + 1]: số ván chưa dừng"""
+
+    def __init__(self, max_steps=50):
+        self.max_steps = max_steps
+        self.counts = [0] * (max_steps + 2)
+
+    @property
+    def total(self):
+        return sum(self.counts)
+
+    @property
+    def censored(self):
+        """Số ván chưa dừng sau max_steps lần tung"""
+        return self.counts[-1]
+
+    def add(self, counts):
+        """Cộng dồn histogram của một lô"""
+        for k, c in enumerate(counts):
+            self.counts[k] += c
+        return self
+
+    def merge(self, other):
+        if other.max_steps != self.max_steps:
+            raise ValueError("Hai histogram phải cùng max_steps")
+        return self.add(other.counts)
+
+    def probability(self, n):
+        """Ước lượng P(kết thúc <= n)"""
+        n = min(n, self.max_steps)
+        return sum(self.counts[1:n + 1]) / self.total
+
+    def confidence_interval(self, n, level=0.95):
+        """Khoảng tin cậy Wilson cho P(kết thúc <= n)"""
+        z = Z_VALUES[level]
+        total = self.total
+        p = self.probability(n)
+        denominator = 1 + z * z / total
+        center = (p + z * z / (2 * total)) / denominator
+        half = z * sqrt(p * (1 - p) / total + z * z / (4 * total * total)) / denominator
+        return center - half, center + half
+
+    def mean(self):
+        """Số lần tung trung bình của các ván đã dừng"""
+        stopped = self.total - self.censored
+        return sum(k * c for k, c in enumerate(self.counts[:-1])) / stopped if stopped else float('nan')
+
+
+def _simulate_python(n_games, faces, modulus, max_steps, seed):
+    """Chơi n_games ván bằng vòng lặp Python, trả về histogram dạng list"""
+    counts = [0] * (max_steps + 2)
+    rand = random.Random(seed).random
+    for _ in range(n_games):
+        total_sum = 0
+        for step in range(1, max_steps + 1):
+            total_sum = (total_sum + int(rand() * faces) + 1) % modulus
+            if total_sum == 0:
+                counts[step] += 1
+                break
+        else:
+            counts[max_steps + 1] += 1
+    return counts
+
+
+def _simulate_numpy(n_games, faces, modulus, max_steps, seed):
+    """Chơi n_games ván theo lô numpy: mỗi bước tung cho mọi ván còn lại rồi loại các ván đã dừng"""
+    rng = np.random.default_rng(np.random.SeedSequence(seed[0], spawn_key=(seed[1],)))
+    counts = np.zeros(max_steps + 2, dtype=np.int64)
+    state = np.zeros(n_games, dtype=np.int64)
+    for step in range(1, max_steps + 1):
+        state += rng.integers(1, faces + 1, size=state.size)
+        state %= modulus
+        stopped = state == 0
+        counts[step] = np.count_nonzero(stopped)
+        state = state[~stopped]
+        if state.size == 0:
+            break
+    counts[max_steps + 1] = state.size
+    return counts.tolist()
+
+
+def _simulate_batch(task):
+    """Một lô (chạy trong tiến trình con): task = (số ván, faces, modulus, max_steps, seed, chỉ số lô, dùng numpy)"""
+    n_games, faces, modulus, max_steps, seed, index, use_numpy = task
+    if use_numpy:
+        return _simulate_numpy(n_games, faces, modulus, max_steps, (seed, index))
+    return _simulate_python(n_games, faces, modulus, max_steps, f"{seed}-{index}")
+
+
+class DiceSimulation:
+    """
+    Mô phỏng trò chơi tung xúc xắc faces mặt, dừng khi tổng chia hết cho modulus.
+    processes = 0 chạy tuần tự trong tiến trình hiện tại; None dùng mọi CPU.
+    """
+
+    def __init__(self, faces=6, modulus=7, max_steps=50, seed=0, batch_size=None,
+                 processes=None, use_numpy=None):
+        self.faces = faces
+        self.modulus = modulus
+        self.max_steps = max_steps
+        self.seed = seed
+        self.use_numpy = np is not None if use_numpy is None else use_numpy
+        if self.use_numpy and np is None:
+            raise ValueError("Không tìm thấy numpy")
+        self.batch_size = batch_size or (1_000_000 if self.use_numpy else 20_000)
+        self.processes = cpu_count() if processes is None else processes
+        self.histogram = StreamingHistogram(max_steps)
+        self._next_batch = 0
+
+    def _tasks(self, n_games):
+        tasks = []
+        while n_games > 0:
+            size = min(self.batch_size, n_games)
+            tasks.append((size, self.faces, self.modulus, self.max_steps, self.seed,
+                          self._next_batch, self.use_numpy))
+            self._next_batch += 1
+            n_games -= size
+        return tasks
+
+    def max_half_width(self, targets, level=0.95):
+        """Nửa độ rộng lớn nhất của các khoảng tin cậy P(kết thúc <= n), n thuộc targets"""
+        widths = []
+        for n in targets:
+            low, high = self.histogram.confidence_interval(n, level)
+            widths.append((high - low) / 2)
+        return max(widths)
+
+    def run(self, n_simulations, target_half_width=None, targets=(1, 2, 3, 4, 5, 10),
+            level=0.95, round_size=None, progress=None):
+        """
+        Mô phỏng thêm tối đa n_simulations ván (cộng dồn vào histogram hiện có).
+        Với target_half_width, các ván được chạy theo từng vòng round_size ván và dừng sớm
+        khi mọi khoảng tin cậy của P(kết thúc <= n), n thuộc targets, đủ hẹp.
+        progress(số ván, thời gian, nửa độ rộng) được gọi sau mỗi vòng nếu có.
+        """
+        if round_size is None:
+            round_size = n_simulations if target_half_width is None else \
+                self.batch_size * max(self.processes, 1) * 4
+        start = time.perf_counter()
+        pool = Pool(self.processes) if self.processes > 1 else None
+        try:
+            remaining = n_simulations
+            while remaining > 0:
+                tasks = self._tasks(min(round_size, remaining))
+                remaining -= sum(task[0] for task in tasks)
+                results = pool.imap_unordered(_simulate_batch, tasks) if pool else map(_simulate_batch, tasks)
+                for counts in results:
+                    self.histogram.add(counts)
+                half_width = self.max_half_width(targets, level)
+                if progress is not None:
+                    progress(self.histogram.total, time.perf_counter() - start, half_width)
+                if target_half_width is not None and half_width <= target_half_width:
+                    break
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+        return self.histogram
+
+
+def simulate_dice_game(n_simulations=100000, faces=6, modulus=7, max_steps=50, seed=0,
+                       processes=None, target_half_width=None, report=(1, 2, 3, 4, 5, 10)):
+    """
+    Mô phỏng Monte Carlo để kiểm tra kết quả
+    """
+    simulation = DiceSimulation(faces, modulus, max_steps, seed, processes=processes)
+    histogram = simulation.run(n_simulations, target_half_width, targets=report)
+
+    print("=== MÔ PHỎNG MONTE CARLO ===")
+    print(f"Số ván đã mô phỏng: {histogram.total}")
+    for n in report:
+        low, high = histogram.confidence_interval(n)
+        print(f"P(kết thúc <= {n} lần) ≈ {histogram.probability(n):.6f} (KTC 95%: [{low:.6f}, {high:.6f}])")
+    return histogram
+
+
+if __name__ == "__main__":
+    simulate_dice_game()
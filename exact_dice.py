@@ -0,0 +1,118 @@
+"""
+Xác suất chính xác của trò chơi tung xúc xắc (calculate_exact_probability trong collections.ipynb) với n lớn.
+
+Thay vì bảng (n+1) x 8 các Fraction, trạng thái được lưu bằng số nguyên đã nhân với faces^t:
+c_t[s] = faces^t * P(X_t = s, chưa dừng). Mỗi bước chỉ duyệt các bước chuyển khác 0
+(mỗi mặt xúc xắc có trọng số 1) nên không có phép chia hay tính ước chung lớn nhất nào;
+phân số chỉ được rút gọn một lần ở cuối. Chỉ giữ vector trạng thái hiện tại.
+Với n rất lớn có thể nhảy thẳng tới bước n bằng lũy thừa ma trận số nguyên (bình phương liên tiếp).
+"""
+from fractions import Fraction
+
+
+def integer_transitions(faces=6, modulus=7):
+    """
+    Các bước chuyển giữa các trạng thái chưa dừng 1..modulus-1 dạng (i, j, số mặt dẫn từ i tới j),
+    và vector đếm sau lần tung đầu tiên (chỉ số 0 là số mặt làm dừng ngay).
+    """
+    weights = {}
+    for i in range(1, modulus):
+        for dice_value in range(1, faces + 1):
+            j = (i + dice_value) % modulus
+            if j != 0:
+                weights[i, j] = weights.get((i, j), 0) + 1
+    first = [0] * modulus
+    for dice_value in range(1, faces + 1):
+        first[dice_value % modulus] += 1
+    return [(i, j, w) for (i, j), w in sorted(weights.items())], first
+
+
+def stopping_counts(faces=6, modulus=7, max_n=None):
+    """
+    Sinh (n, số cách dừng trong n lần tung đầu, faces^n) với n = 1, 2, ...
+    P(kết thúc <= n) = số cách dừng / faces^n.
+    """
+    transitions, first = integer_transitions(faces, modulus)
+    state = first[:]
+    state[0] = 0
+    total = faces
+    n = 1
+    while max_n is None or n <= max_n:
+        yield n, total - sum(state), total
+        new_state = [0] * modulus
+        for i, j, w in transitions:
+            if state[i]:
+                new_state[j] += state[i] * w
+        state = new_state
+        total *= faces
+        n += 1
+
+
+def integer_matrix_multiply(A, B):
+    """Nhân hai ma trận số nguyên (bỏ qua các phần tử 0)"""
+    cols = len(B[0])
+    C = []
+    for row in A:
+        result = [0] * cols
+        for a, row_B in zip(row, B):
+            if a:
+                for j, b in enumerate(row_B):
+                    if b:
+                        result[j] += a * b
+        C.append(result)
+    return C
+
+
+def integer_matrix_power(A, exponent):
+    """A^exponent (exponent >= 0) bằng bình phương liên tiếp, tính chính xác trên số nguyên"""
+    n = len(A)
+    result = [[int(i == j) for j in range(n)] for i in range(n)]
+    base = A
+    while exponent:
+        if exponent & 1:
+            result = integer_matrix_multiply(result, base)
+        exponent >>= 1
+        if exponent:
+            base = integer_matrix_multiply(base, base)
+    return result
+
+
+def stopping_count_at(n, faces=6, modulus=7):
+    """Số cách dừng trong n lần tung đầu (trên faces^n), tính bằng lũy thừa ma trận: O(log n) phép nhân"""
+    transitions, first = integer_transitions(faces, modulus)
+    # W[j][i]: số mặt dẫn từ trạng thái i tới j (các trạng thái chưa dừng 1..modulus-1)
+    W = [[0] * (modulus - 1) for _ in range(modulus - 1)]
+    for i, j, w in transitions:
+        W[j - 1][i - 1] = w
+    start = first[1:]
+    W_power = integer_matrix_power(W, n - 1)
+    remaining = sum(sum(w * s for w, s in zip(row, start)) for row in W_power)
+    total = faces ** n
+    return total - remaining, total
+
+
+def calculate_exact_probability(n, faces=6, modulus=7, method='dp'):
+    """
+    Tính xác suất chính xác bằng phân số để tránh sai số làm tròn.
+    method: 'dp' (lặp từng bước với vector trạng thái số nguyên) hoặc 'power' (lũy thừa ma trận).
+    Trả về (xác suất dạng float, xác suất dạng Fraction) như trong notebook.
+    """
+    if n < 1:
+        raise ValueError("Số lần tung n phải lớn hơn hoặc bằng 1")
+    if method == 'dp':
+        for _, stopped, total in stopping_counts(faces, modulus, n):
+            pass
+    elif method == 'power':
+        stopped, total = stopping_count_at(n, faces, modulus)
+    else:
+        raise ValueError("method phải là 'dp' hoặc 'power'")
+    result_fraction = Fraction(stopped, total)
+    return float(result_fraction), result_fraction
+
+
+if __name__ == "__main__":
+    # Tính xác suất tung xúc xắc không quá n lần để tổng chia hết cho 7
+    for n, stopped, total in stopping_counts(max_n=10):
+        prob_fraction = Fraction(stopped, total)
+        print(f"Xác suất kết thúc không quá {n} lần tung: P(kết thúc <= {n}) = {float(prob_fraction):.6f} "
+              f"(phân số: {prob_fraction})")